@@ -7,6 +7,15 @@ SCREEN_HEIGHT = 720
 FPS = 60
 TITLE = "City Runner: Coast to Coast"
 
+# the simulation runs at a fixed tick rate no matter how fast we render
+SIMULATION_HZ = 60
+FIXED_TIMESTEP = 1000 / SIMULATION_HZ  # ms per simulation tick
+MAX_TICKS_PER_FRAME = 5  # catch-up limit before we start dropping time
+MAX_FRAME_TIME = 250  # ms, clamps huge stalls (window drag, tab switch)
+
+# mostly-static screens (menus) only present the parts that changed
+DIRTY_RECT_RENDERING = True
+
 # basic colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -49,6 +58,14 @@ PLAYER_FRICTION = 0.85  # makes movement feel smoother
 PLAYER_MAX_HEALTH = 5
 PLAYER_INVINCIBILITY_TIME = 2000  # ms after getting hit
 
+# player animations: name -> (sprite dir, file prefix, frame count, fallback color)
+PLAYER_ANIMATIONS = {
+    'idle': ('player/idle', 'idle_', 4, BLUE),
+    'run': ('player/run', 'run_', 6, BLUE),
+    'jump': ('player/jump', 'jump_', 3, BLUE),
+    'hurt': ('player/hurt', 'hurt_', 2, RED),
+}
+
 # camera follows the player
 CAMERA_SPEED = 5
 CAMERA_PLAYER_OFFSET_X = SCREEN_WIDTH // 3  # keep player left of center
@@ -58,6 +75,10 @@ CAMERA_LOOKAHEAD = 100
 GRAVITY = 0.8
 TERMINAL_VELOCITY = 15
 
+# broad-phase grid for platform collisions
+PLATFORM_GRID_CELL_SIZE = 256
+PLATFORM_QUERY_MARGIN = 32  # extra room around a mover so snapping can't miss a platform
+
 # how much each collectible is worth
 COLLECTIBLE_VALUES = {
     # Boston
@@ -73,6 +94,24 @@ COLLECTIBLE_VALUES = {
     'jazz_note': 25
 }
 
+# collectibles are all the same size
+COLLECTIBLE_SIZE = 24
+COLLECTIBLE_BOB_SPEED = 0.05  # radians per tick
+COLLECTIBLE_BOB_HEIGHT = 5  # pixels up and down
+
+# which collectibles and enemies show up in each city
+CITY_COLLECTIBLES = {
+    'boston': ['teacup', 'book'],
+    'nyc': ['pizza', 'metrocard', 'bagel'],
+    'chicago': ['deep_dish', 'hot_dog', 'jazz_note']
+}
+
+CITY_ENEMIES = {
+    'boston': ['cyclist', 'pigeon', 'taxi'],
+    'nyc': ['rat', 'taxi', 'vendor'],
+    'chicago': ['pigeon', 'flying_paper']
+}
+
 # enemy types and their stats
 ENEMY_TYPES = {
     'cyclist': {
@@ -132,6 +171,18 @@ LEVEL_WIDTH = 4000
 CHECKPOINT_POSITIONS = [1000, 2000, 3000]
 TILE_SIZE = 32
 
+# only the sectors around the camera get simulated and drawn
+SECTOR_WIDTH = 640
+ACTIVE_SECTOR_MARGIN = 1  # extra sectors each side of the screen that stay awake
+SECTOR_DRAW_MARGIN = 128  # wider than any entity, so nothing pops at the edges
+
+# enemy types with at least this many in a level update as one numpy batch
+# (below it the per-call overhead costs more than plain python). measured
+# with python -m src.enemy_bench: the kernels start winning at 20-32 enemies
+# depending on type, ~24 typical. the shipped levels have at most 8 of a
+# type, so they stay on the per-enemy path - batching is for crowded levels
+ENEMY_BATCH_MIN = 24
+
 # the three cities you run through
 CITIES = ['boston', 'nyc', 'chicago']
 CITY_NAMES = {
@@ -151,12 +202,61 @@ MUSIC_VOLUME = 0.7
 SFX_VOLUME = 0.8
 AMBIENT_VOLUME = 0.3
 
+# sounds are listed in a manifest and decoded on first play (or a city prefetch)
+AUDIO_MEMORY_BUDGET = 16 * 1024 * 1024  # bytes of decoded sfx/ambient kept around
+
+# sound effects share a fixed pool of reserved mixer channels
+SFX_VOICES = 8
+AMBIENT_CHANNELS = 2  # unreserved channels left over for ambient loops
+# higher priority wins a voice; min_interval is ms between repeats of one sound
+SFX_DEFAULTS = {'priority': 1, 'max_instances': 2, 'min_interval': 50}
+SFX_SETTINGS = {
+    'game_over': {'priority': 4, 'max_instances': 1, 'min_interval': 0},
+    'hurt': {'priority': 3, 'max_instances': 1},
+    'checkpoint': {'priority': 3, 'max_instances': 1},
+    'jump': {'priority': 2, 'max_instances': 1},
+    'stomp': {'priority': 2, 'max_instances': 3, 'min_interval': 30},
+    'collect': {'priority': 1, 'max_instances': 3, 'min_interval': 30},
+    'menu_select': {'priority': 3, 'max_instances': 1, 'min_interval': 0},
+    'taxi_horn': {'priority': 0, 'max_instances': 1, 'min_interval': 400},
+    'bike_bell': {'priority': 0, 'max_instances': 1, 'min_interval': 400},
+    'pigeon_coo': {'priority': 0, 'max_instances': 1, 'min_interval': 400},
+}
+
 # where all the assets are stored
 ASSETS_DIR = 'assets'
 SPRITES_DIR = f'{ASSETS_DIR}/sprites'
 BACKGROUNDS_DIR = f'{ASSETS_DIR}/backgrounds'
 AUDIO_DIR = f'{ASSETS_DIR}/audio'
 DATA_DIR = f'{ASSETS_DIR}/data'
+CACHE_DIR = f'{ASSETS_DIR}/cache'  # generated stuff, safe to delete
+LEVELS_DIR = f'{DATA_DIR}/levels'  # level layouts (json)
+AUDIO_MANIFEST = f'{DATA_DIR}/audio.json'  # sound names -> files under AUDIO_DIR
+LEVEL_CACHE_DIR = f'{CACHE_DIR}/levels'  # compiled copies of those
+BAKED_DIR = f'{ASSETS_DIR}/baked'  # output of python -m src.bake, also safe to delete
+ASSET_ARCHIVE = f'{BAKED_DIR}/assets.pak'  # python -m src.bake --archive, read before any image file
+
+# pixel memory the asset loader may hold before dropping least recently used
+# assets (the city being played is always kept)
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024
+ASSET_CACHE_BUDGET_WEB = 24 * 1024 * 1024  # browsers give us a lot less
+
+# sprites for each city get packed onto shared atlas pages
+SPRITE_ATLAS = True
+ATLAS_PAGE_SIZE = (1024, 1024)
+ATLAS_PADDING = 1  # transparent gap between sprites
+
+# rendered strings kept around for the HUD and menus
+TEXT_CACHE_SIZE = 256
+
+# menu-time asset warmup (only matters where there are no threads)
+WARMUP_FRAME_BUDGET = 4  # ms of generation per menu frame
+ASYNC_LOAD_WORKERS = 4  # threads decoding assets before a state is entered (desktop only)
+
+# frame profiler (F3 toggles the overlay in game)
+PROFILER_ENABLED = False
+PROFILER_WINDOW = 120  # frames kept for averages and percentiles
+PROFILER_BUDGET_MS = 1000 / 60  # where the graph draws its budget line
 
 # debug stuff - turn off for release
 DEBUG_MODE = True
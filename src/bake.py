@@ -0,0 +1,176 @@
+"""
+Offline asset baking.
+
+Runs every procedural generator the game would otherwise call at startup
+or level entry, at exactly the sizes the game asks for, and writes the
+results as PNGs plus a manifest under BAKED_DIR:
+
+    python -m src.bake
+    python -m src.bake --cities nyc chicago --out /tmp/baked
+    python -m src.bake --archive
+
+The AssetLoader prefers real art files, then baked files, and only runs
+a generator when neither exists. Run this before packaging the web
+build so the browser never has to draw placeholder art itself.
+
+--archive also packs everything the cities load, real art included, into
+one memory-mapped archive (see asset_archive) that the loader reads
+before touching any image file.
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from config import CITIES, BAKED_DIR, ASSET_ARCHIVE, SPRITES_DIR, BACKGROUNDS_DIR, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.asset_archive import ArchiveWriter, AssetArchive
+from src.utils.asset_loader import AssetLoader, animation_frame_names
+from src.utils.asset_manifest import full_asset_manifest
+from src.utils.baked_assets import BakedAssets, baked_key
+from src.levels.level_data import load_level_data
+
+
+def _file_name(name, size, frame=None):
+    width, height = size
+    suffix = f"_{frame}" if frame is not None else ''
+    return f"{os.path.splitext(name)[0]}_{width}x{height}{suffix}.png"
+
+
+class Baker:
+    """Writes generated surfaces into a bake directory and records them."""
+
+    def __init__(self, directory=BAKED_DIR, archive=None):
+        """
+        Args:
+            directory: Output directory for the PNGs and manifest
+            archive: Path to also write a packed archive to, or None
+        """
+        self.baked = BakedAssets(directory)
+        # never read an old bake or archive back in while making a new one
+        self.loader = AssetLoader(baked=BakedAssets(directory), archive=AssetArchive())
+
+        self.archive_path = archive
+        self.archive = ArchiveWriter() if archive else None
+
+    def save(self, key, relative, surface, sources=()):
+        path = os.path.join(self.baked.directory, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pygame.image.save(surface, path)
+        self.baked.files[key] = relative.replace(os.sep, '/')
+        self.pack(key, surface, sources)
+
+    def pack(self, key, surface, sources=()):
+        """
+        Add a surface to the archive, if we're writing one.
+
+        Args:
+            sources: Art files the surface was loaded from, or that would
+                     replace it if someone added them
+        """
+        if self.archive is not None:
+            self.archive.add(key, surface, sources)
+
+    def bake_entry(self, entry):
+        """Bake one asset manifest entry. Entries backed by real art files only go in the archive."""
+        kind, path, size = entry['kind'], entry['path'], entry['size']
+
+        if kind == 'background':
+            art = os.path.join(BACKGROUNDS_DIR, path)
+            if os.path.exists(art):
+                self.pack(baked_key('background', path, size), self.loader.load_background(path, size), [art])
+                return
+            # every layer of a city uses the same generated image
+            city = path.split('/')[0]
+            key = baked_key('background', city, size)
+            if key not in self.baked:
+                surface = self.loader.load_background(path, size)
+                self.save(key, os.path.join('background', _file_name(city, size)), surface)
+
+        elif kind == 'sprite':
+            art = os.path.join(SPRITES_DIR, path)
+            surface = self.loader.load_sprite(path, size)
+            if os.path.exists(art):
+                self.pack(baked_key('sprite', path, size), surface, [art])
+                return
+            self.save(baked_key('sprite', path, size), os.path.join('sprite', _file_name(path, size)), surface, [art])
+
+        elif kind == 'animation':
+            directory, prefix = entry['path'], entry['prefix']
+            frames = self.loader.load_animation_frames(directory, prefix, entry['frames'], size, entry['color'])
+            name = f"{directory}/{prefix}"
+            for i, frame in enumerate(frames):
+                art = [os.path.join(SPRITES_DIR, directory, file_name) for file_name in animation_frame_names(prefix, i)]
+                if any(os.path.exists(path) for path in art):
+                    self.pack(baked_key('animation', name, size, i), frame, art)
+                    continue
+                self.save(baked_key('animation', name, size, i),
+                          os.path.join('animation', _file_name(name, size, i)), frame, art)
+
+    def bake_boston_platforms(self):
+        """Bake Boston's drawn platforms at every size its layout uses."""
+        from src.levels.boston import BostonLevel
+
+        seen = set()
+        for platform_type, x, y, width, height in load_level_data('boston').iter_platforms():
+            name = f"platforms/boston/{platform_type}"
+            size = (width, height)
+            if platform_type == 'ground' or (name, size) in seen:
+                continue
+            seen.add((name, size))
+            surface = BostonLevel.render_platform(platform_type, width, height)
+            self.save(baked_key('generated', name, size), os.path.join('generated', _file_name(name, size)), surface)
+
+    def finish(self):
+        self.baked.save()
+        if self.archive is not None:
+            self.archive.write(self.archive_path)
+        return self.baked
+
+
+def bake(cities=CITIES, directory=BAKED_DIR, archive=None):
+    """
+    Bake every generated asset for the given cities.
+
+    Args:
+        cities: City keys to bake
+        directory: Output directory
+        archive: Path to also write a packed archive of everything to, or None
+
+    Returns:
+        BakedAssets describing what was written
+    """
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    baker = Baker(directory, archive)
+    for entry in full_asset_manifest(cities):
+        baker.bake_entry(entry)
+    if 'boston' in cities:
+        baker.bake_boston_platforms()
+    return baker.finish()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pre-render generated sprites and backgrounds to PNG files.')
+    parser.add_argument('--cities', nargs='+', choices=CITIES, default=CITIES)
+    parser.add_argument('--out', default=BAKED_DIR, help=f'output directory (default {BAKED_DIR})')
+    parser.add_argument('--archive', nargs='?', const=ASSET_ARCHIVE, default=None,
+                        help=f'also pack everything, real art included, into one archive (default {ASSET_ARCHIVE})')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    baked = bake(args.cities, args.out, args.archive)
+    elapsed = time.perf_counter() - start
+    print(f"Baked {len(baked)} images into {args.out} in {elapsed:.1f}s")
+    if args.archive:
+        size = os.path.getsize(args.archive) / (1024 * 1024)
+        print(f"Packed {len(AssetArchive.open(args.archive))} images into {args.archive} ({size:.1f} MB)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
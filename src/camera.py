@@ -15,8 +15,13 @@ class Camera:
         self.level_width = level_width
         self.target_offset_x = 0
 
+        # Offset at the start of the current tick, for interpolated drawing
+        self.prev_offset_x = 0
+
     def update(self, player):
         """Update camera position to follow player."""
+        self.prev_offset_x = self.offset_x
+
         # Calculate ideal camera position (player at 1/3 from left)
         ideal_offset = player.rect.x - CAMERA_PLAYER_OFFSET_X
 
@@ -48,6 +53,7 @@ class Camera:
         """Apply camera offset to a rectangle."""
         return pygame.Rect(rect.x - self.offset_x, rect.y - self.offset_y, rect.width, rect.height)
 
-    def get_offset(self):
-        """Get current camera offset."""
-        return int(self.offset_x), int(self.offset_y)
+    def get_offset(self, alpha=1.0):
+        """Get camera offset, blended between the last two ticks."""
+        offset_x = self.prev_offset_x + (self.offset_x - self.prev_offset_x) * alpha
+        return int(offset_x), int(self.offset_y)
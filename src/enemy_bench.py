@@ -0,0 +1,146 @@
+"""
+Enemy batching crossover benchmark.
+
+Times one fixed tick of N enemies of each batchable type both ways: the
+per-enemy update() loop that Level.update() runs for small populations
+(sector relocation included), and the type's EnemyGroup kernel. The
+crossover is the smallest N from which the kernel stays faster, which is
+what ENEMY_BATCH_MIN in config.py should be set to.
+
+    python -m src.enemy_bench
+    python -m src.enemy_bench --types rat pigeon --sizes 8 16 24 32 --ticks 400
+
+Every run builds fresh enemies, so types that deactivate themselves (paper
+blowing off the level) are still timed with a full population.
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+
+from config import ENEMY_BATCH_MIN, FIXED_TIMESTEP, LEVEL_WIDTH, SCREEN_HEIGHT, SECTOR_WIDTH
+from src.entities.enemies.cyclist import Cyclist
+from src.entities.enemies.flying_paper import FlyingPaper
+from src.entities.enemies.groups import ENEMY_GROUPS, platform_array
+from src.entities.enemies.pigeon import Pigeon
+from src.entities.enemies.rat import Rat
+from src.entities.enemies.vendor import Vendor
+from src.utils.sector_grid import SectorGrid
+from src.utils.spatial_hash import SpatialHash
+
+# How to make one enemy of each batched type at (x, y)
+MAKERS = {
+    'cyclist': lambda x, y, rng: Cyclist(x, y, patrol_distance=200),
+    'vendor': lambda x, y, rng: Vendor(x, y, patrol_distance=150),
+    'rat': lambda x, y, rng: Rat(x, y, rng=rng),
+    'pigeon': lambda x, y, rng: Pigeon(x, y, flight_height=80),
+    'flying_paper': lambda x, y, rng: FlyingPaper(x, y, rng=rng),
+}
+
+DEFAULT_SIZES = (4, 8, 12, 16, 20, 24, 32, 48, 64)
+
+
+def make_platforms(seed=5):
+    """A ground strip across the level plus ledges, like the shipped layouts."""
+    rng = random.Random(seed)
+    platforms = [pygame.Rect(0, SCREEN_HEIGHT - 100, LEVEL_WIDTH, 100)]
+    for x in range(0, LEVEL_WIDTH, 200):
+        platforms.append(pygame.Rect(x, rng.randint(420, 600), rng.randint(60, 160), 15))
+    return platforms
+
+
+def make_enemies(enemy_type, count, seed=9):
+    """count enemies of one type spread over the level, same spots every call."""
+    positions = random.Random(seed)
+    rng = random.Random(seed)
+    return [MAKERS[enemy_type](positions.randint(100, LEVEL_WIDTH - 200), positions.randint(300, 600), rng)
+            for _ in range(count)]
+
+
+def time_scalar(enemies, platform_index, ticks):
+    """Microseconds per tick for Level.update()'s one-at-a-time path."""
+    sectors = SectorGrid(enemies)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for enemy in enemies:
+            if enemy.active:
+                enemy.store_previous_position()
+                enemy.update(FIXED_TIMESTEP, platform_index)
+                sectors.relocate(enemy)
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def time_batched(enemies, platforms, ticks):
+    """Microseconds per tick for the type's EnemyGroup kernel, every sector awake."""
+    group = ENEMY_GROUPS[enemies[0].enemy_type](enemies, SECTOR_WIDTH)
+    last_sector = LEVEL_WIDTH // SECTOR_WIDTH
+    start = time.perf_counter()
+    for _ in range(ticks):
+        group.update(FIXED_TIMESTEP, group.awake(0, last_sector), platforms)
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def run_crossover(types=tuple(MAKERS), sizes=DEFAULT_SIZES, ticks=200, repeats=5):
+    """
+    Time both update paths for each type and population size.
+
+    Args:
+        types: Enemy types to measure
+        sizes: Population sizes to try, ascending
+        ticks: Fixed ticks per timed run
+        repeats: Runs per measurement (the fastest is kept)
+
+    Returns:
+        Dict of type -> {'timings': [(size, scalar_us, batched_us)], 'crossover': size or None}
+    """
+    platforms = make_platforms()
+    platform_index = SpatialHash(platforms)
+    packed = platform_array(platforms)
+
+    results = {}
+    for enemy_type in types:
+        timings = []
+        for size in sizes:
+            scalar = min(time_scalar(make_enemies(enemy_type, size), platform_index, ticks)
+                         for _ in range(repeats))
+            batched = min(time_batched(make_enemies(enemy_type, size), packed, ticks)
+                          for _ in range(repeats))
+            timings.append((size, scalar, batched))
+
+        # smallest size from which batching never loses again
+        crossover = None
+        for size, scalar, batched in reversed(timings):
+            if batched > scalar:
+                break
+            crossover = size
+        results[enemy_type] = {'timings': timings, 'crossover': crossover}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find where batched enemy updates beat per-enemy ones.')
+    parser.add_argument('--types', nargs='+', choices=sorted(MAKERS), default=list(MAKERS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results = run_crossover(args.types, sorted(args.sizes), args.ticks, args.repeats)
+
+    print(f"microseconds per tick, best of {args.repeats} x {args.ticks} ticks")
+    for enemy_type, result in results.items():
+        print(f"  {enemy_type}")
+        print("       n   per-enemy   batched")
+        for size, scalar, batched in result['timings']:
+            print(f"    {size:4d}   {scalar:9.1f} {batched:9.1f}")
+        crossover = result['crossover']
+        print(f"    crossover: {crossover if crossover is not None else 'not reached'}")
+    print(f"ENEMY_BATCH_MIN is {ENEMY_BATCH_MIN}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,5 +1,7 @@
 # collectible items you pick up for points
 
+import math
+import numpy as np
 import pygame
 from src.entities.entity import Entity
 from src.utils.asset_loader import asset_loader
@@ -8,8 +10,12 @@ from config import *
 
 class Collectible(Entity):
 
+    # set when a CollectibleField owns this item's state (see below)
+    field = None
+    index = -1
+
     def __init__(self, x, y, collectible_type):
-        super().__init__(x, y, 24, 24)  # smaller hitbox
+        super().__init__(x, y, COLLECTIBLE_SIZE, COLLECTIBLE_SIZE)  # smaller hitbox
 
         self.collectible_type = collectible_type
         self.collected = False
@@ -17,7 +23,7 @@ class Collectible(Entity):
 
         # bobbing animation
         self.bob_offset = 0
-        self.bob_speed = 0.05
+        self.bob_speed = COLLECTIBLE_BOB_SPEED
         self.base_y = y
 
         self.load_sprite()
@@ -53,37 +59,92 @@ class Collectible(Entity):
 
         # make it bob up and down
         self.bob_offset += self.bob_speed
-        import math
-        self.y = self.base_y + math.sin(self.bob_offset) * 5
+        self.y = self.base_y + math.sin(self.bob_offset) * COLLECTIBLE_BOB_HEIGHT
         self.rect.y = int(self.y)
 
     def collect(self):
+        if self.field is not None:
+            return self.field.collect(self.index)
         self.collected = True
         self.active = False
         return self.value
 
-    def draw(self, screen, camera_offset=0):
+    def draw(self, screen, camera_offset=0, alpha=1.0):
         if not self.collected:
-            super().draw(screen, camera_offset)
-
-
-# helper function to spawn a bunch of collectibles
-def create_city_collectibles(city, x, y, count=10):
-    collectibles = []
-
-    city_types = {
-        'boston': ['teacup', 'book'],
-        'nyc': ['pizza', 'metrocard', 'bagel'],
-        'chicago': ['deep_dish', 'hot_dog', 'jazz_note']
-    }
-
-    types = city_types.get(city, ['teacup'])
+            super().draw(screen, camera_offset, alpha)
+
+
+class CollectibleField:
+    # all of a level's collectibles as numpy arrays, so bobbing and pickup
+    # are a handful of array ops per tick instead of a python loop.
+    # the Collectible objects stay around as views for drawing - sync_view()
+    # copies an item's current state onto its object right before it's drawn
+
+    def __init__(self, collectibles, sector_width=SECTOR_WIDTH):
+        self.views = list(collectibles)
+        self.sector_width = sector_width
+
+        views = self.views
+        self.x = np.array([c.rect.x for c in views], dtype=np.int32)
+        self.width = np.array([c.width for c in views], dtype=np.int32)
+        self.height = np.array([c.height for c in views], dtype=np.int32)
+        self.base_y = np.array([c.base_y for c in views], dtype=np.float64)
+        self.y = np.array([c.y for c in views], dtype=np.float64)
+        self.rect_y = np.array([c.rect.y for c in views], dtype=np.int32)
+        self.prev_y = np.array([c.prev_y for c in views], dtype=np.int32)
+        self.phase = np.array([c.bob_offset for c in views], dtype=np.float64)
+        self.speed = np.array([c.bob_speed for c in views], dtype=np.float64)
+        self.values = np.array([c.value for c in views], dtype=np.int32)
+        self.collected = np.array([c.collected for c in views], dtype=bool)
+
+        # collectibles never move sideways, so their sectors are fixed
+        self.sector = self.x // sector_width
+
+        for i, view in enumerate(views):
+            view.field = self
+            view.index = i
+
+    def __len__(self):
+        return len(self.views)
+
+    def update(self, first_sector=None, last_sector=None):
+        # bob every uncollected item (only sectors first..last if given)
+        awake = ~self.collected
+        if first_sector is not None:
+            awake &= (self.sector >= first_sector) & (self.sector <= last_sector)
+        idx = np.flatnonzero(awake)
+        if not len(idx):
+            return
 
-    import random
-    for i in range(count):
-        ctype = random.choice(types)
-        offset_x = x + i * 40 + random.randint(-10, 10)
-        offset_y = y + random.randint(-20, 20)
-        collectibles.append(Collectible(offset_x, offset_y, ctype))
+        self.prev_y[idx] = self.rect_y[idx]
+        phase = self.phase[idx] + self.speed[idx]
+        self.phase[idx] = phase
+        y = self.base_y[idx] + np.sin(phase) * COLLECTIBLE_BOB_HEIGHT
+        self.y[idx] = y
+        self.rect_y[idx] = y.astype(np.int32)  # truncates like int()
+
+    def overlapping(self, rect):
+        # indices of uncollected items whose hitbox overlaps rect (colliderect rules)
+        if not len(self.views) or rect.width <= 0 or rect.height <= 0:
+            return []
+        hit = ((self.x < rect.right) & (self.x + self.width > rect.left)
+               & (self.rect_y < rect.bottom) & (self.rect_y + self.height > rect.top)
+               & ~self.collected)
+        return np.flatnonzero(hit).tolist()
+
+    def collect(self, index):
+        self.collected[index] = True
+        view = self.views[index]
+        view.collected = True
+        view.active = False
+        return int(self.values[index])
+
+    def sync_view(self, index):
+        # copy the array state for one item onto its Collectible
+        view = self.views[index]
+        view.bob_offset = float(self.phase[index])
+        view.y = float(self.y[index])
+        view.rect.y = int(self.rect_y[index])
+        view.prev_y = int(self.prev_y[index])
+        return view
 
-    return collectibles
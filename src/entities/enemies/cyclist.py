@@ -29,7 +29,7 @@ class Cyclist(Enemy):
 
         # Simple ground check
         if platforms:
-            for platform in platforms:
+            for platform in self.nearby_platforms(platforms):
                 if self.rect.colliderect(platform) and self.vel_y > 0:
                     self.rect.bottom = platform.top
                     self.y = self.rect.y
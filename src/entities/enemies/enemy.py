@@ -8,6 +8,10 @@ from config import *
 
 class Enemy(Entity):
 
+    # set when an EnemyGroup runs this enemy's updates (see groups.py)
+    group = None
+    index = -1
+
     def __init__(self, x, y, enemy_type):
         config = ENEMY_TYPES.get(enemy_type, {})
         width = config.get('width', 32)
@@ -53,6 +57,8 @@ class Enemy(Entity):
         self.health -= amount
         if self.health <= 0:
             self.active = False
+            if self.group is not None:
+                self.group.active[self.index] = False
 
     def is_defeated(self):
         return not self.active
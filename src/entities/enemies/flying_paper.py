@@ -11,10 +11,10 @@ from config import *
 class FlyingPaper(Enemy):
     """Paper blown by wind in diagonal patterns."""
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=random):
         super().__init__(x, y, 'flying_paper')
-        self.wind_strength = random.uniform(0.5, 1.5)
-        self.vertical_speed = random.uniform(-1, 1)
+        self.wind_strength = rng.uniform(0.5, 1.5)
+        self.vertical_speed = rng.uniform(-1, 1)
         self.wobble = 0
 
     def update(self, dt, platforms=None):
@@ -0,0 +1,292 @@
+"""
+Batched enemy updates.
+
+Every enemy of one type lives in an EnemyGroup of NumPy arrays and gets
+advanced by a single kernel per tick, so the cost of a crowded level is
+a few array ops rather than a Python call per enemy. The kernels follow
+the matching Enemy.update() methods step for step.
+
+The Enemy objects stay around as views for drawing and player
+collisions: sync_view() copies one enemy's array state onto its object
+right before it is needed.
+"""
+
+import numpy as np
+from config import *
+
+
+def platform_array(platforms):
+    """Pack platform rects into an (n, 4) int array of x, y, width, height."""
+    return np.array([(p.x, p.y, p.width, p.height) for p in platforms], dtype=np.int32).reshape(-1, 4)
+
+
+class EnemyGroup:
+    """Array state shared by every batched enemy type."""
+
+    def __init__(self, enemies, sector_width=SECTOR_WIDTH):
+        self.views = list(enemies)
+        self.sector_width = sector_width
+
+        views = self.views
+        self.x = np.array([e.x for e in views], dtype=np.float64)
+        self.y = np.array([e.y for e in views], dtype=np.float64)
+        self.rect_x = np.array([e.rect.x for e in views], dtype=np.int32)
+        self.rect_y = np.array([e.rect.y for e in views], dtype=np.int32)
+        self.prev_x = np.array([e.prev_x for e in views], dtype=np.int32)
+        self.prev_y = np.array([e.prev_y for e in views], dtype=np.int32)
+        self.width = np.array([e.width for e in views], dtype=np.int32)
+        self.height = np.array([e.height for e in views], dtype=np.int32)
+        self.vel_x = np.array([e.vel_x for e in views], dtype=np.float64)
+        self.vel_y = np.array([e.vel_y for e in views], dtype=np.float64)
+        self.speed = np.array([e.speed for e in views], dtype=np.float64)
+        self.direction = np.array([e.direction for e in views], dtype=np.int32)
+        self.facing_right = np.array([e.facing_right for e in views], dtype=bool)
+        self.left_bound = np.array([e.patrol_left_bound for e in views], dtype=np.float64)
+        self.right_bound = np.array([e.patrol_right_bound for e in views], dtype=np.float64)
+        self.active = np.array([e.active for e in views], dtype=bool)
+
+        for i, view in enumerate(views):
+            view.group = self
+            view.index = i
+
+    def __len__(self):
+        return len(self.views)
+
+    def sectors(self):
+        """Sector index of every enemy, from its current position."""
+        return self.rect_x // self.sector_width
+
+    def awake(self, first_sector=None, last_sector=None):
+        """Indices of active enemies, limited to sectors first..last if given."""
+        mask = self.active.copy()
+        if first_sector is not None:
+            sectors = self.sectors()
+            mask &= (sectors >= first_sector) & (sectors <= last_sector)
+        return np.flatnonzero(mask)
+
+    def between(self, left, right):
+        """Indices of active enemies whose sector overlaps the x range left..right."""
+        return self.awake(int(left) // self.sector_width, int(right) // self.sector_width)
+
+    def overlapping(self, rect):
+        """Indices of active enemies whose rect overlaps the given one (colliderect rules)."""
+        if rect.width <= 0 or rect.height <= 0:
+            return np.empty(0, dtype=np.intp)
+        hit = ((self.rect_x < rect.right) & (self.rect_x + self.width > rect.left)
+               & (self.rect_y < rect.bottom) & (self.rect_y + self.height > rect.top)
+               & self.active)
+        return np.flatnonzero(hit)
+
+    def update(self, dt, idx, platforms):
+        """
+        Advance the enemies at idx by one tick.
+
+        Args:
+            dt: Tick length in milliseconds
+            idx: Index array of the enemies to update
+            platforms: (n, 4) platform array from platform_array()
+        """
+        if not len(idx):
+            return
+        self.prev_x[idx] = self.rect_x[idx]
+        self.prev_y[idx] = self.rect_y[idx]
+        self.step(dt, idx, platforms)
+
+    def step(self, dt, idx, platforms):
+        """Type-specific movement. Override in subclasses."""
+        pass
+
+    def patrol(self, idx):
+        """Enemy.patrol() for every enemy at idx."""
+        direction = self.direction[idx]
+        x = self.x[idx]
+        vel_x = self.speed[idx] * direction
+
+        # turn around at bounds (the move below still uses the old direction)
+        turn_left = (direction > 0) & (x >= self.right_bound[idx])
+        turn_right = (direction < 0) & (x <= self.left_bound[idx])
+        direction[turn_left] = -1
+        direction[turn_right] = 1
+        self.direction[idx] = direction
+        facing = self.facing_right[idx]
+        facing[turn_left] = False
+        facing[turn_right] = True
+        self.facing_right[idx] = facing
+
+        x = x + vel_x
+        self.vel_x[idx] = vel_x
+        self.x[idx] = x
+        self.rect_x[idx] = x.astype(np.int32)  # truncates like int()
+
+    def fall(self, idx, platforms):
+        """Gravity plus the land-on-the-first-platform check the walkers share."""
+        vel_y = np.minimum(self.vel_y[idx] + GRAVITY, TERMINAL_VELOCITY)
+        y = self.y[idx] + vel_y
+        rect_y = y.astype(np.int32)
+        rect_x = self.rect_x[idx]
+        width = self.width[idx]
+        height = self.height[idx]
+
+        if len(platforms):
+            # only platforms overlapping the x span of these enemies matter
+            span = ((platforms[:, 0] < (rect_x + width).max())
+                    & (platforms[:, 0] + platforms[:, 2] > rect_x.min()))
+            candidates = platforms[span]
+            px, py, pw, ph = (candidates[:, k] for k in range(4))
+
+            # colliderect for every enemy/platform pair, in platform order
+            overlap = ((rect_x[:, None] < (px + pw)[None, :]) & ((rect_x + width)[:, None] > px[None, :])
+                       & (rect_y[:, None] < (py + ph)[None, :]) & ((rect_y + height)[:, None] > py[None, :]))
+            landed = overlap.any(axis=1) & (vel_y > 0)
+            if landed.any():
+                first = overlap.argmax(axis=1)[landed]
+                rect_y[landed] = py[first] - height[landed]
+        else:
+            # default ground
+            landed = (rect_y + height >= SCREEN_HEIGHT - 100)
+            rect_y[landed] = SCREEN_HEIGHT - 100 - height[landed]
+
+        y[landed] = rect_y[landed]
+        vel_y[landed] = 0
+        self.vel_y[idx] = vel_y
+        self.y[idx] = y
+        self.rect_y[idx] = rect_y
+
+    def deactivate(self, idx):
+        """Switch off the enemies at idx, arrays and views both."""
+        self.active[idx] = False
+        for i in np.atleast_1d(idx).tolist():
+            self.views[i].active = False
+
+    def sync_view(self, index):
+        """Copy one enemy's array state onto its Enemy object and return it."""
+        view = self.views[index]
+        view.x = float(self.x[index])
+        view.y = float(self.y[index])
+        view.rect.x = int(self.rect_x[index])
+        view.rect.y = int(self.rect_y[index])
+        view.prev_x = int(self.prev_x[index])
+        view.prev_y = int(self.prev_y[index])
+        view.vel_x = float(self.vel_x[index])
+        view.vel_y = float(self.vel_y[index])
+        view.direction = int(self.direction[index])
+        view.facing_right = bool(self.facing_right[index])
+        return view
+
+
+class WalkerGroup(EnemyGroup):
+    """Cyclists and vendors: patrol back and forth, fall onto platforms."""
+
+    def step(self, dt, idx, platforms):
+        self.patrol(idx)
+        self.fall(idx, platforms)
+
+
+class RatGroup(EnemyGroup):
+    """Rats: random turns every second or three, then walk and fall."""
+
+    def __init__(self, enemies, sector_width=SECTOR_WIDTH):
+        super().__init__(enemies, sector_width)
+        self.turn_timer = np.array([e.direction_change_timer for e in self.views], dtype=np.float64)
+        self.turn_interval = np.array([e.direction_change_interval for e in self.views], dtype=np.float64)
+
+    def step(self, dt, idx, platforms):
+        timer = self.turn_timer[idx] + dt
+        self.turn_timer[idx] = timer
+
+        # the few rats due a turn roll the level's RNG in index order
+        for i in idx[timer >= self.turn_interval[idx]].tolist():
+            rng = self.views[i].rng
+            self.turn_timer[i] = 0
+            self.turn_interval[i] = rng.randint(1000, 3000)
+            if rng.random() < 0.5:
+                self.direction[i] *= -1
+                self.facing_right[i] = self.direction[i] > 0
+
+        vel_x = self.speed[idx] * self.direction[idx]
+        x = self.x[idx] + vel_x
+        self.vel_x[idx] = vel_x
+        self.x[idx] = x
+        self.rect_x[idx] = x.astype(np.int32)
+
+        self.fall(idx, platforms)
+
+    def sync_view(self, index):
+        view = super().sync_view(index)
+        view.direction_change_timer = float(self.turn_timer[index])
+        view.direction_change_interval = int(self.turn_interval[index])
+        return view
+
+
+class PigeonGroup(EnemyGroup):
+    """Pigeons: patrol sideways while bobbing on a sine wave."""
+
+    def __init__(self, enemies, sector_width=SECTOR_WIDTH):
+        super().__init__(enemies, sector_width)
+        self.base_y = np.array([e.base_y for e in self.views], dtype=np.float64)
+        self.flight_height = np.array([e.flight_height for e in self.views], dtype=np.float64)
+        self.wave = np.array([e.wave_offset for e in self.views], dtype=np.float64)
+        self.wave_speed = np.array([e.wave_speed for e in self.views], dtype=np.float64)
+
+    def step(self, dt, idx, platforms):
+        self.patrol(idx)
+
+        wave = self.wave[idx] + self.wave_speed[idx]
+        self.wave[idx] = wave
+        y = self.base_y[idx] + np.sin(wave) * self.flight_height[idx]
+        self.y[idx] = y
+        self.rect_y[idx] = y.astype(np.int32)
+
+    def sync_view(self, index):
+        view = super().sync_view(index)
+        view.wave_offset = float(self.wave[index])
+        return view
+
+
+class PaperGroup(EnemyGroup):
+    """Flying paper: drifts with the wind, wobbles, bounces off height limits."""
+
+    def __init__(self, enemies, sector_width=SECTOR_WIDTH):
+        super().__init__(enemies, sector_width)
+        self.wind = np.array([e.wind_strength for e in self.views], dtype=np.float64)
+        self.vertical_speed = np.array([e.vertical_speed for e in self.views], dtype=np.float64)
+        self.wobble = np.array([e.wobble for e in self.views], dtype=np.float64)
+
+    def step(self, dt, idx, platforms):
+        x = self.x[idx] + self.speed[idx] * self.wind[idx] * self.direction[idx]
+
+        wobble = self.wobble[idx] + 0.1
+        self.wobble[idx] = wobble
+        vertical_speed = self.vertical_speed[idx]
+        y = self.y[idx] + (np.sin(wobble) * 0.5 + vertical_speed)
+
+        # keep in reasonable bounds
+        vertical_speed = np.where(y < 100, np.abs(vertical_speed),
+                                  np.where(y > SCREEN_HEIGHT - 200, -np.abs(vertical_speed), vertical_speed))
+        self.vertical_speed[idx] = vertical_speed
+
+        self.x[idx] = x
+        self.y[idx] = y
+        self.rect_x[idx] = x.astype(np.int32)
+        self.rect_y[idx] = y.astype(np.int32)
+
+        # gone if blown too far off the level
+        gone = (x < -100) | (x > LEVEL_WIDTH + 100)
+        if gone.any():
+            self.deactivate(idx[gone])
+
+    def sync_view(self, index):
+        view = super().sync_view(index)
+        view.wobble = float(self.wobble[index])
+        view.vertical_speed = float(self.vertical_speed[index])
+        return view
+
+
+# Enemy types that update in batches, and the group that runs them
+ENEMY_GROUPS = {
+    'cyclist': WalkerGroup,
+    'vendor': WalkerGroup,
+    'rat': RatGroup,
+    'pigeon': PigeonGroup,
+    'flying_paper': PaperGroup,
+}
@@ -10,10 +10,11 @@ from config import *
 class Rat(Enemy):
     """Rat that scurries with unpredictable turns."""
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=random):
         super().__init__(x, y, 'rat')
+        self.rng = rng  # the level's RNG, so runs can be replayed
         self.direction_change_timer = 0
-        self.direction_change_interval = random.randint(1000, 3000)
+        self.direction_change_interval = rng.randint(1000, 3000)
 
     def update(self, dt, platforms=None):
         """Update rat erratic movement."""
@@ -24,9 +25,9 @@ class Rat(Enemy):
         self.direction_change_timer += dt
         if self.direction_change_timer >= self.direction_change_interval:
             self.direction_change_timer = 0
-            self.direction_change_interval = random.randint(1000, 3000)
+            self.direction_change_interval = self.rng.randint(1000, 3000)
             # Randomly change direction
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 self.direction *= -1
                 self.facing_right = self.direction > 0
 
@@ -42,7 +43,7 @@ class Rat(Enemy):
 
         # Ground check
         if platforms:
-            for platform in platforms:
+            for platform in self.nearby_platforms(platforms):
                 if self.rect.colliderect(platform) and self.vel_y > 0:
                     self.rect.bottom = platform.top
                     self.y = self.rect.y
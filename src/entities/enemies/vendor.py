@@ -30,7 +30,7 @@ class Vendor(Enemy):
 
         # Ground check
         if platforms:
-            for platform in platforms:
+            for platform in self.nearby_platforms(platforms):
                 if self.rect.colliderect(platform) and self.vel_y > 0:
                     self.rect.bottom = platform.top
                     self.y = self.rect.y
@@ -4,6 +4,8 @@ Provides common functionality for player, enemies, and collectibles.
 """
 
 import pygame
+from src.utils.asset_loader import asset_loader
+from src.utils.profiler import profiler
 from config import *
 
 
@@ -18,6 +20,10 @@ class Entity(pygame.sprite.Sprite):
         self.width = width
         self.height = height
 
+        # Position at the start of the current tick, for interpolated drawing
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+
         # Physics
         self.vel_x = 0
         self.vel_y = 0
@@ -35,33 +41,64 @@ class Entity(pygame.sprite.Sprite):
         """Update entity state. Override in subclasses."""
         pass
 
-    def draw(self, screen, camera_offset=0):
+    def store_previous_position(self):
+        """Remember where we were before this tick moves us."""
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+
+    def get_draw_position(self, alpha=1.0):
+        """Position blended between the last two ticks (alpha 0..1)."""
+        x = self.prev_x + (self.rect.x - self.prev_x) * alpha
+        y = self.prev_y + (self.rect.y - self.prev_y) * alpha
+        return round(x), round(y)
+
+    def draw(self, screen, camera_offset=0, alpha=1.0):
         """Draw entity to screen with camera offset."""
         if not self.visible or self.image is None:
             return
 
         # Draw sprite
-        screen_x = self.rect.x - camera_offset
-        screen_y = self.rect.y
+        draw_x, draw_y = self.get_draw_position(alpha)
+        screen_x = draw_x - camera_offset
+        screen_y = draw_y
 
-        # Flip sprite if facing left
+        # Use the pre-flipped sprite if facing left
         if self.facing_right:
             screen.blit(self.image, (screen_x, screen_y))
         else:
-            flipped = pygame.transform.flip(self.image, True, False)
-            screen.blit(flipped, (screen_x, screen_y))
+            screen.blit(asset_loader.get_mirrored(self.image), (screen_x, screen_y))
+        profiler.count('draw_calls')
 
         # Debug hitbox
         if DEBUG_MODE and SHOW_HITBOXES:
             debug_rect = pygame.Rect(screen_x, screen_y, self.width, self.height)
             pygame.draw.rect(screen, RED, debug_rect, 2)
 
+    def submit(self, queue, alpha=1.0, layer='entities'):
+        """Queue the sprite on a RenderQueue instead of drawing it right away."""
+        if not self.visible or self.image is None:
+            return
+
+        draw_x, draw_y = self.get_draw_position(alpha)
+        image = self.image if self.facing_right else asset_loader.get_mirrored(self.image)
+        queue.submit(image, draw_x, draw_y, layer)
+
+        if DEBUG_MODE and SHOW_HITBOXES:
+            queue.submit_hitbox(draw_x, draw_y, self.width, self.height)
+
     def apply_gravity(self, gravity=GRAVITY):
         """Apply gravity to entity."""
         self.vel_y += gravity
         if self.vel_y > TERMINAL_VELOCITY:
             self.vel_y = TERMINAL_VELOCITY
 
+    def nearby_platforms(self, platforms):
+        """Platforms worth testing against, using the level's grid index when given one."""
+        if hasattr(platforms, 'query'):
+            margin = PLATFORM_QUERY_MARGIN * 2
+            return platforms.query(self.rect.inflate(margin, margin))
+        return platforms
+
     def check_collision(self, other):
         """Check if this entity collides with another."""
         return self.rect.colliderect(other.rect)
@@ -2,19 +2,36 @@
 Main Game class with state management.
 """
 
+import os
 import pygame
 import asyncio
 from config import *
-from src.states.menu import MainMenu
-from src.states.city_select import CitySelect
-from src.states.gameplay import Gameplay
-from src.states.landmark import LandmarkCelebration
+from src.utils.asset_warmup import AssetWarmup
+from src.utils.async_loader import load_assets
+from src.utils.lazy_import import import_object
+from src.utils.profiler import profiler
+from src.utils.text_cache import TextWidget
+
+# State classes by name. Each is imported and built on its first use, so
+# startup only pays for the main menu.
+STATE_FACTORIES = {
+    'menu': 'src.states.menu:MainMenu',
+    'city_select': 'src.states.city_select:CitySelect',
+    'gameplay': 'src.states.gameplay:Gameplay',
+    'landmark': 'src.states.landmark:LandmarkCelebration',
+}
 
 
 class Game:
     """Main game manager with state machine."""
 
-    def __init__(self):
+    def __init__(self, headless=False):
+        # Headless runs use SDL's dummy drivers so no window is opened
+        self.headless = headless
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
         pygame.init()
         pygame.display.set_caption(TITLE)
 
@@ -23,72 +40,200 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Fixed timestep simulation
+        self.accumulator = 0.0
+        self.render_alpha = 1.0  # how far we are between the last two ticks
+
         # Game state
         self.current_state = None
-        self.states = {}
+        self.state_factories = dict(STATE_FACTORIES)
+        self.states = {}  # built so far, by name
+
+        # Inside run() a transition first awaits the next state's assets;
+        # synchronous callers (headless runs, tests) switch immediately
+        self.defer_transitions = False
+        self.pending_state = None
         self.current_city = 'boston'
         self.unlocked_cities = ['boston']  # Start with Boston unlocked
 
         # FPS tracking
         self.font = pygame.font.Font(None, 30)
+        self.fps_text = TextWidget(self.font, 'FPS: {}')
+        self.fps_rect = pygame.Rect(10, SCREEN_HEIGHT - 40, 120, 24)
+        self.fps_backdrop = None  # what's under the counter, for dirty-rect frames
+
+        # Generates every city's assets while the menus are up
+        self.asset_warmup = AssetWarmup()
 
         # Initialize states
         self.setup_states()
 
     def setup_states(self):
-        """Create all game states."""
-        self.states = {
-            'menu': MainMenu(self),
-            'city_select': CitySelect(self),
-            'gameplay': Gameplay(self),
-            'landmark': LandmarkCelebration(self)
-        }
-
-        # Start with main menu
-        self.current_state = self.states['menu']
+        """Enter the main menu. Other states are built when first needed."""
+        self.current_state = self.get_state('menu')
         self.current_state.enter_state()
 
-    async def run(self):
-        """Main game loop - async for web compatibility."""
-        while self.running:
-            dt = self.clock.tick(FPS)
+    def get_state(self, name):
+        """
+        Get a game state, importing and building it on first use.
 
-            # Handle events
-            events = pygame.event.get()
-            self.current_state.handle_events(events)
+        Args:
+            name: State name from STATE_FACTORIES
 
-            # Update current state
-            self.current_state.update(dt)
+        Returns:
+            The State instance
+        """
+        state = self.states.get(name)
+        if state is None:
+            state = import_object(self.state_factories[name])(self)
+            self.states[name] = state
+        return state
 
-            # Check for state transition
-            if self.current_state.done:
-                self.change_state(self.current_state.next_state)
+    async def run(self):
+        """Main game loop - async for web compatibility.
+
+        The simulation advances in fixed FIXED_TIMESTEP ticks while rendering
+        happens once per frame, interpolated between the last two ticks. When
+        a frame takes too long we run several ticks to catch up, and past
+        MAX_TICKS_PER_FRAME we drop the backlog instead of spiralling.
+        """
+        self.defer_transitions = True
+        while self.running:
+            # Finish a pending transition once the next state's assets are in
+            if self.pending_state is not None:
+                await self.preload_state(self.pending_state)
+                self.change_state(self.pending_state)
+                self.pending_state = None
+                self.clock.tick()  # don't count the load as a slow frame
+                self.accumulator = 0.0
 
-            # Draw
-            self.current_state.draw(self.screen)
+            frame_time = min(self.clock.tick(FPS), MAX_FRAME_TIME)
 
-            # Debug info
-            if DEBUG_MODE and SHOW_FPS:
-                self.draw_fps()
+            # Handle events
+            with profiler.scope('events'):
+                events = pygame.event.get()
+                for event in events:
+                    # Window was uncovered or resized - everything has to be presented again
+                    if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.VIDEORESIZE):
+                        self.current_state.request_full_redraw()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle()
+                        self.current_state.request_full_redraw()
+                self.current_state.handle_events(events)
+
+            with profiler.scope('update'):
+                self.advance(frame_time)
 
-            pygame.display.flip()
+            # Draw
+            self.draw_frame()
+            profiler.end_frame()
 
             # yield control to browser for web builds
             await asyncio.sleep(0)
 
         pygame.quit()
 
+    def advance(self, frame_time):
+        """
+        Run as many fixed ticks as the elapsed time calls for.
+
+        Args:
+            frame_time: Milliseconds since the last frame (already capped at MAX_FRAME_TIME)
+
+        Returns:
+            Number of ticks run
+        """
+        self.accumulator += frame_time
+        ticks = 0
+        while (self.accumulator >= FIXED_TIMESTEP and ticks < MAX_TICKS_PER_FRAME
+               and self.pending_state is None):
+            self.step()
+            self.accumulator -= FIXED_TIMESTEP
+            ticks += 1
+
+        # Too far behind - skip the remaining ticks rather than stall
+        if self.accumulator >= FIXED_TIMESTEP:
+            self.accumulator %= FIXED_TIMESTEP
+
+        self.render_alpha = self.accumulator / FIXED_TIMESTEP
+        return ticks
+
+    def draw_frame(self):
+        """Draw the current state and present it, only the dirty parts when possible."""
+        show_fps = DEBUG_MODE and SHOW_FPS
+
+        # Put back what was under the FPS counter so partial redraws stay clean
+        if show_fps and self.fps_backdrop is not None:
+            self.screen.blit(self.fps_backdrop, self.fps_rect)
+
+        with profiler.scope('draw'):
+            self.current_state.draw(self.screen)
+        dirty_rects = self.current_state.get_dirty_rects()
+
+        # Debug info
+        if show_fps:
+            self.fps_backdrop = self.screen.subsurface(self.fps_rect).copy()
+            self.draw_fps()
+            if dirty_rects is not None:
+                dirty_rects = dirty_rects + [self.fps_rect]
+
+        # The profiler overlay covers the top of the screen, so present it all
+        if profiler.enabled:
+            profiler.draw_overlay(self.screen)
+            self.current_state.request_full_redraw()
+            dirty_rects = None
+
+        with profiler.scope('present'):
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+
+    def step(self):
+        """Advance the current state by one fixed simulation tick."""
+        self.current_state.update(FIXED_TIMESTEP)
+
+        # Check for state transition
+        if self.current_state.done:
+            if self.defer_transitions:
+                self.pending_state = self.current_state.next_state
+            else:
+                self.change_state(self.current_state.next_state)
+
+    async def preload_state(self, name):
+        """
+        Load a state's assets cooperatively before entering it.
+
+        Runs the state's asset_requests() through load_assets(), drawing a
+        progress bar over the last frame, so entering a city doesn't
+        freeze the window (or the browser tab in the web build).
+        """
+        if name not in self.state_factories:
+            return
+        requests = self.get_state(name).asset_requests()
+        if requests:
+            await load_assets(requests, on_progress=self.draw_loading)
+
+    def draw_loading(self, completed, total):
+        """Draw a loading bar over the current frame."""
+        bar_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT - 60, 400, 12)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * completed / total)
+        pygame.draw.rect(self.screen, (60, 60, 80), bar_rect)
+        pygame.draw.rect(self.screen, (150, 150, 170), fill_rect)
+        pygame.display.update(bar_rect)
+
     def change_state(self, new_state_name):
         """Change to a new state."""
-        if new_state_name in self.states:
+        if new_state_name in self.state_factories:
             self.current_state.exit_state()
-            self.current_state = self.states[new_state_name]
+            self.current_state = self.get_state(new_state_name)
             self.current_state.done = False
             self.current_state.next_state = None
             self.current_state.enter_state()
+            self.current_state.request_full_redraw()
 
     def draw_fps(self):
         """Draw FPS counter."""
-        fps = int(self.clock.get_fps())
-        fps_text = self.font.render(f'FPS: {fps}', True, WHITE)
-        self.screen.blit(fps_text, (10, SCREEN_HEIGHT - 40))
+        self.fps_text.set(int(self.clock.get_fps()))
+        self.fps_text.draw(self.screen, topleft=(10, SCREEN_HEIGHT - 40))
@@ -0,0 +1,167 @@
+"""
+Headless simulation driver.
+
+Runs Gameplay with no window, no display flip and no frame cap so the
+simulation goes as fast as the machine allows. Used as a throughput
+baseline and for batch runs:
+
+    python -m src.headless --city nyc --ticks 20000
+
+Runs can be recorded and played back exactly:
+
+    python -m src.headless --city nyc --ticks 2000 --record run.json
+    python -m src.headless --replay run.json
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+from config import CITIES, FIXED_TIMESTEP
+from src.game import Game
+from src.utils.input_state import KeyState
+from src.utils.profiler import profiler
+from src.utils.replay import InputRecorder, Replay, ReplayPlayer
+
+
+class AutoRunInput:
+    """Scripted input: run right, sprinting, with a jump every so often."""
+
+    def __init__(self, jump_every=40, jump_hold=12):
+        self.jump_every = jump_every
+        self.jump_hold = jump_hold
+        self.tick = 0
+
+    def __call__(self):
+        keys = {pygame.K_RIGHT, pygame.K_LSHIFT}
+        if self.tick % self.jump_every < self.jump_hold:
+            keys.add(pygame.K_SPACE)
+        self.tick += 1
+        return KeyState(keys)
+
+
+def create_headless_game(city='boston', input_source=None, seed=None):
+    """Build a windowless Game already sitting in the gameplay state."""
+    game = Game(headless=True)
+    game.current_city = city
+    game.get_state('gameplay').seed = seed
+    game.change_state('gameplay')
+    game.get_state('gameplay').input_source = input_source
+    return game
+
+
+def run_simulation(city='boston', ticks=10000, input_source=None, render=False,
+                   seed=None, record=None):
+    """
+    Drive Gameplay for a fixed number of ticks at full speed.
+
+    Args:
+        city: City key to play
+        ticks: Number of fixed simulation ticks to run
+        input_source: Callable returning held keys per tick (defaults to AutoRunInput)
+        render: Also draw every tick to the offscreen surface (still no flip)
+        seed: Level seed; every restart reuses it (random if None)
+        record: Replay to append each tick's keys to
+
+    Returns:
+        Dict with timing and end-of-run stats
+    """
+    if input_source is None:
+        input_source = AutoRunInput()
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    if record is not None:
+        input_source = InputRecorder(input_source, record)
+
+    game = create_headless_game(city, input_source, seed)
+    gameplay = game.get_state('gameplay')
+    restarts = 0
+    completions = 0
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        with profiler.scope('update'):
+            game.step()
+
+        # Keep the run going through deaths and level completions
+        if game.current_state is not gameplay:
+            completions += 1
+            game.current_city = city
+            game.change_state('gameplay')
+        elif gameplay.player.is_dead():
+            restarts += 1
+            gameplay.enter_state()
+
+        if render:
+            with profiler.scope('draw'):
+                game.current_state.draw(game.screen)
+        profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    player = gameplay.player
+    return {
+        'city': city,
+        'seed': seed,
+        'ticks': ticks,
+        'seconds': elapsed,
+        'ticks_per_second': ticks / elapsed if elapsed > 0 else float('inf'),
+        'realtime_factor': ticks * FIXED_TIMESTEP / 1000 / elapsed if elapsed > 0 else float('inf'),
+        'score': player.score,
+        'position': (player.x, player.y),
+        'restarts': restarts,
+        'completions': completions,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run City Runner headless and report throughput.')
+    parser.add_argument('--city', choices=CITIES + ['all'], default='all')
+    parser.add_argument('--ticks', type=int, default=10000)
+    parser.add_argument('--render', action='store_true', help='draw each tick offscreen too')
+    parser.add_argument('--profile', action='store_true', help='print per-scope timings (ms per tick)')
+    parser.add_argument('--seed', type=int, help='level seed (random by default)')
+    parser.add_argument('--record', metavar='PATH', help='save the run as a replay (single city only)')
+    parser.add_argument('--replay', metavar='PATH', help='play back a recorded run instead')
+    args = parser.parse_args(argv)
+
+    if args.record and args.city == 'all':
+        parser.error('--record needs a single --city')
+
+    if args.profile:
+        profiler.enabled = True
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+        runs = [(replay.city, len(replay), ReplayPlayer(replay), replay.seed, None)]
+    else:
+        cities = CITIES if args.city == 'all' else [args.city]
+        replay = Replay(args.city, args.seed) if args.record else None
+        runs = [(city, args.ticks, None, args.seed, replay) for city in cities]
+
+    for city, ticks, input_source, seed, record in runs:
+        if args.profile:
+            # percentiles over the whole run; reset() rebuilds the deques at the new size
+            profiler.window = ticks
+            profiler.reset()
+        stats = run_simulation(city, ticks, input_source, args.render, seed, record)
+        if record is not None:
+            record.seed = stats['seed']
+            record.save(args.record)
+        print(f"{city:8s} seed {stats['seed']} {stats['ticks']} ticks in {stats['seconds']:.2f}s "
+              f"= {stats['ticks_per_second']:.0f} ticks/s "
+              f"({stats['realtime_factor']:.1f}x realtime), "
+              f"score {stats['score']}, restarts {stats['restarts']}, "
+              f"completions {stats['completions']}, "
+              f"position ({stats['position'][0]:.1f}, {stats['position'][1]:.1f})")
+        if args.profile:
+            print('  scope              avg    p95    p99')
+            for line in profiler.get_report():
+                print(f"  {line}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""
+Gameplay HUD compositor.
+
+All the HUD widgets (hearts, score, city name, progress bar) live on one
+persistent transparent strip across the top of the screen. Each frame
+only the widgets whose value changed get redrawn into the strip, and the
+strip goes to the screen in a single blit, so a quiet frame costs one
+blit and allocates nothing. The pause and death overlays reuse one
+preallocated dimming surface.
+"""
+
+import pygame
+from src.utils.profiler import profiler
+from src.utils.text_cache import text_cache, TextWidget
+from config import *
+
+# Height of the HUD strip - everything above the bottom of the progress bar
+HUD_HEIGHT = 90
+
+HEART_SIZE = 30
+HEART_SPACING = 35
+HEARTS_X = 20
+HEARTS_Y = 20
+EMPTY_HEART = (100, 100, 100)
+
+SCORE_POS = (SCREEN_WIDTH - 220, 20)
+CITY_CENTER = (SCREEN_WIDTH // 2, 30)
+BAR_RECT = pygame.Rect(SCREEN_WIDTH // 2 - 150, 60, 300, 20)
+
+
+def draw_heart(surface, color, x, y, size=HEART_SIZE):
+    """Draw the heart shape with its left lobe centered on (x, y)."""
+    pygame.draw.circle(surface, color, (x, y), size // 3)
+    pygame.draw.circle(surface, color, (x + size // 3, y), size // 3)
+    pygame.draw.polygon(surface, color, [
+        (x - size // 3, y),
+        (x + size // 1.5, y),
+        (x + size // 6, y + size // 2)
+    ])
+
+
+class HUD:
+    """Keeps the HUD composited on a persistent surface and redraws only what changed."""
+
+    def __init__(self):
+        self.font = pygame.font.Font(None, 36)
+        self.big_font = pygame.font.Font(None, 60)
+
+        self.layer = pygame.Surface((SCREEN_WIDTH, HUD_HEIGHT), pygame.SRCALPHA)
+        self.dim = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.dim.fill(BLACK)
+
+        # One full and one empty heart, drawn once and stamped as needed
+        margin = HEART_SIZE // 3
+        self.heart_rect = pygame.Rect(HEARTS_X - margin, HEARTS_Y - margin,
+                                      HEART_SIZE + 1, HEART_SIZE // 2 + margin + 1)
+        self.hearts = {}
+        for full, color in ((True, RED), (False, EMPTY_HEART)):
+            heart = pygame.Surface(self.heart_rect.size, pygame.SRCALPHA)
+            draw_heart(heart, color, margin, margin)
+            self.hearts[full] = heart
+
+        self.score_text = TextWidget(self.font, 'Score: {}')
+        self.score_rect = pygame.Rect(0, 0, 0, 0)
+        self.city_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.reset()
+
+    def reset(self, city_name=None):
+        """Start over for a new level: clear the strip and forget what was drawn."""
+        self.layer.fill((0, 0, 0, 0))
+        self.drawn_health = None
+        self.drawn_score = None
+        self.drawn_bar_width = None
+        self.score_rect.size = self.city_rect.size = (0, 0)
+        if city_name is not None:
+            self.draw_city(city_name)
+
+    def copy_in(self, surface, rect):
+        """Put a surface on the cleared strip exactly as is, alpha included."""
+        self.layer.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def draw_city(self, city_name):
+        self.layer.fill((0, 0, 0, 0), self.city_rect)
+        text = text_cache.render(self.font, city_name, WHITE)
+        self.city_rect = text.get_rect(center=CITY_CENTER)
+        self.copy_in(text, self.city_rect)
+
+    def update(self, player, level_width):
+        """
+        Redraw the widgets whose values changed since the last frame.
+
+        Args:
+            player: The Player (health, score, position)
+            level_width: Level length, for the progress bar
+        """
+        if player.health != self.drawn_health:
+            for i in range(PLAYER_MAX_HEALTH):
+                rect = self.heart_rect.move(i * HEART_SPACING, 0)
+                self.layer.fill((0, 0, 0, 0), rect)
+                self.copy_in(self.hearts[i < player.health], rect)
+            self.drawn_health = player.health
+            profiler.count('hud_redraws')
+
+        if player.score != self.drawn_score:
+            self.score_text.set(player.score)
+            self.layer.fill((0, 0, 0, 0), self.score_rect)
+            self.score_rect = self.score_text.get_rect(topleft=SCORE_POS)
+            self.copy_in(self.score_text.surface, self.score_rect)
+            self.drawn_score = player.score
+            profiler.count('hud_redraws')
+
+        bar_width = int(BAR_RECT.width * (player.rect.x / level_width))
+        if bar_width != self.drawn_bar_width:
+            pygame.draw.rect(self.layer, (100, 100, 100), BAR_RECT)
+            pygame.draw.rect(self.layer, GREEN, (BAR_RECT.x, BAR_RECT.y, bar_width, BAR_RECT.height))
+            pygame.draw.rect(self.layer, WHITE, BAR_RECT, 2)
+            self.drawn_bar_width = bar_width
+            profiler.count('hud_redraws')
+
+    def draw(self, screen):
+        """Composite the HUD onto the screen."""
+        screen.blit(self.layer, (0, 0))
+
+    def draw_dim(self, screen, alpha):
+        self.dim.set_alpha(alpha)
+        screen.blit(self.dim, (0, 0))
+
+    def draw_centered(self, screen, font, text, color, y):
+        surface = text_cache.render(font, text, color)
+        screen.blit(surface, surface.get_rect(center=(SCREEN_WIDTH // 2, y)))
+
+    def draw_pause_overlay(self, screen):
+        """Dim the screen and show the pause message."""
+        self.draw_dim(screen, 180)
+        self.draw_centered(screen, self.big_font, 'PAUSED', WHITE, SCREEN_HEIGHT // 2 - 50)
+        self.draw_centered(screen, self.font, 'Press ESC to Continue', WHITE, SCREEN_HEIGHT // 2 + 50)
+
+    def draw_death_overlay(self, screen, score):
+        """Dim the screen and show the game over message with the final score."""
+        self.draw_dim(screen, 200)
+        self.draw_centered(screen, self.big_font, 'GAME OVER', RED, SCREEN_HEIGHT // 2 - 50)
+        self.draw_centered(screen, self.font, f'Final Score: {score}', WHITE, SCREEN_HEIGHT // 2 + 20)
+        self.draw_centered(screen, self.font, 'Press R to Restart', WHITE, SCREEN_HEIGHT // 2 + 80)
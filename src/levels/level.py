@@ -2,34 +2,116 @@
 Base Level class with platforms, enemies, and collectibles.
 """
 
+import random
 import pygame
 from src.utils.asset_loader import asset_loader
+from src.utils.asset_manifest import city_asset_manifest
+from src.utils.spatial_hash import SpatialHash
+from src.utils.sector_grid import SectorGrid
+from src.utils.profiler import profiler
+from src.utils.render_queue import RenderQueue
+from src.levels.level_data import load_level_data
+from src.utils.lazy_import import import_object
+from src.entities.enemies.groups import ENEMY_GROUPS, platform_array
+from src.entities.collectible import Collectible, CollectibleField
 from config import *
 
+# Enemy type names used in level files. Modules are imported the first
+# time a level spawns that type, so a city only loads its own enemies.
+ENEMY_CLASSES = {
+    'cyclist': 'src.entities.enemies.cyclist:Cyclist',
+    'flying_paper': 'src.entities.enemies.flying_paper:FlyingPaper',
+    'pigeon': 'src.entities.enemies.pigeon:Pigeon',
+    'rat': 'src.entities.enemies.rat:Rat',
+    'taxi': 'src.entities.enemies.taxi:Taxi',
+    'vendor': 'src.entities.enemies.vendor:Vendor',
+}
+
+# Enemies that make random choices and so need the level's RNG
+SEEDED_ENEMIES = {'flying_paper', 'rat'}
+
 
 class Level:
     """Base class for game levels."""
 
-    def __init__(self, city_name, level_width=LEVEL_WIDTH):
+    def __init__(self, city_name, level_width=LEVEL_WIDTH, seed=None):
         self.city_name = city_name
         self.level_width = level_width
         self.level_height = SCREEN_HEIGHT
 
+        # Everything random about this level comes from its own seeded RNG,
+        # so the same seed always builds and plays out the same way
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
         # Level elements
         self.platforms = []
+        self.platform_data = []  # {'rect', 'type'} for each platform, same order
         self.enemies = []
         self.collectibles = []
         self.checkpoints = []
         self.landmark_position = level_width - 200
 
+        # Broad-phase grid over the platforms, built once they're placed
+        self.platform_index = None
+        self.platform_array = None  # same platforms packed for the batch kernels
+
+        # Entities bucketed into sectors, built once they're placed.
+        # Enemy types with a batch kernel go in enemy_groups instead.
+        self.enemy_sectors = None
+        self.enemy_groups = []
+        self.collectible_sectors = None
+
+        # Array-backed collectible state, built with the sectors
+        self.collectible_field = None
+
         # Background layers (parallax)
         self.bg_layers = []
         self.load_backgrounds()
 
+        # Pack this city's sprites onto shared pages before anything uses them
+        if SPRITE_ATLAS:
+            asset_loader.pack_atlas(city_name, city_asset_manifest(city_name))
+
         # Level state
         self.completed = False
         self.current_checkpoint = 0
 
+    def setup_level(self):
+        """Build the level from its layout file (assets/data/levels/<city>.json)."""
+        self.load_layout(load_level_data(self.city_name))
+
+    def load_layout(self, data):
+        """
+        Create platforms, enemies and collectibles from a level layout.
+
+        Args:
+            data: LevelData from load_level_data()
+        """
+        self.level_width = data.width
+        self.landmark_position = data.landmark
+        self.checkpoints = list(data.checkpoints)
+
+        for platform_type, x, y, width, height in data.iter_platforms():
+            rect = pygame.Rect(x, y, width, height)
+            self.platforms.append(rect)
+            self.platform_data.append({'rect': rect, 'type': platform_type})
+        self.build_platform_index()
+
+        for enemy_type, x, y, kwargs in data.iter_enemies():
+            self.enemies.append(self.spawn_enemy(enemy_type, x, y, **kwargs))
+
+        for collectible_type, x, y in data.iter_collectibles():
+            self.collectibles.append(Collectible(x, y, collectible_type))
+
+        self.build_sectors()
+
+    def spawn_enemy(self, enemy_type, x, y, **kwargs):
+        """Create an enemy by its level-file type name."""
+        if enemy_type in SEEDED_ENEMIES:
+            kwargs['rng'] = self.rng
+        return import_object(ENEMY_CLASSES[enemy_type])(x, y, **kwargs)
+
     def load_backgrounds(self):
         """Load background layers for parallax effect."""
         # Try to load background layers
@@ -45,65 +127,145 @@ class Level:
             )
             self.bg_layers.append(bg_image)
 
-    def update(self, dt):
-        """Update all level entities."""
-        # Update enemies
+    def build_platform_index(self):
+        """Index the platforms for fast nearby queries. Call after they're created."""
+        self.platform_index = SpatialHash(self.platforms)
+        self.platform_array = platform_array(self.platforms)
+
+    def query_platforms(self, rect):
+        """Get the platforms that might overlap the given rect."""
+        if self.platform_index is None:
+            self.build_platform_index()
+        return self.platform_index.query(rect)
+
+    def build_sectors(self):
+        """Bucket enemies and collectibles into sectors. Call after they're created."""
+        # Types with enough enemies to beat the per-call NumPy overhead
+        # update in batches; the rest keep their own update() calls
+        by_type = {}
         for enemy in self.enemies:
+            by_type.setdefault(enemy.enemy_type, []).append(enemy)
+        self.enemy_groups = [ENEMY_GROUPS[enemy_type](enemies, SECTOR_WIDTH)
+                             for enemy_type, enemies in by_type.items()
+                             if enemy_type in ENEMY_GROUPS and len(enemies) >= ENEMY_BATCH_MIN]
+        self.enemy_sectors = SectorGrid(enemy for enemy in self.enemies if enemy.group is None)
+
+        self.collectible_sectors = SectorGrid(self.collectibles)
+        self.collectible_field = CollectibleField(self.collectibles, self.collectible_sectors.sector_width)
+
+    def get_active_range(self, camera_offset):
+        """Get the x range that stays awake around the camera."""
+        margin = ACTIVE_SECTOR_MARGIN * SECTOR_WIDTH
+        return camera_offset - margin, camera_offset + SCREEN_WIDTH + margin
+
+    def update(self, dt, camera_offset=None):
+        """
+        Update level entities.
+
+        With a camera offset only the sectors around the screen are
+        simulated; everything further away sleeps until the camera gets
+        close. Without one the whole level updates.
+        """
+        if self.platform_index is None:
+            self.build_platform_index()
+        if self.enemy_sectors is None:
+            self.build_sectors()
+
+        if camera_offset is None:
+            awake_enemies = [enemy for enemy in self.enemies if enemy.group is None]
+            awake_sectors = (None, None)
+        else:
+            left, right = self.get_active_range(camera_offset)
+            awake_enemies = self.enemy_sectors.entities_between(left, right)
+            awake_sectors = self.collectible_sectors.sector_range(left, right)
+
+        # Update batched enemies, one kernel per type
+        for group in self.enemy_groups:
+            group.update(dt, group.awake(*awake_sectors), self.platform_array)
+
+        # Update the rest one at a time
+        for enemy in awake_enemies:
             if enemy.active:
-                enemy.update(dt, self.platforms)
+                enemy.store_previous_position()
+                enemy.update(dt, self.platform_index)
+                self.enemy_sectors.relocate(enemy)
+
+        # Update collectibles (all awake ones at once)
+        self.collectible_field.update(*awake_sectors)
+
+    def draw(self, screen, camera_offset, alpha=1.0, queue=None):
+        """
+        Draw level elements, interpolated between ticks by alpha.
+
+        Sprites go onto the given RenderQueue for the caller to flush
+        (so the player can join the batch). Without one the level uses
+        its own and flushes it before returning.
+        """
+        if self.enemy_sectors is None:
+            self.build_sectors()
 
-        # Update collectibles
-        for collectible in self.collectibles:
-            if not collectible.collected:
-                collectible.update(dt, self.platforms)
+        own_queue = queue is None
+        if own_queue:
+            queue = RenderQueue()
+            queue.begin(screen, camera_offset)
 
-    def draw(self, screen, camera_offset):
-        """Draw level elements."""
         # Draw background layers (parallax)
-        self.draw_background(screen, camera_offset)
+        with profiler.scope('draw/background'):
+            self.draw_background(screen, camera_offset)
 
         # Draw platforms
-        self.draw_platforms(screen, camera_offset)
+        with profiler.scope('draw/platforms'):
+            self.draw_platforms(screen, camera_offset, queue)
 
-        # Draw collectibles
-        for collectible in self.collectibles:
-            if not collectible.collected:
-                collectible.draw(screen, camera_offset)
+        # Only the sectors on screen (plus room for wide sprites) get drawn
+        left = camera_offset - SECTOR_DRAW_MARGIN
+        right = camera_offset + SCREEN_WIDTH
 
-        # Draw enemies
-        for enemy in self.enemies:
-            if enemy.active:
-                enemy.draw(screen, camera_offset)
+        with profiler.scope('draw/entities'):
+            # Draw collectibles
+            field = self.collectible_field
+            for collectible in self.collectible_sectors.entities_between(left, right):
+                if not collectible.collected:
+                    field.sync_view(collectible.index).submit(queue, alpha)
+
+            # Draw enemies
+            for enemy in self.enemies_between(left, right):
+                enemy.submit(queue, alpha)
+
+            if own_queue:
+                queue.flush(screen)
 
     def draw_background(self, screen, camera_offset):
         """Draw parallax background layers."""
         # Fill with sky color as base
         screen.fill(self.get_sky_color())
 
-        # Draw each parallax layer
+        # Draw each parallax layer, all in one blits() call
+        blits = []
         for i, layer in enumerate(self.bg_layers):
             # Different parallax speeds for each layer
             parallax_factor = 0.1 + (i * 0.15)
             offset = int(camera_offset * parallax_factor)
 
             # Draw layer
-            screen.blit(layer, (-offset, 0))
+            blits.append((layer, (-offset, 0)))
 
             # Draw second copy for seamless scrolling if needed
             if offset > 0:
-                screen.blit(layer, (layer.get_width() - offset, 0))
+                blits.append((layer, (layer.get_width() - offset, 0)))
+        screen.blits(blits, doreturn=False)
+        profiler.count('draw_calls')
 
-    def draw_platforms(self, screen, camera_offset):
-        """Draw all platforms."""
+    def draw_platforms(self, screen, camera_offset, queue=None):
+        """Draw all platforms (plain fills, so the queue isn't needed here)."""
+        color = self.get_platform_color()
+        screen_width = screen.get_width()
         for platform in self.platforms:
-            screen_rect = pygame.Rect(
-                platform.x - camera_offset,
-                platform.y,
-                platform.width,
-                platform.height
-            )
+            screen_x = platform.x - camera_offset
+            if screen_x >= screen_width or screen_x + platform.width <= 0:
+                continue
             # Simple colored rectangles for now
-            pygame.draw.rect(screen, self.get_platform_color(), screen_rect)
+            screen.fill(color, (screen_x, platform.y, platform.width, platform.height))
 
     def get_sky_color(self):
         """Get the sky background color for this city."""
@@ -123,19 +285,37 @@ class Level:
         }
         return platform_colors.get(self.city_name, (100, 100, 100))
 
+    def enemies_between(self, left, right):
+        """Get the active enemies in the sectors overlapping left..right, synced and ready to use."""
+        found = [enemy for enemy in self.enemy_sectors.entities_between(left, right) if enemy.active]
+        for group in self.enemy_groups:
+            found.extend(group.sync_view(i) for i in group.between(left, right).tolist())
+        return found
+
+    def touching_enemies(self, player):
+        """Get the active enemies overlapping the player, synced and ready to use."""
+        if self.enemy_sectors is None:
+            self.build_sectors()
+        nearby = self.enemy_sectors.entities_between(player.rect.left - SECTOR_DRAW_MARGIN, player.rect.right)
+        found = [enemy for enemy in nearby if enemy.active and player.check_collision(enemy)]
+        for group in self.enemy_groups:
+            found.extend(group.sync_view(i) for i in group.overlapping(player.rect).tolist())
+        return found
+
     def check_collectible_collision(self, player):
         """Check if player collected any items."""
+        if self.collectible_field is None:
+            self.build_sectors()
+        field = self.collectible_field
         collected_points = 0
-        for collectible in self.collectibles:
-            if not collectible.collected and player.check_collision(collectible):
-                points = collectible.collect()
-                player.collect_item(collectible.collectible_type)
-                collected_points += points
+        for index in field.overlapping(player.rect):
+            collected_points += field.collect(index)
+            player.collect_item(field.views[index].collectible_type)
         return collected_points
 
     def check_enemy_collision(self, player):
         """Check if player hit any enemies."""
-        for enemy in self.enemies:
+        for enemy in self.touching_enemies(player):
             if enemy.active and player.check_collision(enemy):
                 # Check if player is jumping on enemy
                 if player.vel_y > 0 and player.rect.bottom <= enemy.rect.centery:
@@ -172,15 +352,3 @@ class Level:
         else:
             checkpoint_x = self.checkpoints[self.current_checkpoint - 1]
             return checkpoint_x + 50, SCREEN_HEIGHT - 200
-
-    def create_ground_platforms(self):
-        """Create basic ground platforms for testing."""
-        # Create continuous ground
-        ground_y = SCREEN_HEIGHT - 100
-        self.platforms.append(pygame.Rect(0, ground_y, self.level_width, 100))
-
-        # Add some floating platforms
-        for i in range(5):
-            x = 300 + i * 600
-            y = ground_y - 100 - (i % 3) * 50
-            self.platforms.append(pygame.Rect(x, y, 150, 20))
@@ -0,0 +1,228 @@
+"""
+Level layout files.
+
+Layouts live as JSON in LEVELS_DIR (one file per level, see nyc.json for
+the format). The first load compiles a file into a flat binary form -
+packed int arrays of platform, enemy and collectible records plus a
+small string table - under LEVEL_CACHE_DIR. Later loads read that back
+directly, skipping JSON parsing, as long as the source file's size and
+modification time still match what the cache header recorded.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from config import LEVELS_DIR, LEVEL_CACHE_DIR
+
+# Bump when the binary layout changes
+LEVEL_FORMAT = 1
+
+MAGIC = b'CRLV'
+# magic, format, byte order, source mtime (ns), source size,
+# width, landmark, then counts of strings/checkpoints/platforms/enemies/collectibles
+HEADER = struct.Struct('<4sHBqqiiIIIII')
+BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+# Ints per record in the packed arrays
+PLATFORM_FIELDS = 5     # x, y, width, height, type
+ENEMY_FIELDS = 4        # type, x, y, param
+COLLECTIBLE_FIELDS = 3  # type, x, y
+
+# Optional per-type constructor argument stored in an enemy record's param slot
+ENEMY_PARAMS = {
+    'cyclist': 'patrol_distance',
+    'vendor': 'patrol_distance',
+    'pigeon': 'flight_height',
+}
+NO_PARAM = -2 ** 31  # param slot value meaning "use the constructor default"
+
+
+class LevelData:
+    """A level layout: packed record arrays plus the strings they index into."""
+
+    def __init__(self, width, landmark, checkpoints, strings, platforms, enemies, collectibles):
+        self.width = width
+        self.landmark = landmark
+        self.checkpoints = checkpoints
+        self.strings = strings
+        self.platforms = platforms
+        self.enemies = enemies
+        self.collectibles = collectibles
+
+    def iter_platforms(self):
+        """Yield (type, x, y, width, height) for each platform."""
+        records = self.platforms
+        for i in range(0, len(records), PLATFORM_FIELDS):
+            x, y, width, height, kind = records[i:i + PLATFORM_FIELDS]
+            yield self.strings[kind], x, y, width, height
+
+    def iter_enemies(self):
+        """Yield (type, x, y, kwargs) for each enemy."""
+        records = self.enemies
+        for i in range(0, len(records), ENEMY_FIELDS):
+            kind, x, y, param = records[i:i + ENEMY_FIELDS]
+            enemy_type = self.strings[kind]
+            kwargs = {}
+            if param != NO_PARAM:
+                kwargs[ENEMY_PARAMS[enemy_type]] = param
+            yield enemy_type, x, y, kwargs
+
+    def iter_collectibles(self):
+        """Yield (type, x, y) for each collectible."""
+        records = self.collectibles
+        for i in range(0, len(records), COLLECTIBLE_FIELDS):
+            kind, x, y = records[i:i + COLLECTIBLE_FIELDS]
+            yield self.strings[kind], x, y
+
+
+def compile_level(source):
+    """
+    Turn a parsed level JSON document into LevelData.
+
+    Args:
+        source: Dict as loaded from a level file
+
+    Returns:
+        LevelData
+    """
+    strings = []
+    string_ids = {}
+
+    def intern(name):
+        if name not in string_ids:
+            string_ids[name] = len(strings)
+            strings.append(name)
+        return string_ids[name]
+
+    platforms = array('i')
+    for p in source.get('platforms', []):
+        platforms.extend((p['x'], p['y'], p['width'], p['height'], intern(p.get('type', 'ground'))))
+
+    enemies = array('i')
+    for e in source.get('enemies', []):
+        enemy_type = e['type']
+        param_name = ENEMY_PARAMS.get(enemy_type)
+        param = e.get(param_name, NO_PARAM) if param_name else NO_PARAM
+        enemies.extend((intern(enemy_type), e['x'], e['y'], param))
+
+    collectibles = array('i')
+    for c in source.get('collectibles', []):
+        collectibles.extend((intern(c['type']), c['x'], c['y']))
+
+    return LevelData(
+        source['width'],
+        source.get('landmark', source['width'] - 200),
+        array('i', source.get('checkpoints', [])),
+        strings,
+        platforms,
+        enemies,
+        collectibles,
+    )
+
+
+def write_compiled(path, data, source_stat):
+    """Write LevelData in the binary cache format."""
+    encoded = [s.encode('utf-8') for s in data.strings]
+    header = HEADER.pack(
+        MAGIC, LEVEL_FORMAT, BYTE_ORDER,
+        source_stat.st_mtime_ns, source_stat.st_size,
+        data.width, data.landmark,
+        len(encoded), len(data.checkpoints),
+        len(data.platforms) // PLATFORM_FIELDS,
+        len(data.enemies) // ENEMY_FIELDS,
+        len(data.collectibles) // COLLECTIBLE_FIELDS,
+    )
+
+    temp_path = f"{path}.tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        for s in encoded:
+            f.write(struct.pack('<H', len(s)))
+            f.write(s)
+        data.checkpoints.tofile(f)
+        data.platforms.tofile(f)
+        data.enemies.tofile(f)
+        data.collectibles.tofile(f)
+    os.replace(temp_path, path)
+
+
+def read_compiled(path, source_stat):
+    """
+    Read a compiled level.
+
+    Returns:
+        LevelData, or None if the file is missing, stale or damaged
+    """
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    if len(blob) < HEADER.size:
+        return None
+    (magic, version, byte_order, mtime_ns, size, width, landmark,
+     num_strings, num_checkpoints, num_platforms, num_enemies, num_collectibles) = HEADER.unpack_from(blob)
+    if (magic != MAGIC or version != LEVEL_FORMAT or byte_order != BYTE_ORDER
+            or mtime_ns != source_stat.st_mtime_ns or size != source_stat.st_size):
+        return None
+
+    try:
+        offset = HEADER.size
+        strings = []
+        for _ in range(num_strings):
+            (length,) = struct.unpack_from('<H', blob, offset)
+            offset += 2
+            strings.append(blob[offset:offset + length].decode('utf-8'))
+            offset += length
+
+        arrays = []
+        for count in (num_checkpoints, num_platforms * PLATFORM_FIELDS,
+                      num_enemies * ENEMY_FIELDS, num_collectibles * COLLECTIBLE_FIELDS):
+            values = array('i')
+            end = offset + count * values.itemsize
+            if end > len(blob):
+                return None
+            values.frombytes(blob[offset:end])
+            arrays.append(values)
+            offset = end
+    except (struct.error, UnicodeDecodeError):
+        return None
+
+    checkpoints, platforms, enemies, collectibles = arrays
+    return LevelData(width, landmark, checkpoints, strings, platforms, enemies, collectibles)
+
+
+def load_level_data(name, levels_dir=LEVELS_DIR, cache_dir=LEVEL_CACHE_DIR):
+    """
+    Load a level layout, compiling it on first use.
+
+    Args:
+        name: Level file name without extension (e.g. 'nyc')
+        levels_dir: Directory holding the JSON sources
+        cache_dir: Directory for the compiled files
+
+    Returns:
+        LevelData
+    """
+    source_path = os.path.join(levels_dir, f"{name}.json")
+    compiled_path = os.path.join(cache_dir, f"{name}.lvl")
+    source_stat = os.stat(source_path)
+
+    data = read_compiled(compiled_path, source_stat)
+    if data is not None:
+        return data
+
+    with open(source_path) as f:
+        data = compile_level(json.load(f))
+
+    try:
+        write_compiled(compiled_path, data, source_stat)
+    except OSError as e:
+        # Read-only or sandboxed filesystem - the JSON still works, just slower
+        print(f"Warning: Could not write compiled level {compiled_path}: {e}")
+
+    return data
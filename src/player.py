@@ -38,18 +38,10 @@ class Player(Entity):
     def load_sprites(self):
         # load all the animation frames
         self.animations = {
-            'idle': asset_loader.load_animation_frames(
-                'player/idle', 'idle_', 4, (self.width, self.height), BLUE
-            ),
-            'run': asset_loader.load_animation_frames(
-                'player/run', 'run_', 6, (self.width, self.height), BLUE
-            ),
-            'jump': asset_loader.load_animation_frames(
-                'player/jump', 'jump_', 3, (self.width, self.height), BLUE
-            ),
-            'hurt': asset_loader.load_animation_frames(
-                'player/hurt', 'hurt_', 2, (self.width, self.height), RED
-            ),
+            name: asset_loader.load_animation_frames(
+                directory, prefix, num_frames, (self.width, self.height), color
+            )
+            for name, (directory, prefix, num_frames, color) in PLAYER_ANIMATIONS.items()
         }
 
         # start with idle animation
@@ -103,6 +95,8 @@ class Player(Entity):
             self.has_double_jumped = True
 
     def update(self, dt, platforms):
+        self.store_previous_position()
+
         # apply gravity
         self.apply_gravity(PLAYER_GRAVITY)
 
@@ -144,9 +138,9 @@ class Player(Entity):
                 self.on_ground = False
             return
 
-        # check all platforms
+        # check the platforms around us
         self.on_ground = False
-        for platform in platforms:
+        for platform in self.nearby_platforms(platforms):
             if self.rect.colliderect(platform):
                 # landing on top
                 if self.vel_y > 0 and self.rect.bottom <= platform.top + 15:
@@ -226,43 +220,23 @@ class Player(Entity):
                 else:
                     self.animation_frame = 0
 
-            # Update image
+            # Update image (Entity.draw picks the mirrored frame when facing left)
             self.image = current_anim[self.animation_frame]
 
-            # Flip image if facing left
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
-
-    def draw(self, screen, camera_offset=0):
+    def draw(self, screen, camera_offset=0, alpha=1.0):
         """Draw player with invincibility flashing."""
         if self.invincible:
             # Flash by only drawing on even frames
             if (pygame.time.get_ticks() // 100) % 2 == 0:
                 return
 
-        super().draw(screen, camera_offset)
-
-        # Draw health
-        self.draw_health(screen)
-
-    def draw_health(self, screen):
-        """Draw health hearts in top-left corner."""
-        heart_size = 30
-        spacing = 35
-        start_x = 20
-        start_y = 20
-
-        for i in range(PLAYER_MAX_HEALTH):
-            x = start_x + i * spacing
-            color = RED if i < self.health else (100, 100, 100)
-            # Draw simple heart shape (placeholder)
-            pygame.draw.circle(screen, color, (x, start_y), heart_size // 3)
-            pygame.draw.circle(screen, color, (x + heart_size // 3, start_y), heart_size // 3)
-            pygame.draw.polygon(screen, color, [
-                (x - heart_size // 3, start_y),
-                (x + heart_size // 1.5, start_y),
-                (x + heart_size // 6, start_y + heart_size // 2)
-            ])
+        super().draw(screen, camera_offset, alpha)
+
+    def submit(self, queue, alpha=1.0, layer='player'):
+        """Queue the player sprite (with invincibility flashing) on a RenderQueue."""
+        if self.invincible and (pygame.time.get_ticks() // 100) % 2 == 0:
+            return
+        super().submit(queue, alpha, layer)
 
     def reset_position(self, x, y):
         """Reset player to a checkpoint position."""
@@ -273,6 +247,9 @@ class Player(Entity):
         self.vel_x = 0
         self.vel_y = 0
 
+        # teleporting, so don't interpolate from the old spot
+        self.store_previous_position()
+
     def is_dead(self):
         """Check if player is dead."""
         return self.health <= 0
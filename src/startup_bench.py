@@ -0,0 +1,121 @@
+"""
+Time-to-first-frame benchmark.
+
+Launches the game in fresh interpreters (headless, so no window) and
+times each phase up to the first presented main-menu frame: importing
+src.game, building the Game, and drawing. It also reports which of the
+heavy modules were already imported by then - levels, enemies and the
+sprite generator should only load once a city is entered.
+
+    python -m src.startup_bench
+    python -m src.startup_bench --runs 20 --max-ms 400
+
+With --max-ms the exit status is 1 when the median total is slower, so
+the command can gate a CI job.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that shouldn't be loaded before the first frame
+DEFERRED_MODULES = (
+    'src.states.gameplay',
+    'src.levels.level',
+    'src.levels.boston',
+    'src.levels.nyc',
+    'src.levels.chicago',
+    'src.entities.enemies.enemy',
+    'src.utils.sprite_generator',
+)
+
+PHASES = ('import', 'init', 'first_frame', 'total')
+
+
+def measure_once():
+    """Run in a fresh process: time the startup phases and print them as JSON."""
+    start = time.perf_counter()
+    from src.game import Game
+    imported = time.perf_counter()
+    game = Game(headless=True)
+    built = time.perf_counter()
+    game.draw_frame()
+    drawn = time.perf_counter()
+
+    print(json.dumps({
+        'import': (imported - start) * 1000,
+        'init': (built - imported) * 1000,
+        'first_frame': (drawn - built) * 1000,
+        'total': (drawn - start) * 1000,
+        'loaded': [name for name in DEFERRED_MODULES if name in sys.modules],
+    }))
+
+
+def run_startup(runs=10):
+    """
+    Measure startup in separate interpreters.
+
+    Args:
+        runs: Number of fresh processes to time
+
+    Returns:
+        Dict of phase -> list of milliseconds, plus 'loaded' (deferred
+        modules seen in any run) and 'process' (wall time per process,
+        interpreter startup included)
+    """
+    results = {phase: [] for phase in PHASES}
+    results['process'] = []
+    loaded = set()
+
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, '-m', 'src.startup_bench', '--child'],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        results['process'].append((time.perf_counter() - start) * 1000)
+
+        sample = json.loads(output.strip().splitlines()[-1])
+        for phase in PHASES:
+            results[phase].append(sample[phase])
+        loaded.update(sample['loaded'])
+
+    results['loaded'] = sorted(loaded)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure City Runner time-to-first-frame.')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, help='fail if the median total is slower than this')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        measure_once()
+        return 0
+
+    results = run_startup(args.runs)
+    print(f"{args.runs} runs, milliseconds   median    min    max")
+    for phase in PHASES + ('process',):
+        samples = results[phase]
+        print(f"  {phase:12s}             {statistics.median(samples):6.1f} "
+              f"{min(samples):6.1f} {max(samples):6.1f}")
+    if results['loaded']:
+        print(f"  loaded before first frame: {', '.join(results['loaded'])}")
+
+    if args.max_ms is not None and statistics.median(results['total']) > args.max_ms:
+        print(f"Startup regression: median total over {args.max_ms:.0f}ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ City selection menu state.
 
 import pygame
 from src.states.state import State
+from src.utils.text_cache import text_cache
 from config import *
 
 
@@ -17,7 +18,17 @@ class CitySelect(State):
         self.info_font = pygame.font.Font(None, 30)
 
         self.selected_city = 0
-        self.unlocked_cities = self.game.unlocked_cities if hasattr(self.game, 'unlocked_cities') else ['boston']
+        self.background_color = (30, 30, 50)
+
+        # Card layout
+        self.card_width = 300
+        self.card_height = 400
+        self.card_spacing = 50
+        self.card_y = 180
+
+        # Which card was highlighted last time we drew (dirty-rect tracking)
+        self.drawn_city = None
+        self.unlocked_cities = self.game.unlocked_cities
 
         self.city_info = {
             'boston': {
@@ -68,36 +79,72 @@ class CitySelect(State):
 
     def update(self, dt):
         """Update city selection menu."""
-        pass
+        # Use the idle menu time to get every city's assets ready
+        self.update_warmup()
 
     def draw(self, screen):
-        """Draw city selection menu."""
-        screen.fill((30, 30, 50))
+        """Draw city selection menu, repainting only what changed since the last frame."""
+        if self.needs_full_redraw or not DIRTY_RECT_RENDERING:
+            self.draw_full(screen)
+            self.dirty_rects = None
+            return
+
+        self.dirty_rects = []
+
+        # Selection moved - repaint the cards
+        if self.drawn_city != self.selected_city:
+            cards_rect = self.get_cards_rect()
+            screen.fill(self.background_color, cards_rect)
+            self.draw_cards(screen)
+            self.dirty_rects.append(cards_rect)
+
+        bar_rect = self.draw_warmup_progress(screen, self.background_color)
+        if bar_rect:
+            self.dirty_rects.append(bar_rect)
+
+    def draw_full(self, screen):
+        """Paint the whole city selection screen."""
+        screen.fill(self.background_color)
 
         # Title
-        title_text = self.title_font.render('Select Your City', True, WHITE)
+        title_text = text_cache.render(self.title_font, 'Select Your City', WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
         screen.blit(title_text, title_rect)
 
         # City cards
-        card_width = 300
-        card_height = 400
-        card_spacing = 50
-        total_width = len(CITIES) * card_width + (len(CITIES) - 1) * card_spacing
-        start_x = (SCREEN_WIDTH - total_width) // 2
+        self.draw_cards(screen)
+
+        # Instructions
+        instructions = text_cache.render(self.info_font, 'Arrow Keys to Select | Enter to Play | ESC to Back', (180, 180, 180))
+        instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
+        screen.blit(instructions, instructions_rect)
+
+        self.draw_warmup_progress(screen)
+        self.needs_full_redraw = False
+
+    def get_cards_start_x(self):
+        """Left edge of the first card, so the row is centered."""
+        total_width = len(CITIES) * self.card_width + (len(CITIES) - 1) * self.card_spacing
+        return (SCREEN_WIDTH - total_width) // 2
+
+    def get_cards_rect(self):
+        """Screen area covered by the row of city cards."""
+        total_width = len(CITIES) * self.card_width + (len(CITIES) - 1) * self.card_spacing
+        return pygame.Rect(self.get_cards_start_x(), self.card_y, total_width, self.card_height)
+
+    def draw_cards(self, screen):
+        """Draw every city card."""
+        start_x = self.get_cards_start_x()
 
         for i, city_key in enumerate(CITIES):
-            x = start_x + i * (card_width + card_spacing)
-            y = 180
+            x = start_x + i * (self.card_width + self.card_spacing)
             is_selected = i == self.selected_city
             is_unlocked = city_key in self.unlocked_cities
 
-            self.draw_city_card(screen, x, y, card_width, card_height, city_key, is_selected, is_unlocked)
+            self.draw_city_card(screen, x, self.card_y, self.card_width, self.card_height,
+                                city_key, is_selected, is_unlocked)
 
-        # Instructions
-        instructions = self.info_font.render('Arrow Keys to Select | Enter to Play | ESC to Back', True, (180, 180, 180))
-        instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
-        screen.blit(instructions, instructions_rect)
+        self.drawn_city = self.selected_city
 
     def draw_city_card(self, screen, x, y, width, height, city_key, is_selected, is_unlocked):
         """Draw an individual city card."""
@@ -114,18 +161,18 @@ class CitySelect(State):
         pygame.draw.rect(screen, border_color, card_rect, border_width)
 
         # City name
-        name_text = self.city_font.render(info['name'], True, info['color'] if is_unlocked else (80, 80, 80))
+        name_text = text_cache.render(self.city_font, info['name'], info['color'] if is_unlocked else (80, 80, 80))
         name_rect = name_text.get_rect(center=(x + width // 2, y + 60))
         screen.blit(name_text, name_rect)
 
         # Theme
-        theme_text = self.info_font.render(info['theme'], True, WHITE if is_unlocked else (100, 100, 100))
+        theme_text = text_cache.render(self.info_font, info['theme'], WHITE if is_unlocked else (100, 100, 100))
         theme_rect = theme_text.get_rect(center=(x + width // 2, y + 150))
         screen.blit(theme_text, theme_rect)
 
         # Landmark
-        landmark_label = self.info_font.render('Landmark:', True, (150, 150, 150))
-        landmark_text = self.info_font.render(info['landmark'], True, info['color'] if is_unlocked else (80, 80, 80))
+        landmark_label = text_cache.render(self.info_font, 'Landmark:', (150, 150, 150))
+        landmark_text = text_cache.render(self.info_font, info['landmark'], info['color'] if is_unlocked else (80, 80, 80))
         label_rect = landmark_label.get_rect(center=(x + width // 2, y + 220))
         text_rect = landmark_text.get_rect(center=(x + width // 2, y + 250))
         screen.blit(landmark_label, label_rect)
@@ -133,10 +180,10 @@ class CitySelect(State):
 
         # Lock status
         if not is_unlocked:
-            lock_text = self.city_font.render('LOCKED', True, RED)
+            lock_text = text_cache.render(self.city_font, 'LOCKED', RED)
             lock_rect = lock_text.get_rect(center=(x + width // 2, y + 320))
             screen.blit(lock_text, lock_rect)
         elif is_selected:
-            play_text = self.info_font.render('Press ENTER to Play', True, info['color'])
+            play_text = text_cache.render(self.info_font, 'Press ENTER to Play', info['color'])
             play_rect = play_text.get_rect(center=(x + width // 2, y + 320))
             screen.blit(play_text, play_rect)
@@ -6,11 +6,21 @@ import pygame
 from src.states.state import State
 from src.player import Player
 from src.camera import Camera
-from src.levels.boston import BostonLevel
-from src.levels.nyc import NYCLevel
-from src.levels.chicago import ChicagoLevel
+from src.hud import HUD
+from src.utils.asset_loader import asset_loader
+from src.utils.lazy_import import import_object
+from src.utils.profiler import profiler
+from src.utils.render_queue import RenderQueue
+from src.utils.asset_manifest import city_asset_manifest
 from config import *
 
+# Level class for each city, imported when that city is first entered
+LEVEL_CLASSES = {
+    'boston': 'src.levels.boston:BostonLevel',
+    'nyc': 'src.levels.nyc:NYCLevel',
+    'chicago': 'src.levels.chicago:ChicagoLevel',
+}
+
 
 class Gameplay(State):
     """Active gameplay state."""
@@ -20,32 +30,59 @@ class Gameplay(State):
         self.player = None
         self.camera = None
         self.level = None
+        self.city = None
         self.paused = False
 
-        # UI
-        self.ui_font = pygame.font.Font(None, 36)
-        self.big_font = pygame.font.Font(None, 60)
+        # Optional callable returning the held keys for the next tick
+        # (headless runs, scripted input). None means read the keyboard.
+        self.input_source = None
+
+        # Level seed for the next enter_state(). None picks a fresh one each
+        # time; set it to replay a recorded run exactly.
+        self.seed = None
+
+        # Level and player sprites are batched through this each frame
+        self.render_queue = RenderQueue()
+
+        # Hearts, score and progress, composited on one persistent layer
+        self.hud = HUD()
+
+    def asset_requests(self):
+        """The city's backgrounds and sprites, loaded before the level is built."""
+        city = self.game.current_city
+        return city_asset_manifest(city)
 
     def enter_state(self):
         """Set up the level when entering gameplay."""
         # Load appropriate level
-        city = self.game.current_city if hasattr(self.game, 'current_city') else 'boston'
+        city = self.game.current_city
+
+        level_class = import_object(LEVEL_CLASSES.get(city, LEVEL_CLASSES['boston']))
+        with asset_loader.cache.grouped(city):
+            self.level = level_class(self.seed)
 
-        if city == 'boston':
-            self.level = BostonLevel()
-        elif city == 'nyc':
-            self.level = NYCLevel()
-        elif city == 'chicago':
-            self.level = ChicagoLevel()
-        else:
-            self.level = BostonLevel()
+            # Create player
+            self.player = Player(100, SCREEN_HEIGHT - 200)
 
-        # Create player
-        self.player = Player(100, SCREEN_HEIGHT - 200)
+        # The city being played keeps its assets however tight the cache
+        # budget gets. Switching cities frees the last one's (anything the
+        # new level also uses joined its group above, so that stays).
+        asset_loader.cache.pin_group(city)
+        if self.city is not None and self.city != city:
+            asset_loader.cache.release_group(self.city)
+        self.city = city
 
         # Create camera
         self.camera = Camera(self.level.level_width)
 
+        self.hud.reset(CITY_NAMES.get(city, 'Boston'))
+
+    def exit_state(self):
+        """Let the city's assets be evicted once we're out of gameplay."""
+        # still remembered, so picking another city releases them
+        if self.city is not None:
+            asset_loader.cache.unpin_group(self.city)
+
     def handle_events(self, events):
         """Handle gameplay input."""
         super().handle_events(events)
@@ -64,25 +101,35 @@ class Gameplay(State):
             return
 
         # Get player input
-        keys = pygame.key.get_pressed()
-        self.player.handle_input(keys, dt)
+        with profiler.scope('update/input'):
+            if self.input_source is not None:
+                keys = self.input_source()
+            else:
+                keys = pygame.key.get_pressed()
+            self.player.handle_input(keys, dt)
 
         # Update player
-        self.player.update(dt, self.level.platforms)
+        with profiler.scope('update/player'):
+            self.player.update(dt, self.level.platform_index)
 
-        # Update level
-        self.level.update(dt)
+        # Update level (only the sectors around the camera)
+        with profiler.scope('update/level'):
+            self.level.update(dt, self.camera.offset_x)
 
-        # Check collectibles
-        self.level.check_collectible_collision(self.player)
+        with profiler.scope('update/collisions'):
+            # Check collectibles
+            self.level.check_collectible_collision(self.player)
 
-        # Check enemy collisions
-        self.level.check_enemy_collision(self.player)
+            # Check enemy collisions
+            self.level.check_enemy_collision(self.player)
 
         # Check checkpoints
         checkpoint_idx, checkpoint_x = self.level.check_checkpoint(self.player)
         if checkpoint_idx is not None:
-            print(f"Checkpoint {checkpoint_idx + 1} reached!")
+            profiler.count('checkpoints')
+            # headless throughput runs hit hundreds of these
+            if DEBUG_MODE and not self.game.headless:
+                print(f"Checkpoint {checkpoint_idx + 1} reached!")
 
         # Check landmark
         if self.level.check_landmark_reached(self.player):
@@ -90,7 +137,8 @@ class Gameplay(State):
             self.done = True
 
         # Update camera
-        self.camera.update(self.player)
+        with profiler.scope('update/camera'):
+            self.camera.update(self.player)
 
         # Check if player fell off map
         if self.player.rect.y > SCREEN_HEIGHT + 100:
@@ -104,84 +152,35 @@ class Gameplay(State):
 
     def draw(self, screen):
         """Draw gameplay."""
-        camera_x, camera_y = self.camera.get_offset()
+        # Blend between the last two simulation ticks
+        alpha = self.game.render_alpha
+        if self.paused or self.player.is_dead():
+            alpha = 1.0
+
+        camera_x, camera_y = self.camera.get_offset(alpha)
+        queue = self.render_queue
+        queue.begin(screen, camera_x)
 
         # Draw level
-        self.level.draw(screen, camera_x)
+        self.level.draw(screen, camera_x, alpha, queue)
 
         # Draw player
-        self.player.draw(screen, camera_x)
+        with profiler.scope('draw/player'):
+            self.player.submit(queue, alpha)
+
+        # Everything queued goes out in one blits() call per layer
+        with profiler.scope('draw/flush'):
+            queue.flush(screen)
 
         # Draw UI
-        self.draw_ui(screen)
+        with profiler.scope('draw/ui'):
+            self.hud.update(self.player, self.level.level_width)
+            self.hud.draw(screen)
 
         # Draw pause overlay
         if self.paused:
-            self.draw_pause_overlay(screen)
+            self.hud.draw_pause_overlay(screen)
 
         # Draw death overlay
         if self.player.is_dead():
-            self.draw_death_overlay(screen)
-
-    def draw_ui(self, screen):
-        """Draw HUD elements."""
-        # Score
-        score_text = self.ui_font.render(f'Score: {self.player.score}', True, WHITE)
-        screen.blit(score_text, (SCREEN_WIDTH - 220, 20))
-
-        # City name
-        city_name = CITY_NAMES.get(self.game.current_city if hasattr(self.game, 'current_city') else 'boston', 'Boston')
-        city_text = self.ui_font.render(city_name, True, WHITE)
-        city_rect = city_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
-        screen.blit(city_text, city_rect)
-
-        # Progress bar (simple)
-        progress = self.player.rect.x / self.level.level_width
-        bar_width = 300
-        bar_height = 20
-        bar_x = SCREEN_WIDTH // 2 - bar_width // 2
-        bar_y = 60
-
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(screen, GREEN, (bar_x, bar_y, int(bar_width * progress), bar_height))
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-
-    def draw_pause_overlay(self, screen):
-        """Draw pause menu overlay."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
-
-        # Pause text
-        pause_text = self.big_font.render('PAUSED', True, WHITE)
-        pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        screen.blit(pause_text, pause_rect)
-
-        # Instructions
-        continue_text = self.ui_font.render('Press ESC to Continue', True, WHITE)
-        continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        screen.blit(continue_text, continue_rect)
-
-    def draw_death_overlay(self, screen):
-        """Draw death/game over overlay."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(200)
-        screen.blit(overlay, (0, 0))
-
-        # Game over text
-        game_over_text = self.big_font.render('GAME OVER', True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        screen.blit(game_over_text, game_over_rect)
-
-        # Score
-        score_text = self.ui_font.render(f'Final Score: {self.player.score}', True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        screen.blit(score_text, score_rect)
-
-        # Restart instruction
-        restart_text = self.ui_font.render('Press R to Restart', True, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
-        screen.blit(restart_text, restart_rect)
+            self.hud.draw_death_overlay(screen, self.player.score)
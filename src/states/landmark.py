@@ -4,6 +4,7 @@ Landmark celebration animation state.
 
 import pygame
 from src.states.state import State
+from src.utils.text_cache import TextWidget
 from config import *
 
 
@@ -17,22 +18,51 @@ class LandmarkCelebration(State):
         self.big_font = pygame.font.Font(None, 80)
         self.medium_font = pygame.font.Font(None, 50)
         self.small_font = pygame.font.Font(None, 36)
+
+        # Fading texts, rendered once and faded with set_alpha
+        self.victory_text = TextWidget(self.big_font)
+        self.landmark_text = TextWidget(self.medium_font, 'You reached {}!')
+        self.prompt_text = TextWidget(self.small_font)
+        self.victory_text.set('VICTORY!')
+        self.prompt_text.set('Press ENTER to continue')
         self.city = None
         self.landmark = None
+        self.background_color = BLACK
+
+        # NYC's neon flash, built on first visit; each frame only changes its alpha
+        self.flash_overlay = None
+
+        # Dirty-rect tracking: last drawn alpha per text, last effect rects
+        self.drawn_alphas = {}
+        self.effect_rects = []
 
     def enter_state(self):
         """Initialize celebration for current city."""
-        self.city = self.game.current_city if hasattr(self.game, 'current_city') else 'boston'
+        self.city = self.game.current_city
         self.landmark = CITY_LANDMARKS.get(self.city, 'Landmark')
+        self.landmark_text.set(self.landmark)
         self.animation_timer = 0
+        self.drawn_alphas = {}
+        self.effect_rects = []
+
+        # Background color based on city
+        bg_colors = {
+            'boston': BOSTON_COLORS['deep_green'],
+            'nyc': NYC_COLORS['hot_pink'],
+            'chicago': CHICAGO_COLORS['cool_blue']
+        }
+        self.background_color = bg_colors.get(self.city, BLACK)
+
+        if self.city == 'nyc' and self.flash_overlay is None:
+            self.flash_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.flash_overlay.fill(NYC_COLORS['electric_blue'])
 
         # Unlock next city
-        if hasattr(self.game, 'unlocked_cities'):
-            city_index = CITIES.index(self.city)
-            if city_index < len(CITIES) - 1:
-                next_city = CITIES[city_index + 1]
-                if next_city not in self.game.unlocked_cities:
-                    self.game.unlocked_cities.append(next_city)
+        city_index = CITIES.index(self.city)
+        if city_index < len(CITIES) - 1:
+            next_city = CITIES[city_index + 1]
+            if next_city not in self.game.unlocked_cities:
+                self.game.unlocked_cities.append(next_city)
 
     def handle_events(self, events):
         """Handle input during celebration."""
@@ -55,82 +85,112 @@ class LandmarkCelebration(State):
             self.done = True
 
     def draw(self, screen):
-        """Draw celebration animation."""
-        # Background color based on city
-        bg_colors = {
-            'boston': BOSTON_COLORS['deep_green'],
-            'nyc': NYC_COLORS['hot_pink'],
-            'chicago': CHICAGO_COLORS['cool_blue']
-        }
-        screen.fill(bg_colors.get(self.city, BLACK))
-
-        # Calculate animation phase
+        """
+        Draw celebration animation.
+
+        After a full paint, each frame only puts the background back under
+        last frame's effects and under texts whose fade moved on, then
+        draws this frame's effects. NYC's neon flash tints the whole
+        screen, so while it runs every frame is a full paint.
+        """
         phase = self.animation_timer / self.animation_duration
-
-        # Victory text (fade in)
-        if phase < 0.3:
-            alpha = int((phase / 0.3) * 255)
+        texts = self.visible_texts(phase)
+        flashing = self.city == 'nyc' and phase > 0.4
+
+        if self.needs_full_redraw or flashing or not DIRTY_RECT_RENDERING:
+            self.draw_full(screen, phase, texts)
+            self.dirty_rects = None
+            return
+
+        restore = list(self.effect_rects)
+        for name, widget, alpha, center in texts:
+            if self.drawn_alphas.get(name) != alpha:
+                restore.append(widget.get_rect(center=center))
+        for rect in restore:
+            self.repaint(screen, rect, texts)
+        self.drawn_alphas = {name: alpha for name, _, alpha, _ in texts}
+
+        self.effect_rects = self.draw_effects(screen, phase)
+        self.dirty_rects = restore + self.effect_rects
+
+    def draw_full(self, screen, phase, texts):
+        """Paint the whole celebration screen."""
+        screen.fill(self.background_color)
+        for name, widget, alpha, center in texts:
+            widget.set_alpha(alpha)
+            widget.draw(screen, center=center)
+        self.drawn_alphas = {name: alpha for name, _, alpha, _ in texts}
+
+        if self.city == 'nyc' and phase > 0.4:
+            self.draw_neon_flash(screen)
+            self.effect_rects = []
         else:
-            alpha = 255
+            self.effect_rects = self.draw_effects(screen, phase)
+        self.needs_full_redraw = False
 
-        victory_text = self.big_font.render('VICTORY!', True, WHITE)
-        victory_text.set_alpha(alpha)
-        victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
-        screen.blit(victory_text, victory_rect)
+    def visible_texts(self, phase):
+        """(name, widget, alpha, center) for each text showing at this phase."""
+        # Victory text (fade in)
+        texts = [('victory', self.victory_text, int(min(phase / 0.3, 1.0) * 255),
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))]
 
         # Landmark reached (fade in after victory)
         if phase > 0.2:
-            landmark_alpha = int(min((phase - 0.2) / 0.3, 1.0) * 255)
-            landmark_text = self.medium_font.render(f'You reached {self.landmark}!', True, WHITE)
-            landmark_text.set_alpha(landmark_alpha)
-            landmark_rect = landmark_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            screen.blit(landmark_text, landmark_rect)
+            texts.append(('landmark', self.landmark_text, int(min((phase - 0.2) / 0.3, 1.0) * 255),
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
 
-        # City specific celebration elements
+        # Continue prompt (fade in at end)
+        if phase > 0.6:
+            texts.append(('prompt', self.prompt_text, int(min((phase - 0.6) / 0.4, 1.0) * 255),
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)))
+        return texts
+
+    def repaint(self, screen, rect, texts):
+        """Put the background and any texts back inside one rect."""
+        clip = screen.get_clip()
+        screen.set_clip(rect)
+        screen.fill(self.background_color, rect)
+        for _, widget, alpha, center in texts:
+            text_rect = widget.get_rect(center=center)
+            if text_rect.colliderect(rect):
+                widget.set_alpha(alpha)
+                widget.draw(screen, center=center)
+        screen.set_clip(clip)
+
+    def draw_effects(self, screen, phase):
+        """Draw the city's moving celebration elements. Returns the rects they cover."""
+        if phase <= 0.4:
+            return []
         if self.city == 'boston':
             # Baseball confetti
-            if phase > 0.4:
-                self.draw_confetti(screen, (50, 200, 50))  # Green for Green Monster
-
-        elif self.city == 'nyc':
-            # Neon lights effect
-            if phase > 0.4:
-                self.draw_neon_flash(screen)
-
+            return self.draw_confetti(screen, (50, 200, 50))  # Green for Green Monster
         elif self.city == 'chicago':
             # Reflective shine effect
-            if phase > 0.4:
-                self.draw_shine_effect(screen)
-
-        # Continue prompt (fade in at end)
-        if phase > 0.6:
-            prompt_alpha = int(min((phase - 0.6) / 0.4, 1.0) * 255)
-            prompt_text = self.small_font.render('Press ENTER to continue', True, WHITE)
-            prompt_text.set_alpha(prompt_alpha)
-            prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
-            screen.blit(prompt_text, prompt_rect)
+            return [self.draw_shine_effect(screen)]
+        return []
 
     def draw_confetti(self, screen, color):
-        """Draw confetti particles."""
+        """Draw confetti particles. Returns the rects they cover."""
         import random
+        rects = []
         for _ in range(20):
             x = random.randint(0, SCREEN_WIDTH)
             y = random.randint(0, SCREEN_HEIGHT)
             size = random.randint(3, 8)
-            pygame.draw.circle(screen, color, (x, y), size)
+            rects.append(pygame.draw.circle(screen, color, (x, y), size))
+        return rects
 
     def draw_neon_flash(self, screen):
         """Draw neon flashing effect."""
         flash_intensity = int((pygame.time.get_ticks() % 500) / 500 * 100)
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(NYC_COLORS['electric_blue'])
-        overlay.set_alpha(flash_intensity)
-        screen.blit(overlay, (0, 0))
+        self.flash_overlay.set_alpha(flash_intensity)
+        screen.blit(self.flash_overlay, (0, 0))
 
     def draw_shine_effect(self, screen):
-        """Draw reflective shine effect."""
+        """Draw reflective shine effect. Returns the rect it covers."""
         shine_width = 100
         shine_x = (pygame.time.get_ticks() % 3000) / 3000 * (SCREEN_WIDTH + shine_width * 2) - shine_width
         for i in range(shine_width):
             alpha = int((1 - abs(i - shine_width // 2) / (shine_width // 2)) * 100)
             pygame.draw.line(screen, (255, 255, 255, alpha), (shine_x + i, 0), (shine_x + i, SCREEN_HEIGHT), 1)
+        return pygame.Rect(int(shine_x) - 1, 0, shine_width + 2, SCREEN_HEIGHT)
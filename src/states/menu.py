@@ -4,6 +4,7 @@ Main menu state.
 
 import pygame
 from src.states.state import State
+from src.utils.text_cache import text_cache
 from config import *
 
 
@@ -14,9 +15,18 @@ class MainMenu(State):
         super().__init__(game)
         self.title_font = pygame.font.Font(None, 80)
         self.menu_font = pygame.font.Font(None, 50)
+        self.small_font = pygame.font.Font(None, 30)
         self.selected_option = 0
         self.options = ['Start Game', 'Quit']
 
+        # Layout
+        self.background_color = (20, 30, 50)  # Dark blue
+        self.y_start = 400
+        self.y_spacing = 70
+
+        # Which option was highlighted last time we drew (dirty-rect tracking)
+        self.drawn_option = None
+
     def handle_events(self, events):
         """Handle menu input."""
         super().handle_events(events)
@@ -40,15 +50,36 @@ class MainMenu(State):
 
     def update(self, dt):
         """Update menu (animations, etc.)."""
-        pass
+        # Use the idle menu time to get every city's assets ready
+        self.update_warmup()
 
     def draw(self, screen):
-        """Draw main menu."""
-        screen.fill((20, 30, 50))  # Dark blue background
+        """Draw main menu, repainting only what changed since the last frame."""
+        if self.needs_full_redraw or not DIRTY_RECT_RENDERING:
+            self.draw_full(screen)
+            self.dirty_rects = None
+            return
+
+        self.dirty_rects = []
+
+        # Selection moved - repaint just the option list
+        if self.drawn_option != self.selected_option:
+            options_rect = self.get_options_rect()
+            screen.fill(self.background_color, options_rect)
+            self.draw_options(screen)
+            self.dirty_rects.append(options_rect)
+
+        bar_rect = self.draw_warmup_progress(screen, self.background_color)
+        if bar_rect:
+            self.dirty_rects.append(bar_rect)
+
+    def draw_full(self, screen):
+        """Paint the whole menu."""
+        screen.fill(self.background_color)
 
         # Title
-        title_text = self.title_font.render('City Runner', True, WHITE)
-        subtitle_text = self.menu_font.render('Coast to Coast', True, (200, 200, 200))
+        title_text = text_cache.render(self.title_font, 'City Runner', WHITE)
+        subtitle_text = text_cache.render(self.menu_font, 'Coast to Coast', (200, 200, 200))
 
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 270))
@@ -57,22 +88,32 @@ class MainMenu(State):
         screen.blit(subtitle_text, subtitle_rect)
 
         # Menu options
-        y_start = 400
-        y_spacing = 70
+        self.draw_options(screen)
 
+        # Instructions
+        instructions = text_cache.render(self.small_font, 'Use Arrow Keys and Enter', (150, 150, 150))
+        instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+        screen.blit(instructions, instructions_rect)
+
+        self.draw_warmup_progress(screen)
+        self.needs_full_redraw = False
+
+    def get_options_rect(self):
+        """Screen area covered by the option list and its indicator."""
+        height = (len(self.options) - 1) * self.y_spacing + 80
+        return pygame.Rect(SCREEN_WIDTH // 2 - 250, self.y_start - 40, 500, height)
+
+    def draw_options(self, screen):
+        """Draw the option list with the current selection highlighted."""
         for i, option in enumerate(self.options):
             color = BOSTON_COLORS['autumn_orange'] if i == self.selected_option else WHITE
-            text = self.menu_font.render(option, True, color)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_start + i * y_spacing))
+            text = text_cache.render(self.menu_font, option, color)
+            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, self.y_start + i * self.y_spacing))
             screen.blit(text, text_rect)
 
             # Selection indicator
             if i == self.selected_option:
-                indicator = self.menu_font.render('>', True, color)
+                indicator = text_cache.render(self.menu_font, '>', color)
                 screen.blit(indicator, (text_rect.left - 50, text_rect.top))
 
-        # Instructions
-        small_font = pygame.font.Font(None, 30)
-        instructions = small_font.render('Use Arrow Keys and Enter', True, (150, 150, 150))
-        instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        screen.blit(instructions, instructions_rect)
+        self.drawn_option = self.selected_option
@@ -14,6 +14,12 @@ class State:
         self.next_state = None
         self.done = False
 
+        # Dirty-rect rendering: states that support it set dirty_rects in
+        # draw() to the regions they changed. None means the whole screen.
+        self.dirty_rects = None
+        self.needs_full_redraw = True
+        self.warmup_bar_shown = False
+
     def handle_events(self, events):
         """Handle input events. Override in subclasses."""
         for event in events:
@@ -28,6 +34,59 @@ class State:
         """Draw state to screen. Override in subclasses."""
         screen.fill(BLACK)
 
+    def get_dirty_rects(self):
+        """Screen regions changed by the last draw(), or None for the whole screen."""
+        return self.dirty_rects
+
+    def request_full_redraw(self):
+        """Make the next draw() repaint and present the entire screen."""
+        self.needs_full_redraw = True
+        self.dirty_rects = None
+
+    def update_warmup(self):
+        """Start or advance the menu-time asset warmup (not in headless runs)."""
+        warmup = self.game.asset_warmup
+        if self.game.headless:
+            return
+        warmup.start()
+        warmup.pump()
+
+    def get_warmup_rect(self):
+        """Screen area used by the warmup progress bar."""
+        return pygame.Rect(SCREEN_WIDTH - 220, SCREEN_HEIGHT - 30, 200, 8)
+
+    def draw_warmup_progress(self, screen, background_color=None):
+        """
+        Draw a small progress bar while assets are still warming up.
+
+        Args:
+            screen: Surface to draw on
+            background_color: Color to erase the bar with once warmup finishes
+
+        Returns:
+            The rect that was drawn or erased, or None if nothing changed
+        """
+        warmup = self.game.asset_warmup
+        bar_rect = self.get_warmup_rect()
+
+        if warmup is None or not warmup.started or warmup.done:
+            erase = self.warmup_bar_shown and background_color is not None
+            if erase:
+                screen.fill(background_color, bar_rect)
+            self.warmup_bar_shown = False
+            return bar_rect if erase else None
+
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * warmup.progress)
+        pygame.draw.rect(screen, (60, 60, 80), bar_rect)
+        pygame.draw.rect(screen, (150, 150, 170), fill_rect)
+        self.warmup_bar_shown = True
+        return bar_rect
+
+    def asset_requests(self):
+        """Manifest entries to load before entering this state (see asset_manifest)."""
+        return []
+
     def enter_state(self):
         """Called when entering this state."""
         pass
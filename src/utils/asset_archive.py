@@ -0,0 +1,195 @@
+"""
+Packed asset archive.
+
+`python -m src.bake --archive` writes every image the cities load - real
+art scaled to the size it's used at, and baked generator output - into
+one file of raw pixels plus an index:
+
+    b'CRPK' | index length (u32) | JSON index | padding | pixel data
+
+The index maps each baked_key() to [offset, width, height, opaque,
+sources]. Sources are the art files an image was loaded from, or would
+be loaded from if they existed, each with its mtime and size (or None
+when absent). Entries whose sources have since been edited, added or
+removed are dropped when the archive is opened, so the loader goes back
+to the files.
+Pixels are stored as BGRA, which is the layout convert_alpha() gives on
+little-endian machines, so nothing needs converting after loading. The
+AssetLoader opens the archive with mmap and builds surfaces straight
+over the mapped pages with pygame.image.frombuffer - no file lookups,
+no PNG decoding and no copies. Like the bake manifest, an archive from
+another generator version is ignored.
+"""
+
+import json
+import os
+import struct
+
+import pygame
+from config import ASSET_ARCHIVE
+from src.utils.baked_assets import bake_version
+
+try:
+    import mmap
+except ImportError:  # not every web build has it
+    mmap = None
+
+MAGIC = b'CRPK'
+PIXEL_FORMAT = 'BGRA'
+# pixel data starts on this boundary so rows line up for SDL's blitters
+ALIGNMENT = 16
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def file_stamp(path):
+    """[mtime_ns, size] of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class ArchiveWriter:
+    """Collects surfaces by key and writes them out as one archive."""
+
+    def __init__(self):
+        self.surfaces = {}
+        self.sources = {}
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def add(self, key, surface, sources=()):
+        """
+        Args:
+            key: baked_key() for the image
+            surface: The image at the size it's used at
+            sources: Art file paths it came from (or that would replace it)
+        """
+        self.surfaces[key] = surface
+        self.sources[key] = [[path, file_stamp(path)] for path in sources]
+
+    def write(self, path=ASSET_ARCHIVE, version=None):
+        """Write the archive, replacing any existing one."""
+        entries = {}
+        blobs = []
+        offset = 0
+        for key in sorted(self.surfaces):
+            surface = self.surfaces[key]
+            width, height = surface.get_size()
+            opaque = not surface.get_flags() & pygame.SRCALPHA
+            entries[key] = [offset, width, height, opaque, self.sources.get(key, [])]
+            blobs.append(pygame.image.tobytes(surface, PIXEL_FORMAT))
+            offset = _aligned(offset + len(blobs[-1]))
+
+        index = json.dumps({
+            'version': version if version is not None else bake_version(),
+            'entries': entries,
+        }, sort_keys=True).encode()
+        header = MAGIC + struct.pack('<I', len(index)) + index
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(header.ljust(_aligned(len(header)), b'\0'))
+            for blob in blobs:
+                f.write(blob.ljust(_aligned(len(blob)), b'\0'))
+        os.replace(temp_path, path)
+
+
+class AssetArchive:
+    """Read-only view of a packed archive, handing out surfaces over its pixels."""
+
+    def __init__(self, buffer=None, entries=None, data_start=0):
+        self.buffer = buffer
+        self.view = memoryview(buffer) if buffer is not None else None
+        self.entries = entries or {}
+        self.data_start = data_start
+        self.native = None  # whether BGRA matches the display, checked on first use
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    @classmethod
+    def open(cls, path=ASSET_ARCHIVE, version=None):
+        """
+        Map an archive file.
+
+        Returns:
+            AssetArchive (empty if there's no archive or it's unusable)
+        """
+        try:
+            with open(path, 'rb') as f:
+                buffer = None
+                if mmap is not None:
+                    try:
+                        # copy-on-write, so drawing onto a loaded sprite can't touch the file
+                        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                    except (OSError, ValueError):
+                        pass
+                if buffer is None:
+                    buffer = bytearray(os.fstat(f.fileno()).st_size)
+                    f.readinto(buffer)
+        except OSError:
+            return cls()
+
+        try:
+            if buffer[:len(MAGIC)] != MAGIC:
+                raise ValueError('not an asset archive')
+            (index_length,) = struct.unpack_from('<I', buffer, len(MAGIC))
+            index_start = len(MAGIC) + 4
+            index = json.loads(bytes(buffer[index_start:index_start + index_length]))
+        except (struct.error, ValueError) as e:
+            print(f"Warning: Could not read asset archive {path}: {e}")
+            return cls()
+
+        version = version if version is not None else bake_version()
+        if index.get('version') != version:
+            print(f"Warning: Asset archive {path} is out of date, "
+                  f"run 'python -m src.bake --archive' to refresh it")
+            return cls()
+
+        # art edited (or added/removed) since packing beats the archived copy
+        entries = index.get('entries', {})
+        stale = [key for key, entry in entries.items()
+                 if any(file_stamp(path) != stamp for path, stamp in entry[4])]
+        if stale:
+            print(f"Warning: {len(stale)} images in {path} are older than their art files, "
+                  f"run 'python -m src.bake --archive' to refresh them")
+            for key in stale:
+                del entries[key]
+
+        return cls(buffer, entries, _aligned(index_start + index_length))
+
+    def surface(self, key):
+        """
+        Get an archived image as a surface sharing the archive's memory.
+
+        Returns:
+            pygame.Surface, or None if the key isn't in the archive
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        offset, width, height, opaque = entry[:4]
+        start = self.data_start + offset
+        surface = pygame.image.frombuffer(self.view[start:start + width * height * 4], (width, height), PIXEL_FORMAT)
+        if opaque:
+            # blit as a straight copy, like a convert()ed background
+            surface.set_alpha(None)
+        return surface
+
+    def matches_display(self):
+        """Whether archived surfaces are already in the display's pixel format."""
+        if self.native is None:
+            converted = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            archived = pygame.image.frombuffer(bytearray(4), (1, 1), PIXEL_FORMAT)
+            self.native = converted.get_masks() == archived.get_masks()
+        return self.native
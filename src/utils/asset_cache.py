@@ -0,0 +1,253 @@
+"""
+Memory-budgeted surface cache.
+
+The AssetLoader keeps every sprite, animation and background in one
+AssetCache under tuple keys like ('sprite', path, size). Each entry is
+charged the real pixel memory of the surfaces it holds (pitch x height),
+counted once per underlying allocation. Subsurfaces (atlas sprites) are
+charged to their page, and a surface shared by several keys is charged
+once. When the total goes over budget, the least recently used entries
+are dropped first. Pinned entries and entries in a pinned group are
+never dropped.
+
+Groups tie entries to a city. Anything loaded inside grouped('nyc') joins
+the 'nyc' group. Gameplay pins its city's group while it's being played,
+and release_group() drops the whole group in one go.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import pygame
+
+
+def root_surface(surface):
+    """The surface that actually owns a (sub)surface's pixels."""
+    parent = surface.get_parent()
+    while parent is not None:
+        surface = parent
+        parent = surface.get_parent()
+    return surface
+
+
+def surface_bytes(surface):
+    """Pixel memory of a surface that owns its pixels."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class CacheEntry:
+    __slots__ = ('value', 'roots', 'groups', 'pins')
+
+    def __init__(self, value):
+        self.value = value
+        self.roots = []
+        self.groups = set()
+        self.pins = 0
+
+
+class AssetCache:
+    """LRU cache of surfaces (or lists of them) with byte accounting, pins and groups."""
+
+    def __init__(self, budget, related=None):
+        """
+        Args:
+            budget: Bytes of pixel memory to stay under
+            related: Optional callable surface -> surfaces held alongside it
+                     (e.g. its mirrored copy), charged to the same entry
+        """
+        self.budget = budget
+        self.related = related
+        self.entries = OrderedDict()
+        self.roots = {}  # id(root surface) -> [surface, entries using it, bytes]
+        self.bytes_used = 0
+        self.pinned_groups = set()
+        self.evictions = 0
+
+        self.lock = threading.RLock()
+        self.local = threading.local()  # per-thread current group
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    @property
+    def group(self):
+        """Group that loads on this thread are currently added to, or None."""
+        return getattr(self.local, 'group', None)
+
+    @contextmanager
+    def grouped(self, group):
+        """Add everything loaded or looked up on this thread in the block to a group."""
+        previous = self.group
+        self.local.group = group
+        try:
+            yield
+        finally:
+            self.local.group = previous
+
+    def get(self, key, default=None):
+        """Look up an entry, marking it recently used."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            self.entries.move_to_end(key)
+            if self.group is not None:
+                entry.groups.add(self.group)
+            return entry.value
+
+    def peek(self, key, default=None):
+        """Look up an entry without marking it used or adding it to a group."""
+        with self.lock:
+            entry = self.entries.get(key)
+            return default if entry is None else entry.value
+
+    def put(self, key, value, group=None):
+        """
+        Store a surface or list of surfaces, then evict down to the budget.
+
+        Args:
+            key: Cache key (a tuple)
+            value: pygame.Surface, list of them, or a TextureAtlas
+            group: Group to add it to (defaults to the current grouped() one)
+
+        Returns:
+            value
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            groups = set()
+            pins = 0
+            if entry is not None:
+                groups, pins = entry.groups, entry.pins
+                self._release_roots(entry)
+
+            entry = CacheEntry(value)
+            entry.groups = groups
+            entry.pins = pins
+            group = group if group is not None else self.group
+            if group is not None:
+                entry.groups.add(group)
+
+            seen = set()
+            for surface in self._surfaces(value):
+                root = root_surface(surface)
+                if id(root) not in seen:
+                    seen.add(id(root))
+                    entry.roots.append(root)
+                    self._charge(root)
+
+            self.entries[key] = entry
+            self.evict(keep=key)
+            return value
+
+    def _surfaces(self, value):
+        if isinstance(value, pygame.Surface):
+            surfaces = [value]
+        else:
+            # a list of frames, or anything with pages (a TextureAtlas)
+            items = value.pages if hasattr(value, 'pages') else value
+            surfaces = [s for s in items if isinstance(s, pygame.Surface)]
+        if self.related is not None:
+            surfaces += [extra for surface in surfaces for extra in self.related(surface)]
+        return surfaces
+
+    def _charge(self, root):
+        record = self.roots.get(id(root))
+        if record is None:
+            size = surface_bytes(root)
+            self.roots[id(root)] = [root, 1, size]
+            self.bytes_used += size
+        else:
+            record[1] += 1
+
+    def _release_roots(self, entry):
+        for root in entry.roots:
+            record = self.roots[id(root)]
+            record[1] -= 1
+            if record[1] == 0:
+                del self.roots[id(root)]
+                self.bytes_used -= record[2]
+        entry.roots = []
+
+    def is_pinned(self, key):
+        entry = self.entries.get(key)
+        return entry is not None and (entry.pins > 0 or bool(entry.groups & self.pinned_groups))
+
+    def pin(self, key):
+        """Keep one entry from being evicted until unpin()."""
+        with self.lock:
+            self.entries[key].pins += 1
+
+    def unpin(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.pins > 0:
+                entry.pins -= 1
+
+    def pin_group(self, group):
+        """Keep every entry in a group (including ones added later) from being evicted."""
+        with self.lock:
+            self.pinned_groups.add(group)
+
+    def unpin_group(self, group):
+        with self.lock:
+            self.pinned_groups.discard(group)
+            self.evict()
+
+    def release_group(self, group):
+        """
+        Drop a group's entries in one go.
+
+        Entries that also belong to another group, or are pinned on their
+        own, just leave this group and stay.
+
+        Returns:
+            Bytes freed
+        """
+        with self.lock:
+            before = self.bytes_used
+            self.pinned_groups.discard(group)
+            for key, entry in list(self.entries.items()):
+                if group in entry.groups:
+                    entry.groups.discard(group)
+                    if not entry.groups and not self.is_pinned(key):
+                        self._remove(key)
+            return before - self.bytes_used
+
+    def evict(self, keep=None):
+        """Drop least recently used, unpinned entries until under budget."""
+        with self.lock:
+            for key in list(self.entries):
+                if self.bytes_used <= self.budget:
+                    break
+                if key != keep and not self.is_pinned(key):
+                    self._remove(key)
+                    self.evictions += 1
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self._release_roots(entry)
+
+    def keys(self, group=None):
+        """Cache keys, optionally only one group's."""
+        with self.lock:
+            return [key for key, entry in self.entries.items() if group is None or group in entry.groups]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.roots.clear()
+            self.bytes_used = 0
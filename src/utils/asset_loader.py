@@ -1,34 +1,84 @@
 # loads sprites and backgrounds, creates placeholders if files are missing
+# (sprite_generator is big, so it's only imported once something needs drawing)
 
 import pygame
 import os
-from config import SPRITES_DIR, BACKGROUNDS_DIR
-from src.utils import sprite_generator
+import sys
+import threading
+import weakref
+from config import SPRITES_DIR, BACKGROUNDS_DIR, ASSET_CACHE_BUDGET, ASSET_CACHE_BUDGET_WEB
+from src.utils.asset_archive import AssetArchive
+from src.utils.asset_cache import AssetCache
+from src.utils.disk_cache import SurfaceDiskCache
+from src.utils.texture_atlas import TextureAtlas
+from src.utils.baked_assets import BakedAssets, baked_key
+
+
+def animation_frame_names(frame_prefix, index):
+    """File names tried for one animation frame, in order."""
+    return [
+        f"{frame_prefix}{index}.png",
+        f"{frame_prefix}{index:02d}.png",
+        f"{frame_prefix}{index+1}.png",
+        f"{frame_prefix}{index+1:02d}.png",
+    ]
 
 
 class AssetLoader:
 
-    def __init__(self):
-        self.sprite_cache = {}
-        self.background_cache = {}
+    def __init__(self, baked=None, budget=None, archive=None):
+        if budget is None:
+            budget = ASSET_CACHE_BUDGET_WEB if sys.platform == 'emscripten' else ASSET_CACHE_BUDGET
+
+        # original surface -> horizontally flipped copy, made once at load time
+        self.mirror_cache = weakref.WeakKeyDictionary()
+
+        # sprites, animations, backgrounds and atlases under tuple keys, kept
+        # within budget bytes (a surface's mirror is charged along with it)
+        self.cache = AssetCache(budget, related=self._mirror_of)
+
+        # the warmup thread and async load workers fill the caches too, so every
+        # check-then-store and mirror_cache change happens under the cache's lock
+        self.lock = self.cache.lock
+
+        # surfaces loaded off the main thread skip convert(); cache key ->
+        # (stored value, alpha) until convert_pending() runs on the main thread
+        self.unconverted = {}
+        self.local = threading.local()
+
+        # generated backgrounds survive restarts here
+        self.disk_cache = SurfaceDiskCache()
+
+        # pre-baked generator output (python -m src.bake), tried before generating
+        self.baked = baked if baked is not None else BakedAssets.load()
+
+        # packed, memory-mapped copy of everything (python -m src.bake --archive),
+        # tried before any image file
+        self.archive = archive if archive is not None else AssetArchive.open()
 
     def load_sprite(self, path, size=None, fallback_color=(255, 0, 255)):
-        cache_key = f"{path}_{size}"
+        cache_key = ('sprite', path, size)
 
         # check if we already loaded this
-        if cache_key in self.sprite_cache:
-            return self.sprite_cache[cache_key]
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
+        archived = self._load_archived(baked_key('sprite', path, size))
+        if archived is not None:
+            self.get_mirrored(archived)
+            return self._store(cache_key, archived)
 
         full_path = os.path.join(SPRITES_DIR, path)
 
         # try to load from file
         if os.path.exists(full_path):
             try:
-                image = pygame.image.load(full_path).convert_alpha()
+                image = self._convert(pygame.image.load(full_path))
                 if size:
                     image = pygame.transform.scale(image, size)
-                self.sprite_cache[cache_key] = image
-                return image
+                self.get_mirrored(image)
+                return self._store(cache_key, image)
             except pygame.error as e:
                 print(f"Warning: Could not load sprite {path}: {e}")
 
@@ -38,11 +88,200 @@ class AssetLoader:
         else:
             width, height = 32, 32
 
-        placeholder = self._generate_sprite(path, width, height, fallback_color)
-        self.sprite_cache[cache_key] = placeholder
-        return placeholder
+        placeholder = self._load_baked(baked_key('sprite', path, (width, height)))
+        if placeholder is None:
+            placeholder = self._generate_sprite(path, width, height, fallback_color)
+        self.get_mirrored(placeholder)
+        return self._store(cache_key, placeholder)
+
+    def get_mirrored(self, surface):
+        """
+        Get the horizontally flipped version of a surface.
+
+        Sprites and animation frames get their mirror made when they're
+        loaded, so drawing a left-facing entity is just a lookup.
+        """
+        with self.lock:
+            mirrored = self.mirror_cache.get(surface)
+            if mirrored is None:
+                mirrored = pygame.transform.flip(surface, True, False)
+                self.mirror_cache[surface] = mirrored
+            return mirrored
+
+    def _mirror_of(self, surface):
+        mirrored = self.mirror_cache.get(surface)
+        return [mirrored] if mirrored is not None else []
+
+    def _cached(self, cache_key):
+        """Cache lookup that first converts anything a worker thread left unconverted."""
+        if self.unconverted and threading.current_thread() is threading.main_thread():
+            self.convert_pending()
+        return self.cache.get(cache_key)
+
+    def _store(self, cache_key, value, alpha=True):
+        """
+        Cache a freshly loaded value, unless another thread got there first.
+
+        Returns:
+            Whichever value ended up cached, so every caller shares one copy
+        """
+        deferred = getattr(self.local, 'deferred', False)
+        self.local.deferred = False
+        with self.lock:
+            existing = self.cache.get(cache_key)
+            if existing is not None:
+                return existing
+            if deferred:
+                self.unconverted[cache_key] = (value, alpha)
+            return self.cache.put(cache_key, value)
+
+    def _convert(self, image, alpha=True):
+        """
+        Convert an image to the display format.
+
+        Off the main thread the image is returned as is and the next _store()
+        queues it for convert_pending(), since SDL's video calls aren't safe
+        from worker threads.
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        if threading.current_thread() is not threading.main_thread():
+            self.local.deferred = True
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+    def convert_pending(self):
+        """
+        Convert everything worker threads cached unconverted. Main thread only.
+
+        Entries evicted or replaced (say by pack_atlas) in the meantime are
+        skipped. Mirrors are remade from the converted surfaces.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        with self.lock:
+            pending = self.unconverted
+            self.unconverted = {}
+            for cache_key, (value, alpha) in pending.items():
+                if self.cache.peek(cache_key) is not value:
+                    continue
+                if isinstance(value, pygame.Surface):
+                    converted = self._convert_with_mirror(value, alpha)
+                else:
+                    converted = [self._convert_with_mirror(frame, alpha) for frame in value]
+                self.cache.put(cache_key, converted)
+
+    def _convert_with_mirror(self, surface, alpha):
+        converted = self._convert(surface, alpha)
+        if surface in self.mirror_cache:
+            self.get_mirrored(converted)
+        return converted
+
+    def load_generated(self, name, size, builder):
+        """
+        Get a procedurally drawn surface, drawing it only the first time.
+
+        Args:
+            name: Logical name for the surface (e.g. "platforms/boston/stoop")
+            size: Tuple (width, height) passed to the builder
+            builder: Callable (width, height) -> pygame.Surface
+
+        Returns:
+            The cached pygame.Surface
+        """
+        cache_key = ('generated', name, size)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
+        surface = self._load_baked(baked_key('generated', name, size))
+        if surface is None:
+            surface = builder(*size)
+        return self._store(cache_key, surface)
+
+    def pack_atlas(self, name, entries):
+        """
+        Pack the sprites and animation frames from manifest entries onto one atlas.
+
+        Each entry is loaded as usual, then its cache slot is pointed at a
+        subsurface of the atlas (with the mirrored copy packed alongside),
+        so everything created afterwards draws from the shared pages.
+        Backgrounds are skipped - they're full-screen anyway.
+
+        Args:
+            name: Atlas name (e.g. the city)
+            entries: Manifest entries from asset_manifest
+
+        Returns:
+            The TextureAtlas
+        """
+        atlas = self._cached(('atlas', name))
+        if atlas is not None:
+            return atlas
+
+        items = []
+        slots = []  # (cache key, atlas keys of its surfaces, single sprite?)
+        for entry in entries:
+            if entry['kind'] == 'sprite':
+                surface = self.load_sprite(entry['path'], entry['size'])
+                key = f"{entry['path']}_{entry['size']}"
+                items.append((key, surface))
+                slots.append((('sprite', entry['path'], entry['size']), [key], True))
+            elif entry['kind'] == 'animation':
+                frames = self.load_animation_frames(
+                    entry['path'], entry['prefix'], entry['frames'], entry['size'], entry['color']
+                )
+                prefix = f"anim_{entry['path']}/{entry['prefix']}{entry['frames']}_{entry['size']}"
+                keys = [f"{prefix}#{i}" for i in range(len(frames))]
+                items += zip(keys, frames)
+                slots.append((('animation', entry['path'], entry['prefix'], entry['frames'], entry['size']), keys, False))
+
+        # mirrors go in too, so left-facing sprites share the pages as well
+        items += [(f"{key}@mirrored", self.get_mirrored(surface)) for key, surface in items]
+
+        atlas = TextureAtlas()
+        atlas.pack(items)
+        atlas.finish()
+        if pygame.display.get_surface() is not None:
+            atlas.convert()
+
+        # the atlas goes in first so the pages are only charged once it holds them
+        with self.lock:
+            self.cache.put(('atlas', name), atlas)
+            for cache_key, keys, single in slots:
+                packed = [atlas.get(key) for key in keys]
+                for key, surface in zip(keys, packed):
+                    self.mirror_cache[surface] = atlas.get(f"{key}@mirrored")
+                self.cache.put(cache_key, packed[0] if single else packed)
+
+        return atlas
+
+    def _load_archived(self, key, alpha=True):
+        """Get an image from the packed archive by key, or None if it isn't there."""
+        image = self.archive.surface(key)
+        if image is not None and pygame.display.get_surface() is not None and not self.archive.matches_display():
+            image = self._convert(image, alpha)
+        return image
+
+    def _load_baked(self, key, alpha=True):
+        """Load a baked image by manifest key, or None if there isn't a usable one."""
+        image = self._load_archived(key, alpha)
+        if image is not None:
+            return image
+
+        path = self.baked.path(key)
+        if path is None:
+            return None
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Warning: Could not load baked asset {path}: {e}")
+            return None
+        return self._convert(image, alpha)
 
     def _generate_sprite(self, path, width, height, fallback_color):
+        from src.utils import sprite_generator
+
         # generate sprites based on name
         path_lower = path.lower()
 
@@ -132,16 +371,22 @@ class AssetLoader:
         Returns:
             List of pygame.Surface objects (animation frames)
         """
+        cache_key = ('animation', directory, frame_prefix, num_frames, size)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
         frames = []
 
         for i in range(num_frames):
+            # the archive knows which file a frame came from, so no guessing
+            archived = self._load_archived(baked_key('animation', f"{directory}/{frame_prefix}", size, i))
+            if archived is not None:
+                frames.append(archived)
+                continue
+
             # Try common naming patterns
-            possible_names = [
-                f"{frame_prefix}{i}.png",
-                f"{frame_prefix}{i:02d}.png",
-                f"{frame_prefix}{i+1}.png",
-                f"{frame_prefix}{i+1:02d}.png",
-            ]
+            possible_names = animation_frame_names(frame_prefix, i)
 
             loaded = False
             for name in possible_names:
@@ -150,7 +395,7 @@ class AssetLoader:
 
                 if os.path.exists(full_path):
                     try:
-                        image = pygame.image.load(full_path).convert_alpha()
+                        image = self._convert(pygame.image.load(full_path))
                         if size:
                             image = pygame.transform.scale(image, size)
                         frames.append(image)
@@ -166,8 +411,14 @@ class AssetLoader:
                 else:
                     width, height = 32, 32
 
+                placeholder = self._load_baked(
+                    baked_key('animation', f"{directory}/{frame_prefix}", (width, height), i))
+
                 # Generate player animation frames
-                if 'player' in directory.lower():
+                if placeholder is not None:
+                    pass
+                elif 'player' in directory.lower():
+                    from src.utils import sprite_generator
                     if 'idle' in directory.lower():
                         placeholder = sprite_generator.draw_player_idle(width, height)
                     elif 'run' in directory.lower():
@@ -182,7 +433,10 @@ class AssetLoader:
 
                 frames.append(placeholder)
 
-        return frames
+        for frame in frames:
+            self.get_mirrored(frame)
+
+        return self._store(cache_key, frames)
 
     def load_background(self, path, size=None, fallback_color=(50, 50, 80)):
         """
@@ -196,22 +450,26 @@ class AssetLoader:
         Returns:
             pygame.Surface with the background
         """
-        cache_key = f"bg_{path}_{size}"
+        cache_key = ('background', path, size)
 
         # Check cache
-        if cache_key in self.background_cache:
-            return self.background_cache[cache_key]
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
+        archived = self._load_archived(baked_key('background', path, size), alpha=False)
+        if archived is not None:
+            return self._store(cache_key, archived, alpha=False)
 
         full_path = os.path.join(BACKGROUNDS_DIR, path)
 
         # Try to load the image
         if os.path.exists(full_path):
             try:
-                image = pygame.image.load(full_path).convert()
+                image = self._convert(pygame.image.load(full_path), alpha=False)
                 if size:
                     image = pygame.transform.scale(image, size)
-                self.background_cache[cache_key] = image
-                return image
+                return self._store(cache_key, image, alpha=False)
             except pygame.error as e:
                 print(f"Warning: Could not load background {path}: {e}")
 
@@ -230,14 +488,37 @@ class AssetLoader:
         elif 'boston' in path.lower():
             city_name = 'boston'
 
-        background = sprite_generator.create_city_background(width, height, city_name)
-        self.background_cache[cache_key] = background
-        return background
+        # cached under its city, not this path, so one entry owns the surface
+        return self._generated_background(city_name, width, height)
+
+    def _generated_background(self, city_name, width, height):
+        """Get a generated city background from memory, the disk cache, or the generator."""
+        # every layer of a city shares the same generated image
+        cache_key = ('generated_background', city_name, (width, height))
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
+        # archived and baked images come back display-ready
+        background = self._load_baked(baked_key('background', city_name, (width, height)), alpha=False)
+        if background is None:
+            disk_name = f"background_{city_name}"
+            background = self.disk_cache.load(disk_name, (width, height))
+            if background is None:
+                from src.utils import sprite_generator
+                background = sprite_generator.create_city_background(width, height, city_name)
+                self.disk_cache.save(disk_name, (width, height), background)
+
+            background = self._convert(background, alpha=False)
+
+        return self._store(cache_key, background, alpha=False)
 
     def clear_cache(self):
         """Clear all cached assets."""
-        self.sprite_cache.clear()
-        self.background_cache.clear()
+        with self.lock:
+            self.cache.clear()
+            self.mirror_cache.clear()
+            self.unconverted.clear()
 
 
 # Global asset loader instance
@@ -0,0 +1,92 @@
+"""
+Manifest of the assets each city asks the AssetLoader for.
+
+Every entry describes one load call (kind, path, size), so tools that want
+to prepare assets ahead of time - warmup, baking, batch loading - all work
+from the same list the game itself uses.
+"""
+
+from config import *
+
+
+def city_asset_manifest(city):
+    """
+    List the assets a city needs.
+
+    Args:
+        city: City key (e.g. 'boston')
+
+    Returns:
+        List of dicts with a 'kind' of 'background', 'sprite' or 'animation'
+    """
+    entries = []
+
+    # Parallax layers (see Level.load_backgrounds)
+    for i in range(3):
+        entries.append({
+            'kind': 'background',
+            'path': f"{city}/layer_{i}.png",
+            'size': (SCREEN_WIDTH, SCREEN_HEIGHT),
+        })
+
+    # Enemies (see Enemy.load_sprite)
+    for enemy_type in CITY_ENEMIES.get(city, []):
+        stats = ENEMY_TYPES[enemy_type]
+        entries.append({
+            'kind': 'sprite',
+            'path': f"enemies/{enemy_type}/{enemy_type}.png",
+            'size': (stats['width'], stats['height']),
+        })
+
+    # Collectibles (see Collectible.load_sprite)
+    for collectible_type in CITY_COLLECTIBLES.get(city, []):
+        entries.append({
+            'kind': 'sprite',
+            'path': f"collectibles/{collectible_type}.png",
+            'size': (COLLECTIBLE_SIZE, COLLECTIBLE_SIZE),
+        })
+
+    entries.extend(player_asset_manifest())
+    return entries
+
+
+def player_asset_manifest():
+    """List the player's animation frames (see Player.load_sprites)."""
+    return [
+        {
+            'kind': 'animation',
+            'path': directory,
+            'prefix': prefix,
+            'frames': num_frames,
+            'size': (PLAYER_WIDTH, PLAYER_HEIGHT),
+            'color': color,
+        }
+        for directory, prefix, num_frames, color in PLAYER_ANIMATIONS.values()
+    ]
+
+
+def full_asset_manifest(cities=CITIES):
+    """List every asset for the given cities, without duplicates."""
+    entries = []
+    seen = set()
+    for city in cities:
+        for entry in city_asset_manifest(city):
+            key = (entry['kind'], entry['path'], entry['size'])
+            if key not in seen:
+                seen.add(key)
+                entries.append(entry)
+    return entries
+
+
+def load_manifest_entry(loader, entry):
+    """Load one manifest entry through an AssetLoader, filling its caches."""
+    kind = entry['kind']
+    if kind == 'background':
+        return loader.load_background(entry['path'], entry['size'])
+    elif kind == 'sprite':
+        return loader.load_sprite(entry['path'], entry['size'])
+    elif kind == 'animation':
+        return loader.load_animation_frames(
+            entry['path'], entry['prefix'], entry['frames'], entry['size'], entry['color']
+        )
+    raise ValueError(f"Unknown asset kind: {kind}")
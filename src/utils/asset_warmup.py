@@ -0,0 +1,95 @@
+"""
+Background asset warmup.
+
+While the menus are up, every city's backgrounds and sprites get generated
+into the asset loader's caches so starting a level doesn't stall. On
+desktop this runs on a worker thread, and the menus' per-frame pump()
+converts what it loaded to the display format on the main thread; where
+threads aren't available (the pygbag web build) pump() does the loading
+itself, a few milliseconds per frame.
+"""
+
+import sys
+import threading
+import time
+
+from config import CITIES, WARMUP_FRAME_BUDGET
+from src.utils.asset_loader import asset_loader
+from src.utils.asset_manifest import full_asset_manifest, load_manifest_entry
+
+
+def threads_available():
+    """Check whether we can start real threads on this platform."""
+    return sys.platform != 'emscripten'
+
+
+class AssetWarmup:
+    """Pre-generates assets for all cities without blocking the frame loop."""
+
+    def __init__(self, loader=asset_loader, cities=CITIES):
+        self.loader = loader
+        self.jobs = full_asset_manifest(cities)
+        self.completed = 0
+        self.started = False
+        self.thread = None
+        self.failed = []
+
+    @property
+    def total(self):
+        return len(self.jobs)
+
+    @property
+    def progress(self):
+        """Fraction of jobs finished, 0.0 to 1.0."""
+        return self.completed / self.total if self.jobs else 1.0
+
+    @property
+    def done(self):
+        return self.completed >= self.total
+
+    def start(self):
+        """Begin warming up. Safe to call more than once."""
+        if self.started:
+            return
+        self.started = True
+
+        if threads_available():
+            self.thread = threading.Thread(target=self._run_all, name='asset-warmup', daemon=True)
+            self.thread.start()
+
+    def pump(self, budget_ms=WARMUP_FRAME_BUDGET):
+        """
+        Do a slice of work on the calling thread. Call once per frame.
+
+        When a worker thread is doing the job instead, this just converts
+        what it has loaded so far to the display format (which has to
+        happen on the main thread).
+        """
+        if not self.started:
+            return
+        if self.thread is not None:
+            self.loader.convert_pending()
+            return
+
+        deadline = time.perf_counter() + budget_ms / 1000
+        # always make some progress, even if one job blows the budget
+        while not self.done:
+            self._run_job()
+            if time.perf_counter() >= deadline:
+                break
+
+    def _run_all(self):
+        while not self.done:
+            self._run_job()
+            # let the main thread have the GIL between jobs
+            time.sleep(0)
+
+    def _run_job(self):
+        entry = self.jobs[self.completed]
+        try:
+            load_manifest_entry(self.loader, entry)
+        except Exception as e:
+            # a broken asset shouldn't stop the rest from warming up
+            print(f"Warning: Could not warm up {entry['path']}: {e}")
+            self.failed.append(entry)
+        self.completed += 1
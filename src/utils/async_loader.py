@@ -0,0 +1,89 @@
+"""
+Cooperative batch asset loading for asyncio.
+
+load_assets() takes a list of asset manifest entries and fills the asset
+loader's caches without blocking the event loop. On desktop the entries
+are decoded or generated on a small thread pool while the loop stays
+free; converting each result to the display format, which SDL only
+allows on the main thread, happens back on the loop as it completes.
+In the pygbag web build there are no threads, so each entry is
+loaded in turn with a yield back to the browser after it, which keeps
+the page responsive while the same manifest loads.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from config import ASYNC_LOAD_WORKERS
+from src.utils.asset_loader import asset_loader
+from src.utils.asset_manifest import load_manifest_entry
+from src.utils.asset_warmup import threads_available
+
+_executor = None
+
+
+def get_executor():
+    """Shared loader thread pool, created on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=ASYNC_LOAD_WORKERS, thread_name_prefix='asset-load')
+    return _executor
+
+
+def _load_entry(loader, entry):
+    try:
+        return load_manifest_entry(loader, entry)
+    except Exception as e:
+        # one broken asset shouldn't fail the whole batch
+        print(f"Warning: Could not load {entry['path']}: {e}")
+        return None
+
+
+async def load_assets(entries, loader=asset_loader, on_progress=None, use_threads=None):
+    """
+    Load a batch of assets into the loader's caches without blocking the loop.
+
+    Args:
+        entries: Manifest entries (see asset_manifest)
+        loader: AssetLoader whose caches get filled
+        on_progress: Optional callable (completed, total), called after each entry
+        use_threads: Force the thread pool on or off (default: on where threads exist)
+
+    Returns:
+        List of loaded surfaces (or frame lists), in entry order; None where loading failed
+    """
+    entries = list(entries)
+    total = len(entries)
+    results = [None] * total
+    if use_threads is None:
+        use_threads = threads_available()
+
+    if use_threads:
+        loop = asyncio.get_running_loop()
+        executor = get_executor()
+
+        async def run(index, entry):
+            results[index] = await loop.run_in_executor(executor, _load_entry, loader, entry)
+            return index
+
+        pending = [run(i, entry) for i, entry in enumerate(entries)]
+        for completed, task in enumerate(asyncio.as_completed(pending), 1):
+            await task
+            # workers can't convert to the display format, so it's done here
+            loader.convert_pending()
+            if on_progress is not None:
+                on_progress(completed, total)
+
+        # hand back the converted copies that are now cached
+        for i, entry in enumerate(entries):
+            if results[i] is not None:
+                results[i] = _load_entry(loader, entry)
+    else:
+        for i, entry in enumerate(entries):
+            results[i] = _load_entry(loader, entry)
+            if on_progress is not None:
+                on_progress(i + 1, total)
+            # give the browser a turn between items
+            await asyncio.sleep(0)
+
+    return results
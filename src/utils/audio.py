@@ -1,24 +1,122 @@
 """
 Audio manager for music and sound effects.
 Handles loading, playing, and volume control for all game audio.
+
+Sounds are listed by name in the audio manifest (AUDIO_MANIFEST) and
+nothing is decoded up front: a sound effect or ambient loop is decoded
+the first time it plays, or when a city prefetches its set. Decoded
+sounds are kept within AUDIO_MEMORY_BUDGET, dropping the least recently
+used ones that aren't playing. Music is never decoded into memory - it
+always streams through pygame.mixer.music. Sound effects go through a
+VoicePool so a crowded moment can't swamp the mixer.
 """
 
-import pygame
+import json
 import os
-from config import AUDIO_DIR, MUSIC_VOLUME, SFX_VOLUME, AMBIENT_VOLUME
+from collections import OrderedDict
+
+import pygame
+from src.utils.voice_pool import VoicePool
+from config import AUDIO_DIR, AUDIO_MANIFEST, AUDIO_MEMORY_BUDGET, MUSIC_VOLUME, SFX_VOLUME, AMBIENT_VOLUME
+
+# Kinds that get decoded into pygame.mixer.Sound
+DECODED_KINDS = ('sfx', 'ambient')
+
+
+def load_audio_manifest(path=AUDIO_MANIFEST):
+    """
+    Read the audio manifest.
+
+    Returns:
+        Dict with 'music', 'sfx' and 'ambient' (name -> path relative to
+        AUDIO_DIR) and 'cities' (city -> its music, sfx and ambient names)
+    """
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read audio manifest {path}: {e}")
+        manifest = {}
+
+    for key in ('music', 'sfx', 'ambient', 'cities'):
+        manifest.setdefault(key, {})
+    return manifest
+
+
+def sound_size(sound):
+    """Bytes of decoded sample data in a Sound, from its length and the mixer format."""
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+
+class SoundCache:
+    """Decoded sounds kept under a byte budget, least recently used dropped first."""
+
+    def __init__(self, budget=AUDIO_MEMORY_BUDGET):
+        self.budget = budget
+        self.entries = OrderedDict()  # (kind, name) -> (Sound, bytes)
+        self.bytes_used = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, sound):
+        size = sound_size(sound)
+        self.entries[key] = (sound, size)
+        self.bytes_used += size
+        self.evict(keep=key)
+
+    def evict(self, keep=None):
+        """Drop old sounds until under budget. Sounds still playing are kept."""
+        for key in list(self.entries):
+            if self.bytes_used <= self.budget:
+                break
+            sound, size = self.entries[key]
+            if key == keep or sound.get_num_channels() > 0:
+                continue
+            del self.entries[key]
+            self.bytes_used -= size
+
+    def sounds(self, kind):
+        """Decoded sounds of one kind."""
+        return [sound for (sound_kind, _), (sound, _) in self.entries.items() if sound_kind == kind]
 
 
 class AudioManager:
     """Manages all game audio including music, SFX, and ambient sounds."""
 
-    def __init__(self):
+    def __init__(self, manifest_path=AUDIO_MANIFEST, budget=AUDIO_MEMORY_BUDGET, audio_dir=AUDIO_DIR):
         """Initialize the audio manager."""
-        pygame.mixer.init()
+        # No sound device (CI, some browsers before a click) - everything becomes a no-op
+        try:
+            pygame.mixer.init()
+            self.enabled = True
+        except pygame.error as e:
+            print(f"Warning: Audio disabled: {e}")
+            self.enabled = False
+
+        self.audio_dir = audio_dir
+        self.manifest = load_audio_manifest(manifest_path)
+
+        # Music tracks by name -> file path (streamed, never decoded)
+        self.music = {name: os.path.join(audio_dir, path) for name, path in self.manifest['music'].items()}
 
-        # Storage for loaded sounds
-        self.music = {}
-        self.sfx = {}
-        self.ambient = {}
+        # Decoded sfx and ambient sounds, plus names known not to load
+        self.sounds = SoundCache(budget)
+        self.unavailable = set()
+
+        # Reserved channels that sound effects compete for by priority
+        self.voices = VoicePool() if self.enabled else None
 
         # Current playing track
         self.current_music = None
@@ -28,42 +126,61 @@ class AudioManager:
         self.sfx_volume = SFX_VOLUME
         self.ambient_volume = AMBIENT_VOLUME
 
-        # Load audio files
-        self.load_audio()
-
-    def load_audio(self):
-        """Load all audio files from assets directory."""
-        # Load music (if files exist)
-        music_dir = os.path.join(AUDIO_DIR, 'music')
-        if os.path.exists(music_dir):
-            for filename in os.listdir(music_dir):
-                if filename.endswith(('.ogg', '.mp3', '.wav')):
-                    name = os.path.splitext(filename)[0]
-                    self.music[name] = os.path.join(music_dir, filename)
-
-        # Load SFX (if files exist)
-        sfx_dir = os.path.join(AUDIO_DIR, 'sfx')
-        if os.path.exists(sfx_dir):
-            for filename in os.listdir(sfx_dir):
-                if filename.endswith('.wav'):
-                    name = os.path.splitext(filename)[0]
-                    try:
-                        self.sfx[name] = pygame.mixer.Sound(os.path.join(sfx_dir, filename))
-                        self.sfx[name].set_volume(self.sfx_volume)
-                    except pygame.error:
-                        pass  # Skip if file can't be loaded
-
-        # Load ambient sounds (if files exist)
-        ambient_dir = os.path.join(AUDIO_DIR, 'ambient')
-        if os.path.exists(ambient_dir):
-            for filename in os.listdir(ambient_dir):
-                if filename.endswith(('.ogg', '.wav')):
-                    name = os.path.splitext(filename)[0]
-                    try:
-                        self.ambient[name] = pygame.mixer.Sound(os.path.join(ambient_dir, filename))
-                        self.ambient[name].set_volume(self.ambient_volume)
-                    except pygame.error:
-                        pass  # Skip if file can't be loaded
+    def get_sound(self, kind, name):
+        """
+        Get a decoded sound, decoding it on first use.
+
+        Args:
+            kind: 'sfx' or 'ambient'
+            name: Sound name from the manifest
+
+        Returns:
+            pygame.mixer.Sound, or None if it isn't available
+        """
+        key = (kind, name)
+        sound = self.sounds.get(key)
+        if sound is not None or not self.enabled or key in self.unavailable:
+            return sound
+
+        path = self.manifest[kind].get(name)
+        full_path = os.path.join(self.audio_dir, path) if path else None
+        if full_path is None or not os.path.exists(full_path):
+            self.unavailable.add(key)
+            return None
+
+        try:
+            sound = pygame.mixer.Sound(full_path)
+        except pygame.error:
+            self.unavailable.add(key)  # Skip if file can't be loaded
+            return None
+
+        sound.set_volume(self.sfx_volume if kind == 'sfx' else self.ambient_volume)
+        self.sounds.put(key, sound)
+        return sound
+
+    def prefetch_city(self, city):
+        """
+        Decode a city's sound effects and ambient loops ahead of time.
+
+        Args:
+            city: City key (e.g. 'nyc')
+
+        Returns:
+            Number of sounds now decoded for the city
+        """
+        listing = self.manifest['cities'].get(city, {})
+        loaded = 0
+        for kind in DECODED_KINDS:
+            for name in listing.get(kind, []):
+                if self.get_sound(kind, name) is not None:
+                    loaded += 1
+        return loaded
+
+    def play_city_music(self, city, loops=-1, fade_ms=1000):
+        """Play the music track the manifest lists for a city."""
+        track = self.manifest['cities'].get(city, {}).get('music')
+        if track:
+            self.play_music(track, loops, fade_ms)
 
     def play_music(self, track_name, loops=-1, fade_ms=1000):
         """
@@ -74,9 +191,12 @@ class AudioManager:
             loops: Number of times to loop (-1 for infinite)
             fade_ms: Fade in time in milliseconds
         """
-        if track_name in self.music and track_name != self.current_music:
+        if not self.enabled or track_name == self.current_music:
+            return
+        path = self.music.get(track_name)
+        if path and os.path.exists(path):
             try:
-                pygame.mixer.music.load(self.music[track_name])
+                pygame.mixer.music.load(path)
                 pygame.mixer.music.set_volume(self.music_volume)
                 pygame.mixer.music.play(loops, fade_ms=fade_ms)
                 self.current_music = track_name
@@ -90,6 +210,8 @@ class AudioManager:
         Args:
             fade_ms: Fade out time in milliseconds
         """
+        if not self.enabled:
+            return
         if fade_ms > 0:
             pygame.mixer.music.fadeout(fade_ms)
         else:
@@ -103,8 +225,9 @@ class AudioManager:
         Args:
             sfx_name: Name of the sound effect (without extension)
         """
-        if sfx_name in self.sfx:
-            self.sfx[sfx_name].play()
+        sound = self.get_sound('sfx', sfx_name)
+        if sound is not None:
+            self.voices.play(sfx_name, sound)
 
     def play_ambient(self, ambient_name, loops=-1):
         """
@@ -114,8 +237,9 @@ class AudioManager:
             ambient_name: Name of the ambient sound (without extension)
             loops: Number of times to loop (-1 for infinite)
         """
-        if ambient_name in self.ambient:
-            self.ambient[ambient_name].play(loops=loops)
+        sound = self.get_sound('ambient', ambient_name)
+        if sound is not None:
+            sound.play(loops=loops)
 
     def stop_ambient(self, ambient_name):
         """
@@ -124,8 +248,10 @@ class AudioManager:
         Args:
             ambient_name: Name of the ambient sound to stop
         """
-        if ambient_name in self.ambient:
-            self.ambient[ambient_name].stop()
+        # never decoded means it can't be playing
+        sound = self.sounds.get(('ambient', ambient_name))
+        if sound is not None:
+            sound.stop()
 
     def set_music_volume(self, volume):
         """
@@ -135,7 +261,8 @@ class AudioManager:
             volume: Volume level from 0.0 (silent) to 1.0 (max)
         """
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if self.enabled:
+            pygame.mixer.music.set_volume(self.music_volume)
 
     def set_sfx_volume(self, volume):
         """
@@ -145,7 +272,7 @@ class AudioManager:
             volume: Volume level from 0.0 (silent) to 1.0 (max)
         """
         self.sfx_volume = max(0.0, min(1.0, volume))
-        for sound in self.sfx.values():
+        for sound in self.sounds.sounds('sfx'):
             sound.set_volume(self.sfx_volume)
 
     def set_ambient_volume(self, volume):
@@ -156,13 +283,15 @@ class AudioManager:
             volume: Volume level from 0.0 (silent) to 1.0 (max)
         """
         self.ambient_volume = max(0.0, min(1.0, volume))
-        for sound in self.ambient.values():
+        for sound in self.sounds.sounds('ambient'):
             sound.set_volume(self.ambient_volume)
 
     def pause_music(self):
         """Pause currently playing music."""
-        pygame.mixer.music.pause()
+        if self.enabled:
+            pygame.mixer.music.pause()
 
     def unpause_music(self):
         """Resume paused music."""
-        pygame.mixer.music.unpause()
+        if self.enabled:
+            pygame.mixer.music.unpause()
@@ -0,0 +1,108 @@
+"""
+Index of pre-baked generated assets.
+
+`python -m src.bake` runs every sprite_generator function at every size
+the game asks for and writes the results as PNGs under BAKED_DIR, along
+with manifest.json mapping each load request to its file. The
+AssetLoader checks here before generating anything, so a baked build
+never runs the generators at startup or level entry.
+
+The manifest records the version of the generators it was baked with
+(a hash of every source file the bake draws with); if any of them has
+changed since, the whole bake is ignored rather than serving stale art.
+"""
+
+import json
+import os
+from config import BAKED_DIR
+from src.utils.disk_cache import GENERATOR_SOURCE, generator_version
+
+MANIFEST_NAME = 'manifest.json'
+
+# Everything src.bake draws with: the sprite generators, Boston's platform
+# renderer, and the loader that maps each key to its generator call
+BAKE_SOURCES = (
+    GENERATOR_SOURCE,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'asset_loader.py'),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'levels', 'boston.py'),
+)
+
+
+def bake_version():
+    """Version stamp for baked output - changes whenever a generator does."""
+    return generator_version(BAKE_SOURCES)
+
+
+def baked_key(kind, name, size, frame=None):
+    """
+    Key for one baked image.
+
+    Args:
+        kind: 'sprite', 'animation', 'background' or 'generated'
+        name: Sprite path, animation directory+prefix, city, or generated name
+        size: Tuple (width, height), or None for an image's own size
+        frame: Frame index for animations
+
+    Returns:
+        String key used in the manifest (and the packed archive)
+    """
+    key = f"{kind}:{name}"
+    if size is not None:
+        width, height = size
+        key += f":{width}x{height}"
+    if frame is not None:
+        key += f"#{frame}"
+    return key
+
+
+class BakedAssets:
+    """Read-only view of a baked asset manifest."""
+
+    def __init__(self, directory=BAKED_DIR, files=None):
+        self.directory = directory
+        self.files = files or {}
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, key):
+        return key in self.files
+
+    def path(self, key):
+        """Full path of a baked file, or None if it wasn't baked."""
+        relative = self.files.get(key)
+        if relative is None:
+            return None
+        return os.path.join(self.directory, relative)
+
+    @classmethod
+    def load(cls, directory=BAKED_DIR, version=None):
+        """
+        Load the manifest in a bake directory.
+
+        Returns:
+            BakedAssets (empty if there's no bake or it's out of date)
+        """
+        try:
+            with open(os.path.join(directory, MANIFEST_NAME)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return cls(directory)
+
+        version = version if version is not None else bake_version()
+        if manifest.get('version') != version:
+            print(f"Warning: Baked assets in {directory} are out of date, "
+                  f"run 'python -m src.bake' to refresh them")
+            return cls(directory)
+
+        return cls(directory, manifest.get('files', {}))
+
+    def save(self, version=None):
+        """Write the manifest for the files recorded so far."""
+        manifest = {
+            'version': version if version is not None else bake_version(),
+            'files': self.files,
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
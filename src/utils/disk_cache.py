@@ -0,0 +1,99 @@
+"""
+On-disk cache for procedurally generated surfaces.
+
+Generated backgrounds take a while to draw, so the raw pixels are saved
+under CACHE_DIR and loaded straight back on later launches. File names
+carry a hash of sprite_generator.py, so editing the generator makes old
+entries miss (and get cleaned up) automatically.
+"""
+
+import hashlib
+import os
+import threading
+import pygame
+from config import CACHE_DIR
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT = 1
+
+GENERATOR_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sprite_generator.py')
+
+
+def generator_version(sources=(GENERATOR_SOURCE,)):
+    """Short hash of the generator source files (plus the cache format)."""
+    digest = hashlib.sha1(f"format{CACHE_FORMAT}".encode())
+    for path in sources:
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            pass  # no source around (frozen build) - still a stable key
+    return digest.hexdigest()[:12]
+
+
+class SurfaceDiskCache:
+    """Stores opaque surfaces as raw RGB files keyed by name, size and version."""
+
+    def __init__(self, directory=CACHE_DIR, version=None):
+        self.directory = directory
+        self.version = version if version is not None else generator_version()
+
+    def _prefix(self, name, size):
+        width, height = size
+        return f"{name}_{width}x{height}_"
+
+    def _path(self, name, size):
+        return os.path.join(self.directory, f"{self._prefix(name, size)}{self.version}.raw")
+
+    def load(self, name, size):
+        """
+        Load a cached surface.
+
+        Returns:
+            pygame.Surface, or None if there's no valid entry
+        """
+        path = self._path(name, size)
+        width, height = size
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        # Truncated or stale file - treat it as a miss
+        if len(data) != width * height * 3:
+            return None
+        return pygame.image.frombytes(data, size, 'RGB')
+
+    def save(self, name, size, surface):
+        """Write a surface to the cache, replacing entries from older versions."""
+        path = self._path(name, size)
+        # unique per writer, so loader threads saving the same entry don't collide
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(pygame.image.tobytes(surface, 'RGB'))
+            os.replace(temp_path, path)
+        except OSError as e:
+            # Read-only or sandboxed filesystem - the cache is just an optimization
+            print(f"Warning: Could not write cache file {path}: {e}")
+            return
+
+        self._remove_stale(name, size)
+
+    def _remove_stale(self, name, size):
+        """Delete entries for this name and size made by other generator versions."""
+        prefix = self._prefix(name, size)
+        current = os.path.basename(self._path(name, size))
+        try:
+            filenames = os.listdir(self.directory)
+        except OSError:
+            return
+        for filename in filenames:
+            # the current entry, and other threads' temp files for it, stay
+            if filename.startswith(prefix) and not filename.startswith(current):
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except OSError:
+                    pass  # already gone (another thread got it)
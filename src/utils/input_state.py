@@ -0,0 +1,19 @@
+"""
+Scripted keyboard state.
+Lets code that expects pygame.key.get_pressed() run from a fixed set of keys.
+"""
+
+
+class KeyState:
+    """Read-only stand-in for the sequence returned by pygame.key.get_pressed()."""
+
+    __slots__ = ('pressed',)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __repr__(self):
+        return f"KeyState({sorted(self.pressed)})"
@@ -0,0 +1,30 @@
+"""
+Deferred imports by dotted name.
+
+Game states, levels and enemy types are referred to by strings like
+'src.states.gameplay:Gameplay' and only imported the first time they're
+used, so launching the game doesn't pay for modules a session may never
+touch.
+"""
+
+import importlib
+
+_resolved = {}
+
+
+def import_object(path):
+    """
+    Import and return the object a 'package.module:Name' path points at.
+
+    Args:
+        path: Module path and attribute name separated by a colon
+
+    Returns:
+        The attribute (cached after the first lookup)
+    """
+    obj = _resolved.get(path)
+    if obj is None:
+        module_name, _, name = path.partition(':')
+        obj = getattr(importlib.import_module(module_name), name)
+        _resolved[path] = obj
+    return obj
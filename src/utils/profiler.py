@@ -0,0 +1,213 @@
+"""
+Frame profiler with named timing scopes.
+
+Wrap a phase of the frame in `with profiler.scope('update/player'):` and
+its time is added to that scope for the current frame. Names with a '/'
+are nested under the part before it. When the profiler is disabled
+scope() hands back a shared do-nothing object, so the cost is one
+attribute check per scope.
+"""
+
+import time
+from collections import deque
+
+import pygame
+from config import PROFILER_ENABLED, PROFILER_WINDOW, PROFILER_BUDGET_MS
+
+
+class _NullScope:
+    """Scope that does nothing, used while profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Times one block and adds it to the profiler's current frame."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class FrameProfiler:
+    """Collects per-scope timings over a rolling window of frames."""
+
+    # Colors for the stacked bars, handed out in order of first use
+    PALETTE = [
+        (230, 90, 70), (90, 180, 230), (120, 210, 110), (240, 200, 60),
+        (190, 120, 230), (240, 150, 60), (80, 200, 190), (220, 110, 170),
+    ]
+
+    def __init__(self, enabled=PROFILER_ENABLED, window=PROFILER_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self.current = {}
+        self.counters = {}
+        self.samples = {}  # scope name -> deque of per-frame ms
+        self.frames = deque(maxlen=window)  # per-frame {top-level scope: ms}
+        self.last_counters = {}
+        self.colors = {}
+        self.font = None
+
+    def scope(self, name):
+        """Get a context manager that times a block under the given name."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def count(self, name, amount=1):
+        """Add to a per-frame counter (e.g. draw calls)."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def toggle(self):
+        """Turn profiling on or off, starting fresh when turned on."""
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+
+    def reset(self):
+        """Forget everything collected so far."""
+        self.current = {}
+        self.counters = {}
+        self.samples = {}
+        self.frames = deque(maxlen=self.window)
+        self.last_counters = {}
+
+    def end_frame(self):
+        """Close out the current frame's timings. Call once per frame."""
+        if not self.enabled:
+            return
+
+        for name, elapsed in self.current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(elapsed)
+
+        self.frames.append({name: ms for name, ms in self.current.items() if '/' not in name})
+        self.last_counters = self.counters
+        self.current = {}
+        self.counters = {}
+
+    def get_stats(self, name):
+        """Get (average, p95, p99) in ms for a scope over the window."""
+        values = list(self.samples.get(name, ()))
+        if not values:
+            return 0.0, 0.0, 0.0
+        return sum(values) / len(values), percentile(values, 0.95), percentile(values, 0.99)
+
+    def get_rows(self):
+        """Get (name, depth, avg, p95, p99) per scope, parents before their children."""
+        rows = []
+        for name in sorted(self.samples):
+            avg, p95, p99 = self.get_stats(name)
+            rows.append((name, name.count('/'), avg, p95, p99))
+        return rows
+
+    def get_report(self):
+        """Get the stats table as text lines, counters at the end."""
+        lines = []
+        for name, depth, avg, p95, p99 in self.get_rows():
+            label = '  ' * depth + name.rsplit('/', 1)[-1]
+            lines.append(f"{label:<18s}{avg:6.2f} {p95:6.2f} {p99:6.2f}")
+        for name, value in sorted(self.last_counters.items()):
+            lines.append(f"{name:<18s}{value:6d}")
+        return lines
+
+    def get_color(self, name):
+        if name not in self.colors:
+            self.colors[name] = self.PALETTE[len(self.colors) % len(self.PALETTE)]
+        return self.colors[name]
+
+    def draw_overlay(self, screen):
+        """Draw the stacked per-frame bar graph and the stats table."""
+        if not self.enabled:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        graph_height = 120
+        bar_width = 3
+        top = 100  # below the HUD
+        graph_rect = pygame.Rect(10, top + 10, self.window * bar_width, graph_height)
+        scale = graph_height / (PROFILER_BUDGET_MS * 2)  # budget line sits halfway up
+
+        rows = self.get_rows()
+        counters = sorted(self.last_counters.items())
+        row_height = 14
+        panel_height = max(graph_height, 16 + (len(rows) + len(counters)) * row_height) + 20
+        panel = pygame.Surface((graph_rect.width + 260, panel_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        screen.blit(panel, (0, top))
+
+        # One stacked bar per frame, oldest on the left
+        for i, frame in enumerate(self.frames):
+            x = graph_rect.x + i * bar_width
+            y = graph_rect.bottom
+            for name in sorted(frame):
+                height = max(1, int(frame[name] * scale))
+                y -= height
+                pygame.draw.rect(screen, self.get_color(name), (x, y, bar_width - 1, height))
+
+        # Frame budget line
+        budget_y = graph_rect.bottom - int(PROFILER_BUDGET_MS * scale)
+        pygame.draw.line(screen, (255, 255, 255), (graph_rect.x, budget_y), (graph_rect.right, budget_y), 1)
+
+        # Stats table in ms, one column per number so it lines up
+        name_x = graph_rect.right + 10
+        columns = [name_x + 130, name_x + 170, name_x + 210]
+        y = top + 10
+        self.blit_text(screen, 'scope', (255, 255, 255), name_x, y)
+        for column_x, title in zip(columns, ('avg', 'p95', 'p99')):
+            self.blit_text(screen, title, (255, 255, 255), column_x, y)
+
+        for name, depth, avg, p95, p99 in rows:
+            y += row_height
+            root = name.split('/', 1)[0]
+            color = self.colors.get(root, (220, 220, 220)) if depth == 0 else (220, 220, 220)
+            self.blit_text(screen, name.rsplit('/', 1)[-1], color, name_x + depth * 10, y)
+            for column_x, value in zip(columns, (avg, p95, p99)):
+                self.blit_text(screen, f"{value:.2f}", color, column_x, y)
+
+        for name, value in counters:
+            y += row_height
+            self.blit_text(screen, name, (220, 220, 220), name_x, y)
+            self.blit_text(screen, str(value), (220, 220, 220), columns[0], y)
+
+    def blit_text(self, screen, text, color, x, y):
+        screen.blit(self.font.render(text, True, color), (x, y))
+
+
+# Global profiler instance
+profiler = FrameProfiler()
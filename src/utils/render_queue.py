@@ -0,0 +1,74 @@
+"""
+Batched sprite rendering.
+
+Instead of blitting as they go, entities submit (surface, position)
+pairs to a RenderQueue. Anything outside the camera view is dropped on
+submit, and flush() hands each layer to the screen in a single
+Surface.blits() call, so a frame costs a handful of draw calls rather
+than one per sprite.
+"""
+
+import pygame
+from src.utils.profiler import profiler
+from config import DEBUG_MODE, SHOW_HITBOXES, RED
+
+# Back to front
+LAYERS = ('platforms', 'entities', 'player')
+
+
+class RenderQueue:
+    """Per-layer lists of blits waiting for one Surface.blits() each."""
+
+    def __init__(self, layers=LAYERS):
+        self.layers = {name: [] for name in layers}
+        self.hitboxes = []
+        self.camera_offset = 0
+        self.view_width = 0
+        self.view_height = 0
+
+    def begin(self, screen, camera_offset=0):
+        """Start a frame: forget old submissions and set the camera view."""
+        for items in self.layers.values():
+            items.clear()
+        self.hitboxes.clear()
+        self.camera_offset = camera_offset
+        self.view_width, self.view_height = screen.get_size()
+
+    def submit(self, surface, x, y, layer='entities'):
+        """
+        Queue a surface at a world position.
+
+        Args:
+            surface: Surface to draw
+            x: World x (the camera offset is applied here)
+            y: Screen y
+            layer: Layer name from LAYERS
+
+        Returns:
+            True if queued, False if it was culled
+        """
+        screen_x = x - self.camera_offset
+        width, height = surface.get_size()
+        if (screen_x >= self.view_width or screen_x + width <= 0
+                or y >= self.view_height or y + height <= 0):
+            return False
+        self.layers[layer].append((surface, (screen_x, y)))
+        return True
+
+    def submit_hitbox(self, x, y, width, height):
+        """Queue a debug hitbox outline (world x, screen y)."""
+        self.hitboxes.append(pygame.Rect(x - self.camera_offset, y, width, height))
+
+    def flush(self, screen):
+        """Draw everything queued, one blits() call per non-empty layer."""
+        for items in self.layers.values():
+            if items:
+                screen.blits(items, doreturn=False)
+                profiler.count('draw_calls')
+                profiler.count('sprites', len(items))
+                items.clear()
+
+        if DEBUG_MODE and SHOW_HITBOXES:
+            for rect in self.hitboxes:
+                pygame.draw.rect(screen, RED, rect, 2)
+        self.hitboxes.clear()
@@ -0,0 +1,92 @@
+"""
+Input recording and replay.
+
+The simulation only reads the keyboard through Gameplay.input_source and
+only draws random numbers from the level's seeded RNG, so a run is fully
+described by its city, its level seed and the keys held on each tick.
+"""
+
+import json
+
+import pygame
+from src.utils.input_state import KeyState
+
+
+# Every key Player.handle_input looks at, in bit order
+RECORDED_KEYS = (
+    pygame.K_LEFT, pygame.K_a,
+    pygame.K_RIGHT, pygame.K_d,
+    pygame.K_LSHIFT, pygame.K_RSHIFT,
+    pygame.K_SPACE, pygame.K_w, pygame.K_UP,
+)
+
+
+def encode_keys(keys):
+    """Pack the recorded keys held in a get_pressed()-style sequence into a bitmask."""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask):
+    """Turn a bitmask back into a KeyState."""
+    return KeyState(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+
+class Replay:
+    """A recorded run: city, level seed and one key bitmask per tick."""
+
+    def __init__(self, city, seed, frames=None):
+        self.city = city
+        self.seed = seed
+        self.frames = frames if frames is not None else []
+
+    def __len__(self):
+        return len(self.frames)
+
+    def save(self, path):
+        """Write the replay to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump({'city': self.city, 'seed': self.seed, 'frames': self.frames}, f)
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay written by save()."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['city'], data['seed'], data['frames'])
+
+
+class InputRecorder:
+    """Input source wrapper that records every tick's keys into a Replay."""
+
+    def __init__(self, source, replay):
+        self.source = source
+        self.replay = replay
+
+    def __call__(self):
+        keys = self.source() if self.source is not None else pygame.key.get_pressed()
+        mask = encode_keys(keys)
+        self.replay.frames.append(mask)
+        return decode_keys(mask)
+
+
+class ReplayPlayer:
+    """Input source that plays a Replay back tick by tick (no keys once it runs out)."""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.tick = 0
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.replay.frames)
+
+    def __call__(self):
+        if self.finished:
+            return KeyState()
+        mask = self.replay.frames[self.tick]
+        self.tick += 1
+        return decode_keys(mask)
@@ -0,0 +1,58 @@
+"""
+Fixed-width sectors for level entities.
+Lets the level simulate and draw only what's near the camera, so the
+per-frame cost stays flat no matter how long the level gets.
+"""
+
+from config import SECTOR_WIDTH
+
+
+class SectorGrid:
+    """Buckets entities into horizontal sectors by their x position."""
+
+    def __init__(self, entities=(), sector_width=SECTOR_WIDTH):
+        self.sector_width = sector_width
+        self.sectors = {}
+        for entity in entities:
+            self.add(entity)
+
+    def sector_of(self, x):
+        """Get the sector index holding an x coordinate."""
+        return int(x) // self.sector_width
+
+    def sector_range(self, left, right):
+        """Get the (first, last) sector indices covering left..right."""
+        return self.sector_of(left), self.sector_of(right)
+
+    def add(self, entity):
+        """Start tracking an entity in the sector it currently sits in."""
+        entity.sector = self.sector_of(entity.rect.x)
+        self.sectors.setdefault(entity.sector, []).append(entity)
+
+    def remove(self, entity):
+        """Stop tracking an entity."""
+        bucket = self.sectors.get(entity.sector)
+        if bucket and entity in bucket:
+            bucket.remove(entity)
+
+    def relocate(self, entity):
+        """Move an entity to a new sector if it crossed a boundary."""
+        sector = self.sector_of(entity.rect.x)
+        if sector != entity.sector:
+            self.remove(entity)
+            entity.sector = sector
+            self.sectors.setdefault(sector, []).append(entity)
+
+    def entities_in(self, first, last):
+        """Get every entity in sectors first..last (inclusive) as a new list."""
+        found = []
+        for sector in range(first, last + 1):
+            bucket = self.sectors.get(sector)
+            if bucket:
+                found.extend(bucket)
+        return found
+
+    def entities_between(self, left, right):
+        """Get every entity whose sector overlaps the x range left..right."""
+        first, last = self.sector_range(left, right)
+        return self.entities_in(first, last)
@@ -0,0 +1,62 @@
+"""
+Uniform-grid spatial hash for static rectangles.
+Used as the broad phase for platform collisions so movers only test
+the handful of platforms around them instead of the whole level.
+
+Levels scroll sideways, so the grid is a row of fixed-width columns.
+Each column (and each pair of neighbouring columns) keeps its candidate
+list precomputed, which makes a query for anything narrower than a
+column a single dict lookup.
+"""
+
+from config import PLATFORM_GRID_CELL_SIZE
+
+
+class SpatialHash:
+    """Static grid index over a list of pygame.Rect objects."""
+
+    def __init__(self, rects, cell_size=PLATFORM_GRID_CELL_SIZE):
+        self.rects = list(rects)
+        self.cell_size = cell_size
+
+        # column -> indices of the rects touching it
+        buckets = {}
+        for index, rect in enumerate(self.rects):
+            for column in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                buckets.setdefault(column, []).append(index)
+        self.buckets = buckets
+
+        # Candidate lists in original order, for one column and for two neighbours
+        self.columns = {c: tuple(self.rects[i] for i in bucket) for c, bucket in buckets.items()}
+        self.spans = {}
+        for column in buckets:
+            for start in (column - 1, column):
+                if start not in self.spans:
+                    indices = set(buckets.get(start, ())) | set(buckets.get(start + 1, ()))
+                    self.spans[start] = tuple(self.rects[i] for i in sorted(indices))
+
+    def query(self, rect):
+        """
+        Get the rects that might overlap the given rect.
+
+        Candidates come back in their original list order so collision
+        code resolves overlaps exactly like a full scan would.
+        """
+        first = rect.left // self.cell_size
+        last = (rect.right - 1) // self.cell_size
+        if first == last:
+            return self.columns.get(first, ())
+        if last == first + 1:
+            return self.spans.get(first, ())
+
+        # Wider than two columns - merge the buckets
+        found = set()
+        for column in range(first, last + 1):
+            found.update(self.buckets.get(column, ()))
+        return tuple(self.rects[i] for i in sorted(found))
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def __len__(self):
+        return len(self.rects)
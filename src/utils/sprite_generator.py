@@ -498,6 +498,9 @@ def create_boston_background(width, height):
     """Create a highly detailed Boston autumn background."""
     surface = pygame.Surface((width, height))
 
+    # Own RNG so drawing never touches the global random state
+    rng = random.Random(1)
+
     # Autumn sky gradient (warm peachy tones)
     top_color = (244, 200, 180)
     mid_color = (248, 220, 195)
@@ -576,9 +579,8 @@ def create_boston_background(width, height):
                 wy = y + row
 
                 # Vary window colors (some lit, some dark, some cream curtains)
-                import random
-                random.seed(wx + wy)  # Consistent random
-                choice = random.random()
+                rng.seed(wx + wy)  # Consistent random
+                choice = rng.random()
                 if choice < 0.3:
                     win_color = window_lit
                 elif choice < 0.6:
@@ -619,11 +621,10 @@ def create_boston_background(width, height):
 
         # Some falling leaves
         for i in range(3):
-            import random
-            random.seed(tx + i)
-            leaf_x = tx + random.randint(-30, 30)
-            leaf_y = ty + random.randint(20, 100)
-            leaf_c = random.choice(leaf_colors)
+            rng.seed(tx + i)
+            leaf_x = tx + rng.randint(-30, 30)
+            leaf_y = ty + rng.randint(20, 100)
+            leaf_c = rng.choice(leaf_colors)
             # Small leaf shape
             pygame.draw.ellipse(surface, leaf_c, (leaf_x, leaf_y, 4, 6))
 
@@ -663,7 +664,7 @@ def create_boston_background(width, height):
     # Brick pattern
     for bx in range(0, 280, 20):
         for by in range(650, 720, 10):
-            brick_var = random.randint(-15, 15)
+            brick_var = rng.randint(-15, 15)
             brick_color = (sidewalk_left_color[0] + brick_var,
                           sidewalk_left_color[1] + brick_var,
                           sidewalk_left_color[2] + brick_var)
@@ -676,9 +677,9 @@ def create_boston_background(width, height):
     # Cobblestone texture
     for sx in range(280, 1000, 12):
         for sy in range(650, 720, 12):
-            stone_color = (street_base[0] + random.randint(-12, 12),
-                          street_base[1] + random.randint(-12, 12),
-                          street_base[2] + random.randint(-10, 10))
+            stone_color = (street_base[0] + rng.randint(-12, 12),
+                          street_base[1] + rng.randint(-12, 12),
+                          street_base[2] + rng.randint(-10, 10))
             pygame.draw.circle(surface, stone_color, (sx + 5, sy + 5), 5)
             pygame.draw.circle(surface, (70, 65, 60), (sx + 5, sy + 5), 5, 1)
 
@@ -688,7 +689,7 @@ def create_boston_background(width, height):
     # Granite tiles
     for gx in range(1000, 1280, 35):
         for gy in range(650, 720, 35):
-            tile_var = random.randint(-10, 10)
+            tile_var = rng.randint(-10, 10)
             tile_color = (sidewalk_right_color[0] + tile_var,
                          sidewalk_right_color[1] + tile_var,
                          sidewalk_right_color[2] + tile_var)
@@ -696,8 +697,8 @@ def create_boston_background(width, height):
             pygame.draw.rect(surface, (90, 85, 80), (gx, gy, 33, 33), 1)
             # Speckles for granite texture
             for _ in range(5):
-                speck_x = gx + random.randint(2, 30)
-                speck_y = gy + random.randint(2, 30)
+                speck_x = gx + rng.randint(2, 30)
+                speck_y = gy + rng.randint(2, 30)
                 pygame.draw.circle(surface, (100, 95, 90), (speck_x, speck_y), 1)
 
     # Add some grates and manholes
@@ -746,10 +747,10 @@ def create_boston_background(width, height):
         pygame.draw.rect(surface, (101, 67, 33), (fb_x, fb_y, 20, 6))
         # Flowers (small colored dots)
         flower_colors = [(255, 100, 120), (255, 180, 50), (200, 100, 200), (255, 150, 150)]
-        random.seed(fb_x + fb_y)
+        rng.seed(fb_x + fb_y)
         for i in range(4):
             f_x = fb_x + 3 + i * 4
-            f_color = random.choice(flower_colors)
+            f_color = rng.choice(flower_colors)
             pygame.draw.circle(surface, f_color, (f_x, fb_y - 2), 2)
 
     # Store signs and awnings
@@ -845,13 +846,13 @@ def create_boston_background(width, height):
         pygame.draw.circle(surface, (200, 150, 80), (item_x, cart_y + 10), 3)
 
     # More falling leaves scattered in air
-    random.seed(42)  # Consistent pattern
+    rng.seed(42)  # Consistent pattern
     for _ in range(25):
-        leaf_air_x = random.randint(0, width)
-        leaf_air_y = random.randint(200, 600)
-        leaf_air_color = random.choice([(200, 50, 40), (230, 120, 30), (255, 180, 50), (180, 90, 40)])
+        leaf_air_x = rng.randint(0, width)
+        leaf_air_y = rng.randint(200, 600)
+        leaf_air_color = rng.choice([(200, 50, 40), (230, 120, 30), (255, 180, 50), (180, 90, 40)])
         # Tilted leaf
-        angle = random.randint(0, 360)
+        angle = rng.randint(0, 360)
         if angle % 2 == 0:
             pygame.draw.ellipse(surface, leaf_air_color, (leaf_air_x, leaf_air_y, 5, 3))
         else:
@@ -904,11 +905,11 @@ def create_boston_background(width, height):
     # Add autumn leaf piles in corners
     leaf_pile_positions = [(100, 655), (440, 658), (780, 656), (1200, 657)]
     for pile_x, pile_y in leaf_pile_positions:
-        random.seed(pile_x)
+        rng.seed(pile_x)
         for _ in range(15):
-            pile_leaf_x = pile_x + random.randint(-12, 12)
-            pile_leaf_y = pile_y + random.randint(-3, 5)
-            pile_color = random.choice([(200, 50, 40), (230, 120, 30), (255, 180, 50), (180, 90, 40)])
+            pile_leaf_x = pile_x + rng.randint(-12, 12)
+            pile_leaf_y = pile_y + rng.randint(-3, 5)
+            pile_color = rng.choice([(200, 50, 40), (230, 120, 30), (255, 180, 50), (180, 90, 40)])
             pygame.draw.ellipse(surface, pile_color, (pile_leaf_x, pile_leaf_y, 3, 2))
 
     return surface
@@ -918,6 +919,9 @@ def create_nyc_background(width, height):
     """Create a highly detailed NYC nighttime background."""
     surface = pygame.Surface((width, height))
 
+    # Own RNG so drawing never touches the global random state
+    rng = random.Random(2)
+
     # Night sky gradient (dark purple to dark blue)
     top_color = (15, 15, 35)
     mid_color = (25, 20, 45)
@@ -938,11 +942,11 @@ def create_nyc_background(width, height):
         pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
 
     # Stars
-    random.seed(999)
+    rng.seed(999)
     for _ in range(40):
-        star_x = random.randint(0, width)
-        star_y = random.randint(0, 300)
-        star_brightness = random.randint(150, 255)
+        star_x = rng.randint(0, width)
+        star_y = rng.randint(0, 300)
+        star_brightness = rng.randint(150, 255)
         pygame.draw.circle(surface, (star_brightness, star_brightness, star_brightness),
                          (star_x, star_y), 1)
 
@@ -1028,8 +1032,8 @@ def create_nyc_background(width, height):
                 wy = y + row
 
                 # 70% of windows are lit at night
-                random.seed(wx + wy)
-                if random.random() < 0.7:
+                rng.seed(wx + wy)
+                if rng.random() < 0.7:
                     win_color = window_lit
                 else:
                     win_color = window_dark
@@ -1334,15 +1338,15 @@ def create_nyc_background(width, height):
         (180, 120, 180), (100, 180, 180), (220, 150, 100), (150, 150, 150)
     ]
 
-    random.seed(42)  # Consistent randomization
+    rng.seed(42)  # Consistent randomization
     for tour_x, tour_y in tourist_positions:
-        color = random.choice(tourist_colors)
+        color = rng.choice(tourist_colors)
         # Head
         pygame.draw.circle(surface, (180, 150, 130), (tour_x, tour_y), 2)
         # Body (random colored clothing)
         pygame.draw.rect(surface, color, (tour_x - 2, tour_y + 2, 4, 7))
         # Some with cameras
-        if random.random() < 0.3:
+        if rng.random() < 0.3:
             pygame.draw.rect(surface, (50, 50, 55), (tour_x + 2, tour_y + 4, 3, 2))
 
     # Additional large neon signs (iconic brands style)
@@ -1382,6 +1386,9 @@ def create_chicago_background(width, height):
     """Create a highly detailed Chicago daytime background."""
     surface = pygame.Surface((width, height))
 
+    # Own RNG so drawing never touches the global random state
+    rng = random.Random(3)
+
     # Bright blue sky gradient (The Windy City)
     top_color = (120, 180, 240)
     mid_color = (150, 200, 250)
@@ -1485,8 +1492,8 @@ def create_chicago_background(width, height):
                 wy = y + row
 
                 # Alternating reflection pattern
-                random.seed(wx + wy)
-                if random.random() < 0.4:
+                rng.seed(wx + wy)
+                if rng.random() < 0.4:
                     win_color = window_reflect
                 else:
                     win_color = window_color
@@ -1560,10 +1567,10 @@ def create_chicago_background(width, height):
         pygame.draw.circle(surface, (40, 40, 40), (stand_x + 32, stand_y + 20), 4)
 
     # Wind effects (Chicago is the Windy City!)
-    random.seed(777)
+    rng.seed(777)
     for _ in range(15):
-        wind_x = random.randint(0, width)
-        wind_y = random.randint(300, 600)
+        wind_x = rng.randint(0, width)
+        wind_y = rng.randint(300, 600)
         # Motion lines
         pygame.draw.line(surface, (200, 210, 220, 100), (wind_x, wind_y), (wind_x + 20, wind_y + 3), 1)
 
@@ -1582,8 +1589,8 @@ def create_chicago_background(width, height):
         # Head
         pygame.draw.circle(surface, (120, 100, 90), (person_x, person_y), 3)
         # Body
-        random.seed(person_x)
-        clothing_color = random.choice([(80, 80, 120), (120, 60, 60), (60, 100, 60)])
+        rng.seed(person_x)
+        clothing_color = rng.choice([(80, 80, 120), (120, 60, 60), (60, 100, 60)])
         pygame.draw.rect(surface, clothing_color, (person_x - 3, person_y + 3, 6, 10))
 
     # Newspaper boxes
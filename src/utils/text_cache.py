@@ -0,0 +1,117 @@
+"""
+Cached text rendering.
+
+Font.render() rasterizes the whole string every call, which adds up when
+the HUD and menus redraw the same labels every frame. TextCache keeps
+rendered strings keyed by (font, text, color, antialias) and evicts the
+least recently used once it's full. TextWidget is for values that change
+now and then (score, FPS): it re-renders only when its value does, so an
+unchanged value costs one blit.
+"""
+
+from collections import OrderedDict
+import pygame
+from src.utils.profiler import profiler
+from config import TEXT_CACHE_SIZE, WHITE
+
+
+class TextCache:
+    """LRU cache of rendered strings."""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def render(self, font, text, color=WHITE, antialias=True):
+        """
+        Get a rendered string, rasterizing it only on a miss.
+
+        The surface is shared with every other caller asking for the same
+        text, so treat it as read-only (no set_alpha, no drawing on it).
+
+        Args:
+            font: pygame.font.Font to render with
+            text: String to render
+            color: Text color
+            antialias: Passed through to Font.render
+
+        Returns:
+            pygame.Surface with the text
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        profiler.count('text_renders')
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+
+class TextWidget:
+    """A piece of text built from a changing value, re-rendered only when the value changes."""
+
+    def __init__(self, font, template='{}', color=WHITE, antialias=True):
+        self.font = font
+        self.template = template
+        self.color = color
+        self.antialias = antialias
+        self.value = None
+        self.surface = None
+        self.alpha = None
+
+    def set(self, value):
+        """
+        Update the value shown.
+
+        Returns:
+            True if the text changed and was re-rendered
+        """
+        if self.surface is not None and value == self.value:
+            return False
+        self.value = value
+        profiler.count('text_renders')
+        # owned by this widget, so set_alpha() is safe here unlike cached text
+        self.surface = self.font.render(self.template.format(value), self.antialias, self.color)
+        if self.alpha is not None:
+            self.surface.set_alpha(self.alpha)
+        return True
+
+    def set_alpha(self, alpha):
+        """Fade the text (0-255); kept across re-renders."""
+        if alpha != self.alpha:
+            self.alpha = alpha
+            if self.surface is not None:
+                self.surface.set_alpha(alpha)
+
+    def get_rect(self, **position):
+        return self.surface.get_rect(**position)
+
+    def draw(self, screen, **position):
+        """
+        Blit the text, positioned like Surface.get_rect() (topleft=, center=, ...).
+
+        Returns:
+            The screen rect it was drawn at
+        """
+        rect = self.surface.get_rect(**position)
+        screen.blit(self.surface, rect)
+        return rect
+
+
+# Shared by every state
+text_cache = TextCache()
@@ -0,0 +1,171 @@
+"""
+Texture atlas for small sprites.
+
+Packs many little surfaces (enemy and collectible sprites, animation
+frames) onto a few large pages with a simple shelf packer. Each packed
+sprite is handed back as a subsurface of its page, so existing drawing
+code keeps working while the pixels share one allocation and one blit
+source. An atlas can be saved as page PNGs plus a JSON index and loaded
+back without regenerating anything.
+"""
+
+import json
+import os
+import pygame
+from config import ATLAS_PAGE_SIZE, ATLAS_PADDING
+
+
+class TextureAtlas:
+    """Shelf-packed sprite pages with named regions."""
+
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.regions = {}     # key -> (page index, pygame.Rect)
+        self.subsurfaces = {}  # key -> subsurface of its page
+
+        # Shelf state for the page being filled
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def __contains__(self, key):
+        return key in self.regions
+
+    def __len__(self):
+        return len(self.regions)
+
+    def _new_page(self):
+        page = pygame.Surface(self.page_size, pygame.SRCALPHA)
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self.shelf_x = self.shelf_y = self.shelf_height = 0
+        return page
+
+    def _allocate(self, width, height):
+        """Find room for a width x height block, starting new shelves and pages as needed."""
+        page_width, page_height = self.page_size
+        padded_width = width + self.padding
+        padded_height = height + self.padding
+        if padded_width > page_width or padded_height > page_height:
+            raise ValueError(f"Sprite {width}x{height} doesn't fit on a {page_width}x{page_height} atlas page")
+
+        if not self.pages:
+            self._new_page()
+
+        # Next shelf if this row is full, next page if the shelves are
+        if self.shelf_x + padded_width > page_width:
+            self.shelf_y += self.shelf_height
+            self.shelf_x = self.shelf_height = 0
+        if self.shelf_y + padded_height > page_height:
+            self._new_page()
+
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += padded_width
+        self.shelf_height = max(self.shelf_height, padded_height)
+        return len(self.pages) - 1, rect
+
+    def add(self, key, surface):
+        """
+        Pack a surface into the atlas.
+
+        Args:
+            key: Name to look the sprite up by later
+            surface: Surface to copy in
+
+        Returns:
+            Subsurface of the atlas page holding the copy
+        """
+        if key in self.subsurfaces:
+            return self.subsurfaces[key]
+
+        index, rect = self._allocate(*surface.get_size())
+        page = self.pages[index]
+        # MAX onto the cleared page copies the pixels exactly, alpha included
+        page.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        self.regions[key] = (index, rect)
+        self.subsurfaces[key] = page.subsurface(rect)
+        return self.subsurfaces[key]
+
+    def pack(self, items):
+        """
+        Pack many surfaces at once, tallest first for tighter shelves.
+
+        Args:
+            items: Iterable of (key, surface) pairs
+
+        Returns:
+            Dict of key -> subsurface
+        """
+        ordered = sorted(items, key=lambda item: item[1].get_height(), reverse=True)
+        return {key: self.add(key, surface) for key, surface in ordered}
+
+    def finish(self):
+        """
+        Crop the last page down to the area actually used.
+
+        Pages start full size, so a small sprite set would otherwise sit
+        on a mostly empty 1024x1024 surface. Anything added afterwards
+        goes on a fresh page.
+        """
+        if not self.pages:
+            return
+        last = len(self.pages) - 1
+        rects = [rect for index, rect in self.regions.values() if index == last]
+        if rects:
+            used = rects[0].unionall(rects[1:])
+            self.pages[last] = self.pages[last].subsurface((0, 0, used.right, used.bottom)).copy()
+            self._rebuild_subsurfaces()
+        self.shelf_y = self.page_size[1]
+
+    def _rebuild_subsurfaces(self):
+        self.subsurfaces = {key: self.pages[index].subsurface(rect)
+                            for key, (index, rect) in self.regions.items()}
+
+    def get(self, key):
+        """Get a packed sprite as a subsurface, or None."""
+        return self.subsurfaces.get(key)
+
+    def region(self, key):
+        """Get (page surface, source rect) for blitting a sprite straight from its page."""
+        index, rect = self.regions[key]
+        return self.pages[index], rect
+
+    def convert(self):
+        """Convert the pages to the display format. Needs a display mode set."""
+        self.pages = [page.convert_alpha() for page in self.pages]
+        self._rebuild_subsurfaces()
+
+    def save(self, directory, name):
+        """Write the pages as <name>_<n>.png plus a <name>.json index."""
+        os.makedirs(directory, exist_ok=True)
+        for i, page in enumerate(self.pages):
+            pygame.image.save(page, os.path.join(directory, f"{name}_{i}.png"))
+
+        index = {
+            'page_size': list(self.page_size),
+            'pages': len(self.pages),
+            'regions': {key: [page, rect.x, rect.y, rect.width, rect.height]
+                        for key, (page, rect) in self.regions.items()},
+        }
+        with open(os.path.join(directory, f"{name}.json"), 'w') as f:
+            json.dump(index, f)
+
+    @classmethod
+    def load(cls, directory, name):
+        """Read an atlas written by save()."""
+        with open(os.path.join(directory, f"{name}.json")) as f:
+            index = json.load(f)
+
+        atlas = cls(tuple(index['page_size']))
+        atlas.pages = [pygame.image.load(os.path.join(directory, f"{name}_{i}.png"))
+                       for i in range(index['pages'])]
+        for key, (page, x, y, width, height) in index['regions'].items():
+            atlas.regions[key] = (page, pygame.Rect(x, y, width, height))
+        atlas._rebuild_subsurfaces()
+
+        # Loaded atlases are finished - anything added later starts a fresh page
+        atlas.shelf_y = atlas.page_size[1]
+        return atlas
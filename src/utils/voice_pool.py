@@ -0,0 +1,120 @@
+"""
+Prioritized voice pool for sound effects.
+
+Sound effects play on a fixed set of reserved mixer channels instead of
+whatever Sound.play() grabs. Each effect has a priority, a cap on how
+many copies may sound at once and a minimum gap between repeats (see
+SFX_SETTINGS). When every voice is busy, a new sound takes over the
+lowest-priority, oldest voice that doesn't outrank it, or is dropped.
+However busy a scene gets, the mixer never has more than SFX_VOICES
+effects going.
+"""
+
+import time
+
+import pygame
+from src.utils.profiler import profiler
+from config import SFX_VOICES, AMBIENT_CHANNELS, SFX_DEFAULTS, SFX_SETTINGS
+
+
+def sfx_settings(name):
+    """Priority, max_instances and min_interval (ms) for a sound effect."""
+    settings = dict(SFX_DEFAULTS)
+    settings.update(SFX_SETTINGS.get(name, {}))
+    return settings
+
+
+def milliseconds():
+    return time.perf_counter() * 1000
+
+
+class Voice:
+    """What one reserved channel is playing."""
+
+    __slots__ = ('channel', 'name', 'priority', 'started')
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.name = None
+        self.priority = 0
+        self.started = 0.0
+
+    def busy(self):
+        return self.name is not None and self.channel.get_busy()
+
+
+class VoicePool:
+    """Fixed pool of mixer channels that sound effects compete for."""
+
+    def __init__(self, num_voices=SFX_VOICES, clock=milliseconds):
+        self.clock = clock
+        # channels 0..num_voices-1 are ours; Sound.play() (ambient loops)
+        # only picks from the ones after them
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), num_voices + AMBIENT_CHANNELS))
+        pygame.mixer.set_reserved(num_voices)
+        self.voices = [Voice(pygame.mixer.Channel(i)) for i in range(num_voices)]
+
+        self.last_played = {}  # name -> clock time of the last accepted play
+        self.stats = {'played': 0, 'rate_limited': 0, 'dropped': 0, 'stolen': 0}
+
+    def active(self, name=None):
+        """Busy voices, optionally only those playing one sound."""
+        return [voice for voice in self.voices if voice.busy() and (name is None or voice.name == name)]
+
+    def play(self, name, sound):
+        """
+        Play a sound effect on a pool voice.
+
+        Args:
+            name: Sound name, used to look up its SFX_SETTINGS
+            sound: pygame.mixer.Sound to play
+
+        Returns:
+            The Channel it's playing on, or None if it was dropped
+        """
+        settings = sfx_settings(name)
+        now = self.clock()
+
+        # the same sound again within a few ms just piles on volume
+        last = self.last_played.get(name)
+        if last is not None and now - last < settings['min_interval']:
+            self.stats['rate_limited'] += 1
+            return None
+
+        voice = self.pick_voice(name, settings)
+        if voice is None:
+            self.stats['dropped'] += 1
+            return None
+
+        if voice.busy():
+            self.stats['stolen'] += 1
+            profiler.count('voices_stolen')
+        voice.channel.play(sound)
+        voice.name = name
+        voice.priority = settings['priority']
+        voice.started = now
+        self.last_played[name] = now
+        self.stats['played'] += 1
+        return voice.channel
+
+    def pick_voice(self, name, settings):
+        """Choose the voice a new sound should play on, or None to drop it."""
+        # at its instance cap, the new copy replaces the oldest one
+        instances = self.active(name)
+        if len(instances) >= settings['max_instances']:
+            return min(instances, key=lambda voice: voice.started)
+
+        for voice in self.voices:
+            if not voice.busy():
+                return voice
+
+        # all busy: take the least important, oldest voice we outrank or match
+        candidates = [voice for voice in self.voices if voice.priority <= settings['priority']]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda voice: (voice.priority, voice.started))
+
+    def stop_all(self):
+        for voice in self.voices:
+            voice.channel.stop()
+            voice.name = None
@@ -0,0 +1,129 @@
+"""
+Unit tests for the packed, memory-mapped asset archive.
+"""
+
+import unittest
+import ctypes
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.asset_archive import ArchiveWriter, AssetArchive
+from src.utils.asset_loader import AssetLoader
+from src.utils.baked_assets import BakedAssets, baked_key
+
+
+def pattern_surface(size, flags=pygame.SRCALPHA):
+    """A surface with a different color in every pixel."""
+    surface = pygame.Surface(size, flags)
+    for x in range(size[0]):
+        for y in range(size[1]):
+            surface.set_at((x, y), (x * 40 % 256, y * 60 % 256, (x + y) * 20 % 256, 255 - x * 10))
+    return surface
+
+
+class TestAssetArchive(unittest.TestCase):
+    """Test cases for writing, mapping and loading from an archive."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Write an archive with a sprite, a background and animation frames."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'assets.pak')
+
+        self.sprite = pattern_surface((5, 3))
+        self.background = pattern_surface((7, 4), flags=0)
+        self.frames = [pattern_surface((4, 4)) for _ in range(2)]
+        writer = ArchiveWriter()
+        writer.add(baked_key('sprite', 'enemies/rat/rat.png', (5, 3)), self.sprite)
+        writer.add(baked_key('background', 'nyc/sky.png', (7, 4)), self.background)
+        for i, frame in enumerate(self.frames):
+            writer.add(baked_key('animation', 'player/run/run_', (4, 4), i), frame)
+        writer.write(self.path, version='test')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_same_pixels(self, a, b, format='RGBA'):
+        self.assertEqual(a.get_size(), b.get_size())
+        self.assertEqual(pygame.image.tobytes(a, format), pygame.image.tobytes(b, format))
+
+    def test_round_trip(self):
+        """Test that archived surfaces come back pixel-identical."""
+        archive = AssetArchive.open(self.path, version='test')
+        self.assertEqual(len(archive), 4)
+
+        sprite = archive.surface(baked_key('sprite', 'enemies/rat/rat.png', (5, 3)))
+        self.assert_same_pixels(sprite, self.sprite)
+        self.assertTrue(sprite.get_flags() & pygame.SRCALPHA)
+
+        # opaque images blit without blending
+        background = archive.surface(baked_key('background', 'nyc/sky.png', (7, 4)))
+        self.assert_same_pixels(background, self.background, 'RGB')
+        self.assertFalse(background.get_flags() & pygame.SRCALPHA)
+
+        self.assertIsNone(archive.surface(baked_key('sprite', 'missing.png', (5, 3))))
+
+    def test_surfaces_share_mapped_memory(self):
+        """Test that surfaces point into the archive's buffer instead of copies."""
+        archive = AssetArchive.open(self.path, version='test')
+        start = ctypes.addressof(ctypes.c_char.from_buffer(archive.buffer))
+        sprite = archive.surface(baked_key('sprite', 'enemies/rat/rat.png', (5, 3)))
+        self.assertGreaterEqual(sprite._pixels_address, start + archive.data_start)
+        self.assertLess(sprite._pixels_address, start + len(archive.buffer))
+
+    def test_unusable_archives_are_empty(self):
+        """Test that a missing, stale or corrupt archive loads as empty."""
+        self.assertEqual(len(AssetArchive.open(os.path.join(self.temp_dir.name, 'missing.pak'))), 0)
+        self.assertEqual(len(AssetArchive.open(self.path, version='not-this-one')), 0)
+
+        with open(self.path, 'r+b') as f:
+            f.write(b'JUNK')
+        self.assertEqual(len(AssetArchive.open(self.path, version='test')), 0)
+
+    def test_changed_art_invalidates_entries(self):
+        """Test that art edited or added after packing is read from disk, not the archive."""
+        art = os.path.join(self.temp_dir.name, 'rat.png')
+        added = os.path.join(self.temp_dir.name, 'pigeon.png')
+        pygame.image.save(self.sprite, art)
+        writer = ArchiveWriter()
+        writer.add('sprite:rat', self.sprite, [art])
+        writer.add('sprite:pigeon', self.sprite, [added])  # generated, no art yet
+        writer.add('sprite:taxi', self.sprite)
+        writer.write(self.path, version='test')
+        self.assertEqual(len(AssetArchive.open(self.path, version='test')), 3)
+
+        pygame.image.save(pattern_surface((6, 3)), art)
+        os.utime(art, ns=(1, 1))
+        pygame.image.save(self.sprite, added)
+        archive = AssetArchive.open(self.path, version='test')
+        self.assertNotIn('sprite:rat', archive)
+        self.assertNotIn('sprite:pigeon', archive)
+        self.assertIn('sprite:taxi', archive)
+
+    def test_loader_reads_archive_first(self):
+        """Test that the loader serves archived images without touching files or generators."""
+        loader = AssetLoader(baked=BakedAssets('missing'), archive=AssetArchive.open(self.path, version='test'))
+        with mock.patch('os.path.exists', side_effect=AssertionError), \
+                mock.patch.object(loader, '_generate_sprite', side_effect=AssertionError):
+            sprite = loader.load_sprite('enemies/rat/rat.png', (5, 3))
+            frames = loader.load_animation_frames('player/run', 'run_', 2, (4, 4))
+            background = loader.load_background('nyc/sky.png', (7, 4))
+
+        self.assert_same_pixels(sprite, self.sprite)
+        self.assert_same_pixels(background, self.background, 'RGB')
+        for frame, expected in zip(frames, self.frames):
+            self.assert_same_pixels(frame, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+"""
+Unit tests for the memory-budgeted asset cache.
+"""
+
+import unittest
+import gc
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.asset_archive import AssetArchive
+from src.utils.asset_cache import AssetCache, surface_bytes
+from src.utils.asset_loader import AssetLoader
+from src.utils.baked_assets import BakedAssets
+
+
+def make_surface(width=32, height=32):
+    return pygame.Surface((width, height), pygame.SRCALPHA)
+
+
+class TestAssetCache(unittest.TestCase):
+    """Test cases for byte accounting, LRU eviction, pins and groups."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+        cls.size = surface_bytes(make_surface())
+
+    def test_byte_accounting(self):
+        """Test that entries are charged pitch x height and refunded on removal."""
+        cache = AssetCache(budget=10 * self.size)
+        cache.put(('sprite', 'a'), make_surface())
+        cache.put(('anim', 'b'), [make_surface(), make_surface()])
+        self.assertEqual(cache.bytes_used, 3 * self.size)
+
+        cache.put(('sprite', 'a'), make_surface(64, 32))
+        self.assertEqual(cache.bytes_used, 4 * self.size)
+        cache.clear()
+        self.assertEqual(cache.bytes_used, 0)
+
+    def test_shared_surfaces_counted_once(self):
+        """Test that subsurfaces of one page and surfaces under two keys cost one allocation."""
+        cache = AssetCache(budget=10 * self.size)
+        page = make_surface(64, 64)
+        cache.put(('sprite', 'a'), page.subsurface((0, 0, 32, 32)), group='boston')
+        cache.put(('sprite', 'b'), page.subsurface((32, 0, 32, 32)), group='nyc')
+        cache.put(('atlas', 'boston'), page, group='boston')
+        self.assertEqual(cache.bytes_used, surface_bytes(page))
+
+        # the page stays charged until nothing holds it
+        self.assertEqual(cache.release_group('boston'), 0)
+        self.assertEqual(cache.release_group('nyc'), surface_bytes(page))
+        self.assertEqual(cache.bytes_used, 0)
+
+    def test_related_surfaces_charged(self):
+        """Test that a surface's related copies (mirrors) are charged with it."""
+        mirrors = {}
+        cache = AssetCache(budget=10 * self.size, related=lambda s: [mirrors[s]] if s in mirrors else [])
+        surface = make_surface()
+        mirrors[surface] = make_surface()
+        cache.put(('sprite', 'a'), surface)
+        self.assertEqual(cache.bytes_used, 2 * self.size)
+
+    def test_evicts_least_recently_used(self):
+        """Test that going over budget drops the oldest untouched entry."""
+        cache = AssetCache(budget=2 * self.size)
+        cache.put('a', make_surface())
+        cache.put('b', make_surface())
+        cache.get('a')
+        cache.put('c', make_surface())
+
+        self.assertEqual(cache.keys(), ['a', 'c'])
+        self.assertLessEqual(cache.bytes_used, cache.budget)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_pinned_entries_survive(self):
+        """Test that pinned keys and pinned groups are never evicted."""
+        cache = AssetCache(budget=self.size)
+        with cache.grouped('nyc'):
+            cache.put('skyline', make_surface())
+        cache.pin_group('nyc')
+        cache.put('logo', make_surface())
+        cache.pin('logo')
+        cache.put('other', make_surface())
+
+        self.assertIn('skyline', cache)
+        self.assertIn('logo', cache)
+        self.assertGreater(cache.bytes_used, cache.budget)
+
+        # unpinning lets the cache get back under budget
+        cache.unpin('logo')
+        cache.unpin_group('nyc')
+        self.assertLessEqual(cache.bytes_used, cache.budget)
+
+    def test_release_group(self):
+        """Test that releasing a group drops its entries but keeps shared ones."""
+        cache = AssetCache(budget=10 * self.size)
+        with cache.grouped('boston'):
+            cache.put('harbor', make_surface())
+            cache.put('player', make_surface())
+        with cache.grouped('nyc'):
+            cache.get('player')
+
+        self.assertEqual(cache.release_group('boston'), self.size)
+        self.assertNotIn('harbor', cache)
+        self.assertIn('player', cache)
+        self.assertEqual(cache.keys('nyc'), ['player'])
+
+
+class TestAssetLoaderBudget(unittest.TestCase):
+    """Test cases for the asset loader staying within its cache budget."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def test_loader_stays_under_budget(self):
+        """Test that loading more than the budget drops old sprites, and reloads them on demand."""
+        sprite_bytes = surface_bytes(make_surface(40, 40)) * 2  # plus its mirror
+        loader = AssetLoader(baked=BakedAssets('missing'), budget=3 * sprite_bytes, archive=AssetArchive())
+        first = loader.load_sprite('enemies/pigeon.png', (40, 40))
+        for name in ('taxi', 'rat', 'cyclist', 'vendor'):
+            loader.load_sprite(f'enemies/{name}.png', (40, 40))
+
+        self.assertLessEqual(loader.cache.bytes_used, 3 * sprite_bytes)
+        self.assertNotIn(('sprite', 'enemies/pigeon.png', (40, 40)), loader.cache)
+        self.assertIsNot(loader.load_sprite('enemies/pigeon.png', (40, 40)), first)
+
+    def test_atlas_pages_counted_once(self):
+        """Test that packing a city's sprites charges the pages, not each sprite."""
+        loader = AssetLoader(baked=BakedAssets('missing'), archive=AssetArchive())
+        entries = [{'kind': 'sprite', 'path': f'enemies/{name}.png', 'size': (40, 40)}
+                   for name in ('pigeon', 'taxi', 'rat')]
+        atlas = loader.pack_atlas('test', entries)
+        pages = sum(surface_bytes(page) for page in atlas.pages)
+        self.assertEqual(loader.cache.bytes_used, pages)
+        self.assertIs(loader.pack_atlas('test', entries), atlas)
+
+
+
+class TestMirrors(unittest.TestCase):
+    """Test cases for the loader's weakly keyed mirror cache."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        self.loader = AssetLoader(baked=BakedAssets('missing'), archive=AssetArchive())
+
+    def test_mirror_made_once(self):
+        """Test that repeat calls return the same flipped surface."""
+        surface = make_surface(8, 4)
+        surface.fill((255, 0, 0), (0, 0, 1, 4))
+        mirrored = self.loader.get_mirrored(surface)
+
+        self.assertIs(self.loader.get_mirrored(surface), mirrored)
+        self.assertEqual(mirrored.get_at((7, 0)), surface.get_at((0, 0)))
+
+    def test_mirror_dropped_with_source(self):
+        """Test that a mirror entry goes away once its source surface is collected."""
+        surface = make_surface(8, 4)
+        self.loader.get_mirrored(surface)
+        self.assertEqual(len(self.loader.mirror_cache), 1)
+
+        del surface
+        gc.collect()
+        self.assertEqual(len(self.loader.mirror_cache), 0)
+
+    def test_loaded_sprite_mirror_dropped_on_eviction(self):
+        """Test that a sprite's mirror is freed when the cache lets go of the sprite."""
+        sprite = self.loader.load_sprite('enemies/pigeon.png', (40, 40))
+        self.assertIn(sprite, self.loader.mirror_cache)
+
+        self.loader.cache.clear()
+        del sprite
+        gc.collect()
+        self.assertEqual(len(self.loader.mirror_cache), 0)
+
+
+class TestCityGroups(unittest.TestCase):
+    """Test cases for gameplay pinning and releasing each city's assets."""
+
+    def test_switching_cities_releases_the_last(self):
+        """Test that entering a new city frees the previous city's assets but keeps shared ones."""
+        from src.game import Game
+        from src.utils.asset_loader import asset_loader
+
+        game = Game(headless=True)
+        gameplay = game.get_state('gameplay')
+        game.current_city = 'boston'
+        gameplay.enter_state()
+        boston_only = set(asset_loader.cache.keys('boston'))
+        self.assertIn('boston', asset_loader.cache.pinned_groups)
+
+        game.current_city = 'nyc'
+        gameplay.enter_state()
+        self.assertEqual(asset_loader.cache.keys('boston'), [])
+        self.assertEqual(asset_loader.cache.pinned_groups, {'nyc'})
+        nyc = set(asset_loader.cache.keys('nyc'))
+        self.assertTrue(boston_only & nyc)  # the player's frames are shared
+        for key in boston_only - nyc:
+            self.assertNotIn(key, asset_loader.cache)
+
+        gameplay.exit_state()
+        self.assertEqual(asset_loader.cache.pinned_groups, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the menu-time asset warmup.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.asset_archive import AssetArchive
+from src.utils.asset_loader import AssetLoader
+from src.utils.asset_warmup import AssetWarmup
+from src.utils.baked_assets import BakedAssets
+
+
+class TestAssetWarmup(unittest.TestCase):
+    """Test cases for warming up on a worker thread and by per-frame pumping."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Fresh loader with no baked or archived files, so everything gets generated."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.loader = AssetLoader(baked=BakedAssets('missing'), archive=AssetArchive())
+        self.loader.disk_cache.directory = self.temp_dir.name
+        self.warmup = AssetWarmup(self.loader, cities=['boston'])
+
+    def cache_key(self, entry):
+        if entry['kind'] == 'sprite':
+            return ('sprite', entry['path'], entry['size'])
+        elif entry['kind'] == 'animation':
+            return ('animation', entry['path'], entry['prefix'], entry['frames'], entry['size'])
+        return ('generated_background', 'boston', entry['size'])
+
+    def assert_warmed_up(self):
+        self.assertTrue(self.warmup.done)
+        self.assertEqual(self.warmup.progress, 1.0)
+        self.assertEqual(self.warmup.failed, [])
+        for entry in self.warmup.jobs:
+            self.assertIn(self.cache_key(entry), self.loader.cache)
+
+    def test_thread_fills_cache(self):
+        """Test that the worker thread runs every job into the loader's cache."""
+        self.warmup.start()
+        self.assertIsNotNone(self.warmup.thread)
+        self.warmup.thread.join(timeout=60)
+        self.assertFalse(self.warmup.thread.is_alive())
+        self.assert_warmed_up()
+
+    def test_pump_fills_cache_without_threads(self):
+        """Test that pumping each frame finishes the job where threads aren't available."""
+        with mock.patch('src.utils.asset_warmup.threads_available', return_value=False):
+            self.warmup.start()
+        self.assertIsNone(self.warmup.thread)
+
+        for _ in range(len(self.warmup.jobs)):
+            if self.warmup.done:
+                break
+            self.warmup.pump(budget_ms=0)  # still at least one job per call
+        self.assert_warmed_up()
+
+    def test_pump_converts_thread_output(self):
+        """Test that surfaces the thread loaded are converted on the main thread by pump()."""
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        pygame.display.set_mode((64, 64))
+
+        self.warmup.start()
+        self.warmup.thread.join(timeout=60)
+        key = ('generated_background', 'boston', (1280, 720))
+        unconverted = self.loader.cache.peek(key)
+        self.assertIn(key, self.loader.unconverted)
+
+        self.warmup.pump()
+        self.assertEqual(self.loader.unconverted, {})
+        converted = self.loader.cache.peek(key)
+        self.assertIsNot(converted, unconverted)
+        self.assertEqual(converted.get_size(), unconverted.get_size())
+        self.assertIs(self.loader.load_background('boston/layer_0.png', (1280, 720)), converted)
+
+    def test_racing_loads_share_one_copy(self):
+        """Test that when two loads of one key both miss, the second gets the first's surface."""
+        first = self.loader._store(('sprite', 'x.png', None), pygame.Surface((4, 4)))
+        second = self.loader._store(('sprite', 'x.png', None), pygame.Surface((4, 4)))
+        self.assertIs(second, first)
+        self.assertIs(self.loader.load_sprite('x.png'), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
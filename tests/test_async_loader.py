@@ -0,0 +1,110 @@
+"""
+Unit tests for cooperative batch asset loading.
+"""
+
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.asset_loader import AssetLoader
+from src.utils.asset_manifest import city_asset_manifest
+from src.utils.async_loader import load_assets
+from src.utils.baked_assets import BakedAssets
+
+
+class TestAsyncLoader(unittest.TestCase):
+    """Test cases for load_assets on both the threaded and cooperative paths."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Fresh loader with no baked files, so everything gets generated."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.loader = AssetLoader(baked=BakedAssets(self.temp_dir.name))
+        self.loader.disk_cache.directory = self.temp_dir.name
+        self.entries = [entry for entry in city_asset_manifest('nyc') if entry['kind'] != 'background']
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_cached(self, results):
+        self.assertEqual(len(results), len(self.entries))
+        for entry, result in zip(self.entries, results):
+            if entry['kind'] == 'sprite':
+                self.assertIs(self.loader.load_sprite(entry['path'], entry['size']), result)
+            else:
+                self.assertEqual(len(result), entry['frames'])
+
+    def test_cooperative_yields_between_items(self):
+        """Test that without threads every item hands control back to the loop."""
+        ticks = []
+        progress = []
+
+        async def main():
+            async def ticker():
+                while True:
+                    ticks.append(len(progress))
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(ticker())
+            results = await load_assets(self.entries, self.loader,
+                                        on_progress=lambda done, total: progress.append(done),
+                                        use_threads=False)
+            task.cancel()
+            return results
+
+        results = asyncio.run(main())
+        self.assert_cached(results)
+        self.assertEqual(progress, list(range(1, len(self.entries) + 1)))
+        # the ticker ran after each item, not just once at the end
+        self.assertGreaterEqual(len(set(ticks)), len(self.entries))
+
+    def test_thread_pool_fills_caches(self):
+        """Test that the threaded path loads the same batch into the caches."""
+        progress = []
+        results = asyncio.run(load_assets(self.entries, self.loader,
+                                          on_progress=lambda done, total: progress.append((done, total)),
+                                          use_threads=True))
+        self.assert_cached(results)
+        self.assertEqual(progress[-1], (len(self.entries), len(self.entries)))
+
+    def test_thread_pool_shares_duplicate_loads(self):
+        """Test that workers racing on the same entries all end up with one cached copy."""
+        results = asyncio.run(load_assets(self.entries * 3, self.loader, use_threads=True))
+        count = len(self.entries)
+        for i, entry in enumerate(self.entries):
+            self.assertIs(results[i], results[i + count])
+            self.assertIs(results[i], results[i + 2 * count])
+
+    def test_thread_pool_results_converted(self):
+        """Test that with a display up, threaded results come back converted on the loop."""
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        pygame.display.set_mode((64, 64))
+
+        entries = [entry for entry in city_asset_manifest('nyc') if entry['kind'] == 'background']
+        results = asyncio.run(load_assets(entries, self.loader, use_threads=True))
+        self.assertEqual(self.loader.unconverted, {})
+        for entry, result in zip(entries, results):
+            self.assertIs(self.loader.load_background(entry['path'], entry['size']), result)
+
+    def test_bad_entry_doesnt_stop_batch(self):
+        """Test that a failing entry comes back as None and the rest still load."""
+        bad = {'kind': 'unknown', 'path': 'nothing', 'size': (1, 1)}
+        results = asyncio.run(load_assets([bad] + self.entries, self.loader, use_threads=False))
+        self.assertIsNone(results[0])
+        self.assertTrue(all(result is not None for result in results[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
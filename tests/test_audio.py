@@ -0,0 +1,108 @@
+"""
+Unit tests for lazy, budgeted audio loading.
+"""
+
+import unittest
+import json
+import sys
+import os
+import tempfile
+import wave
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.utils.audio import AudioManager, sound_size
+
+
+def write_wav(path, seconds, rate=22050):
+    """Write a silent mono 16-bit WAV file."""
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(b'\0\0' * int(rate * seconds))
+
+
+class TestAudioManager(unittest.TestCase):
+    """Test cases for manifest-driven lazy decoding and the memory budget."""
+
+    def setUp(self):
+        """Write a few sounds and a manifest into a temp directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = self.temp_dir.name
+        os.makedirs(os.path.join(root, 'sfx'))
+        os.makedirs(os.path.join(root, 'ambient'))
+        for name in ('jump', 'collect', 'horn'):
+            write_wav(os.path.join(root, 'sfx', f'{name}.wav'), 0.5)
+        write_wav(os.path.join(root, 'ambient', 'traffic.wav'), 1.0)
+
+        self.manifest_path = os.path.join(root, 'audio.json')
+        with open(self.manifest_path, 'w') as f:
+            json.dump({
+                'music': {'nyc': 'music/nyc.ogg'},
+                'sfx': {name: f'sfx/{name}.wav' for name in ('jump', 'collect', 'horn', 'missing')},
+                'ambient': {'traffic': 'ambient/traffic.wav'},
+                'cities': {'nyc': {'music': 'nyc', 'sfx': ['jump', 'horn', 'missing'], 'ambient': ['traffic']}},
+            }, f)
+
+        self.audio = AudioManager(self.manifest_path, audio_dir=root)
+        if not self.audio.enabled:
+            self.skipTest('no audio device')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        pygame.mixer.quit()
+
+    def test_nothing_decoded_at_startup(self):
+        """Test that constructing the manager decodes no sounds."""
+        self.assertEqual(len(self.audio.sounds), 0)
+        self.assertEqual(self.audio.sounds.bytes_used, 0)
+
+    def test_decode_on_first_play(self):
+        """Test that a sound is decoded when first played and reused after."""
+        self.audio.play_sfx('jump')
+        sound = self.audio.sounds.get(('sfx', 'jump'))
+        self.assertIsNotNone(sound)
+        self.assertIs(self.audio.get_sound('sfx', 'jump'), sound)
+        self.assertEqual(len(self.audio.sounds), 1)
+
+    def test_missing_sound_is_noop(self):
+        """Test that manifest entries without a file play nothing and aren't retried."""
+        self.audio.play_sfx('missing')
+        self.audio.play_sfx('not_in_manifest')
+        self.assertIn(('sfx', 'missing'), self.audio.unavailable)
+        self.assertEqual(len(self.audio.sounds), 0)
+
+    def test_prefetch_city(self):
+        """Test that prefetching decodes exactly the city's listed sounds."""
+        self.assertEqual(self.audio.prefetch_city('nyc'), 3)
+        self.assertIn(('sfx', 'horn'), self.audio.sounds)
+        self.assertIn(('ambient', 'traffic'), self.audio.sounds)
+        self.assertNotIn(('sfx', 'collect'), self.audio.sounds)
+
+    def test_budget_evicts_least_recently_used(self):
+        """Test that going over budget drops the oldest unused sound."""
+        one = sound_size(self.audio.get_sound('sfx', 'jump'))
+        self.audio.sounds.budget = one * 2
+        self.audio.get_sound('sfx', 'collect')
+        self.audio.get_sound('sfx', 'jump')  # touch jump so collect is oldest
+        self.audio.get_sound('sfx', 'horn')
+
+        self.assertLessEqual(self.audio.sounds.bytes_used, one * 2)
+        self.assertIn(('sfx', 'jump'), self.audio.sounds)
+        self.assertIn(('sfx', 'horn'), self.audio.sounds)
+        self.assertNotIn(('sfx', 'collect'), self.audio.sounds)
+
+    def test_music_streams(self):
+        """Test that music tracks are only ever paths, never decoded sounds."""
+        self.audio.play_city_music('nyc')
+        self.assertTrue(all(isinstance(path, str) for path in self.audio.music.values()))
+        self.assertEqual(self.audio.sounds.sounds('music'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for offline asset baking and loading baked files.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.bake import Baker, bake
+from src.utils.asset_archive import AssetArchive
+from src.utils.asset_loader import AssetLoader
+from src.utils.baked_assets import BakedAssets, baked_key
+from src.utils.disk_cache import GENERATOR_SOURCE
+from src.utils import sprite_generator
+from config import PLAYER_WIDTH, PLAYER_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class TestBake(unittest.TestCase):
+    """Test cases for the bake command and the loader's baked lookup."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Bake one city into a temporary directory."""
+        pygame.init()
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.directory = cls.temp_dir.name
+        cls.archive_path = os.path.join(cls.directory, 'assets.pak')
+        cls.baked = bake(['nyc'], cls.directory, cls.archive_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def assert_same_pixels(self, a, b):
+        self.assertEqual(a.get_size(), b.get_size())
+        self.assertEqual(pygame.image.tobytes(a, 'RGBA'), pygame.image.tobytes(b, 'RGBA'))
+
+    def test_manifest_round_trip(self):
+        """Test that every recorded file exists and the manifest loads back."""
+        loaded = BakedAssets.load(self.directory)
+        self.assertEqual(loaded.files, self.baked.files)
+        self.assertIn(baked_key('background', 'nyc', (SCREEN_WIDTH, SCREEN_HEIGHT)), loaded)
+        self.assertIn(baked_key('sprite', 'enemies/rat/rat.png', (25, 15)), loaded)
+        for key in loaded.files:
+            self.assertTrue(os.path.exists(loaded.path(key)), key)
+
+    def test_stale_bake_ignored(self):
+        """Test that a bake from another generator version is not used."""
+        loaded = BakedAssets.load(self.directory, version='not-this-one')
+        self.assertEqual(len(loaded), 0)
+
+    def test_platform_renderer_change_invalidates(self):
+        """Test that editing Boston's platform drawing makes the bake stale too."""
+        with tempfile.TemporaryDirectory() as scratch:
+            renderer = os.path.join(scratch, 'boston.py')
+            with open(renderer, 'w') as f:
+                f.write('# render_platform v1\n')
+            with mock.patch('src.utils.baked_assets.BAKE_SOURCES', (GENERATOR_SOURCE, renderer)):
+                BakedAssets(scratch, {'key': 'file.png'}).save()
+                with open(renderer, 'w') as f:
+                    f.write('# render_platform v2\n')
+                self.assertEqual(len(BakedAssets.load(scratch)), 0)
+
+    def test_real_frames_not_baked(self):
+        """Test that a real frame under any of the loader's file names isn't shadowed by a baked one."""
+        with tempfile.TemporaryDirectory() as scratch:
+            sprites = os.path.join(scratch, 'sprites')
+            os.makedirs(os.path.join(sprites, 'player', 'run'))
+            pygame.image.save(pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT)), os.path.join(sprites, 'player', 'run', 'run_01.png'))
+            with mock.patch('src.bake.SPRITES_DIR', sprites), \
+                    mock.patch('src.utils.asset_loader.SPRITES_DIR', sprites):
+                baker = Baker(os.path.join(scratch, 'baked'))
+                baker.bake_entry({'kind': 'animation', 'path': 'player/run', 'prefix': 'run_', 'frames': 3,
+                                  'size': (PLAYER_WIDTH, PLAYER_HEIGHT), 'color': (255, 0, 255)})
+        self.assertNotIn(baked_key('animation', 'player/run/run_', (PLAYER_WIDTH, PLAYER_HEIGHT), 0), baker.baked)
+        self.assertIn(baked_key('animation', 'player/run/run_', (PLAYER_WIDTH, PLAYER_HEIGHT), 2), baker.baked)
+
+    def test_loader_skips_generators(self):
+        """Test that the loader serves baked files without running any generator."""
+        loader = AssetLoader(baked=BakedAssets.load(self.directory), archive=AssetArchive())
+        with mock.patch.object(loader, '_generate_sprite', side_effect=AssertionError), \
+                mock.patch.object(sprite_generator, 'draw_player_run', side_effect=AssertionError), \
+                mock.patch.object(sprite_generator, 'create_city_background', side_effect=AssertionError):
+            rat = loader.load_sprite('enemies/rat/rat.png', (25, 15))
+            frames = loader.load_animation_frames('player/run', 'run_', 6, (PLAYER_WIDTH, PLAYER_HEIGHT))
+            background = loader._generated_background('nyc', SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        self.assertEqual(rat.get_size(), (25, 15))
+        self.assertEqual(len(frames), 6)
+        self.assertEqual(background.get_size(), (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def test_baked_matches_generated(self):
+        """Test that baked sprites are pixel-identical to freshly generated ones."""
+        baked_loader = AssetLoader(baked=BakedAssets.load(self.directory), archive=AssetArchive())
+        plain_loader = AssetLoader(baked=BakedAssets(self.directory), archive=AssetArchive())
+        for path, size in (('enemies/rat/rat.png', (25, 15)), ('collectibles/pizza.png', (24, 24))):
+            self.assert_same_pixels(baked_loader.load_sprite(path, size), plain_loader.load_sprite(path, size))
+
+    def test_archive_matches_bake(self):
+        """Test that the archive holds every baked image with the same pixels."""
+        archive = AssetArchive.open(self.archive_path)
+        self.assertEqual(set(archive.entries), set(self.baked.files))
+        for key in (baked_key('sprite', 'enemies/rat/rat.png', (25, 15)),
+                    baked_key('background', 'nyc', (SCREEN_WIDTH, SCREEN_HEIGHT))):
+            self.assert_same_pixels(archive.surface(key), pygame.image.load(self.baked.path(key)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for Boston's cached platform surfaces.
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.levels.boston import BostonLevel
+from src.utils.asset_archive import AssetArchive
+from src.utils.asset_loader import AssetLoader
+from src.utils.baked_assets import BakedAssets
+
+
+class RecordingQueue:
+    """Stand-in render queue that just remembers what was submitted."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, image, x, y, layer):
+        self.submitted.append((image, x, y))
+
+
+class TestBostonPlatforms(unittest.TestCase):
+    """Test cases for drawing each platform look once and reusing it."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        self.loader = AssetLoader(baked=BakedAssets('missing'), archive=AssetArchive())
+        patcher = mock.patch('src.levels.boston.asset_loader', self.loader)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.level = BostonLevel(seed=1)
+        self.level.platform_data = [
+            {'rect': pygame.Rect(100, 400, 120, 16), 'type': 'rooftop'},
+            {'rect': pygame.Rect(300, 350, 120, 16), 'type': 'rooftop'},
+            {'rect': pygame.Rect(500, 300, 80, 16), 'type': 'rooftop'},
+        ]
+        self.screen = pygame.Surface((800, 600))
+
+    def test_same_size_platforms_share_a_surface(self):
+        """Test that platforms of one type and size are drawn from one cached surface."""
+        queue = RecordingQueue()
+        with mock.patch.object(BostonLevel, 'render_platform',
+                               wraps=BostonLevel.render_platform) as render:
+            self.level.draw_platforms(self.screen, 0, queue)
+            self.level.draw_platforms(self.screen, 0, queue)
+
+        # one render per distinct size, however many platforms or frames
+        self.assertEqual(render.call_count, 2)
+        first, second, third = [image for image, _, _ in queue.submitted[:3]]
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(third.get_size(), (80, 16))
+        self.assertEqual([image for image, _, _ in queue.submitted[3:]], [first, second, third])
+
+    def test_rooftop_look_depends_only_on_size(self):
+        """Test that rooftop tar spots are the same for every rooftop of one size."""
+        a = BostonLevel.render_platform('rooftop', 120, 16)
+        b = BostonLevel.render_platform('rooftop', 120, 16)
+        self.assertEqual(pygame.image.tobytes(a, 'RGB'), pygame.image.tobytes(b, 'RGB'))
+
+
+if __name__ == '__main__':
+    unittest.main()
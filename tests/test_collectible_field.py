@@ -0,0 +1,68 @@
+"""
+Unit tests for the array-backed collectible field.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.entities.collectible import Collectible, CollectibleField
+
+
+class TestCollectibleField(unittest.TestCase):
+    """Test cases for CollectibleField."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Create matching scalar and array-backed collectibles."""
+        positions = [(100, 500), (300, 450), (900, 500), (1500, 420)]
+        self.scalar = [Collectible(x, y, 'pizza') for x, y in positions]
+        self.field = CollectibleField([Collectible(x, y, 'pizza') for x, y in positions],
+                                      sector_width=640)
+
+    def test_bobbing_matches_scalar_update(self):
+        """Test that a batch update moves items exactly like Collectible.update."""
+        for _ in range(50):
+            for collectible in self.scalar:
+                collectible.store_previous_position()
+                collectible.update(16)
+            self.field.update()
+
+        for i, collectible in enumerate(self.scalar):
+            view = self.field.sync_view(i)
+            self.assertEqual(view.rect.y, collectible.rect.y)
+            self.assertEqual(view.prev_y, collectible.prev_y)
+            self.assertAlmostEqual(view.y, collectible.y)
+
+    def test_sleeping_sectors_do_not_bob(self):
+        """Test that items outside the awake sectors keep still."""
+        self.field.update(0, 0)
+        self.assertNotEqual(self.field.phase[0], 0)
+        self.assertEqual(self.field.phase[2], 0)
+
+    def test_overlapping_matches_colliderect(self):
+        """Test that pickup uses the same overlap rules as Rect.colliderect."""
+        for rect in (pygame.Rect(90, 480, 32, 48), pygame.Rect(124, 500, 10, 10),
+                     pygame.Rect(280, 400, 700, 120), pygame.Rect(0, 0, 50, 50)):
+            expected = [i for i, c in enumerate(self.field.views) if rect.colliderect(c.rect)]
+            self.assertEqual(self.field.overlapping(rect), expected)
+
+    def test_collect_updates_view(self):
+        """Test that collecting marks both the arrays and the view."""
+        points = self.field.views[1].collect()
+        self.assertEqual(points, self.field.views[1].value)
+        self.assertTrue(self.field.collected[1])
+        self.assertTrue(self.field.views[1].collected)
+        self.assertNotIn(1, self.field.overlapping(pygame.Rect(280, 400, 700, 120)))
+
+
+if __name__ == '__main__':
+    unittest.main()
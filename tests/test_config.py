@@ -27,6 +27,13 @@ class TestConfig(unittest.TestCase):
         self.assertGreater(FPS, 0)
         self.assertIsInstance(FPS, int)
 
+    def test_fixed_timestep(self):
+        """Test that the simulation tick settings are sane."""
+        self.assertGreater(SIMULATION_HZ, 0)
+        self.assertAlmostEqual(FIXED_TIMESTEP, 1000 / SIMULATION_HZ)
+        self.assertGreaterEqual(MAX_TICKS_PER_FRAME, 1)
+        self.assertGreater(MAX_FRAME_TIME, FIXED_TIMESTEP)
+
     def test_player_constants(self):
         """Test player configuration values."""
         self.assertGreater(PLAYER_WIDTH, 0)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the on-disk cache of generated surfaces.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.disk_cache import SurfaceDiskCache, generator_version
+
+
+def make_background(size=(40, 30)):
+    surface = pygame.Surface(size)
+    surface.fill((30, 60, 90))
+    pygame.draw.line(surface, (200, 180, 20), (0, 0), (size[0] - 1, size[1] - 1), 3)
+    return surface
+
+
+class TestSurfaceDiskCache(unittest.TestCase):
+    """Test cases for raw RGB round-trips and version invalidation."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = self.temp_dir.name
+
+    def test_round_trip(self):
+        """Test that a saved surface loads back with the same size and pixels."""
+        cache = SurfaceDiskCache(self.directory, version='v1')
+        surface = make_background()
+        cache.save('background_boston', (40, 30), surface)
+
+        loaded = cache.load('background_boston', (40, 30))
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.get_size(), (40, 30))
+        self.assertEqual(pygame.image.tobytes(loaded, 'RGB'), pygame.image.tobytes(surface, 'RGB'))
+
+    def test_missing_or_truncated_entry_is_a_miss(self):
+        """Test that absent and wrong-length files load as None."""
+        cache = SurfaceDiskCache(self.directory, version='v1')
+        self.assertIsNone(cache.load('sky', (40, 30)))
+
+        cache.save('sky', (40, 30), make_background())
+        with open(cache._path('sky', (40, 30)), 'r+b') as f:
+            f.truncate(100)
+        self.assertIsNone(cache.load('sky', (40, 30)))
+
+    def test_new_generator_version_invalidates(self):
+        """Test that entries from another generator hash miss and are replaced on save."""
+        old = SurfaceDiskCache(self.directory, version='v1')
+        old.save('sky', (40, 30), make_background())
+
+        new = SurfaceDiskCache(self.directory, version='v2')
+        self.assertIsNone(new.load('sky', (40, 30)))
+
+        new.save('sky', (40, 30), make_background())
+        self.assertIsNotNone(new.load('sky', (40, 30)))
+        self.assertIsNone(old.load('sky', (40, 30)))
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(new._path('sky', (40, 30)))])
+
+    def test_concurrent_saves(self):
+        """Test that threads saving one entry at once leave a single valid file behind."""
+        cache = SurfaceDiskCache(self.directory, version='v1')
+        surface = make_background()
+        threads = [threading.Thread(target=cache.save, args=('sky', (40, 30), surface)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(cache._path('sky', (40, 30)))])
+        loaded = cache.load('sky', (40, 30))
+        self.assertEqual(pygame.image.tobytes(loaded, 'RGB'), pygame.image.tobytes(surface, 'RGB'))
+
+    def test_generator_version_follows_source(self):
+        """Test that editing a generator source changes the version hash."""
+        source = os.path.join(self.directory, 'generator.py')
+        with open(source, 'w') as f:
+            f.write('# generator v1\n')
+        before = generator_version((source,))
+        self.assertEqual(before, generator_version((source,)))
+
+        with open(source, 'w') as f:
+            f.write('# generator v2\n')
+        self.assertNotEqual(before, generator_version((source,)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Unit tests for the batched enemy update kernels.
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.entities.enemies.cyclist import Cyclist
+from src.entities.enemies.vendor import Vendor
+from src.entities.enemies.pigeon import Pigeon
+from src.entities.enemies.rat import Rat
+from src.entities.enemies.flying_paper import FlyingPaper
+from src.entities.enemies.groups import ENEMY_GROUPS, platform_array
+from src.enemy_bench import run_crossover
+from src.levels.nyc import NYCLevel
+from src.utils.spatial_hash import SpatialHash
+from config import ENEMY_BATCH_MIN, FIXED_TIMESTEP
+
+
+class TestEnemyGroups(unittest.TestCase):
+    """Test that each batch kernel matches the scalar Enemy.update()."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Lay out a ground strip and a few ledges."""
+        rng = random.Random(5)
+        self.platforms = [pygame.Rect(0, 620, 4000, 100)]
+        for i in range(20):
+            self.platforms.append(pygame.Rect(i * 200, rng.randint(420, 600), rng.randint(60, 160), 15))
+        self.platform_index = SpatialHash(self.platforms)
+        self.platform_array = platform_array(self.platforms)
+
+    def assert_matches(self, make, count=30, ticks=400):
+        """Run the scalar and batched versions side by side and compare every tick."""
+        positions = random.Random(9)
+        spots = [(positions.randint(-50, 3900), positions.randint(200, 600)) for _ in range(count)]
+        shared_rng = random.Random(3)
+        scalar_rng = random.Random(3)
+        scalar = [make(x, y, scalar_rng) for x, y in spots]
+        batched = [make(x, y, shared_rng) for x, y in spots]
+        group = ENEMY_GROUPS[batched[0].enemy_type](batched, sector_width=640)
+
+        for _ in range(ticks):
+            for enemy in scalar:
+                if enemy.active:
+                    enemy.store_previous_position()
+                    enemy.update(FIXED_TIMESTEP, self.platform_index)
+            group.update(FIXED_TIMESTEP, group.awake(), self.platform_array)
+
+            for i, enemy in enumerate(scalar):
+                view = group.sync_view(i)
+                self.assertEqual(bool(group.active[i]), enemy.active)
+                self.assertEqual((view.rect.x, view.rect.y), (enemy.rect.x, enemy.rect.y))
+                self.assertEqual(view.facing_right, enemy.facing_right)
+
+    def test_walkers(self):
+        """Test cyclist and vendor patrol plus landing."""
+        self.assert_matches(lambda x, y, rng: Cyclist(x, y, patrol_distance=150))
+        self.assert_matches(lambda x, y, rng: Vendor(x, y))
+
+    def test_rats(self):
+        """Test rats turning on the shared RNG in the same order."""
+        self.assert_matches(lambda x, y, rng: Rat(x, y, rng=rng))
+
+    def test_pigeons(self):
+        """Test pigeon sine-wave flight."""
+        self.assert_matches(lambda x, y, rng: Pigeon(x, y, flight_height=80))
+
+    def test_flying_paper(self):
+        """Test wind drift, height bounces and blowing off the level."""
+        self.assert_matches(lambda x, y, rng: FlyingPaper(x, y, rng=rng), ticks=1200)
+
+    def test_sleeping_sectors(self):
+        """Test that only the requested sectors move."""
+        pigeons = [Pigeon(100, 300), Pigeon(2000, 300)]
+        group = ENEMY_GROUPS['pigeon'](pigeons, sector_width=640)
+        group.update(FIXED_TIMESTEP, group.awake(0, 1), self.platform_array)
+        self.assertNotEqual(group.x[0], 100)
+        self.assertEqual(group.x[1], 2000)
+
+    def test_defeat_reaches_group(self):
+        """Test that defeating a view stops its batched updates."""
+        rats = [Rat(100, 605), Rat(300, 605)]
+        group = ENEMY_GROUPS['rat'](rats)
+        rats[0].take_damage(1)
+        self.assertEqual(group.awake().tolist(), [1])
+
+
+class TestEnemyBatching(unittest.TestCase):
+    """Test cases for when a level hands a type to its batch kernel."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def test_shipped_populations_update_one_at_a_time(self):
+        """Test that NYC's 8 rats stay on the per-enemy path, below the measured crossover."""
+        level = NYCLevel(seed=1)
+        level.update(FIXED_TIMESTEP, camera_offset=0)
+        self.assertEqual(level.enemy_groups, [])
+        self.assertTrue(all(enemy.group is None for enemy in level.enemies))
+
+    def test_crowded_type_batches_in_level_update(self):
+        """Test that a type reaching ENEMY_BATCH_MIN moves through its kernel in Level.update()."""
+        level = NYCLevel(seed=1)
+        rats = [enemy for enemy in level.enemies if enemy.enemy_type == 'rat']
+        extra = [Rat(200 + i * 90, rats[0].y) for i in range(ENEMY_BATCH_MIN - len(rats))]
+        level.enemies.extend(extra)
+        level.build_sectors()
+        for _ in range(10):
+            level.update(FIXED_TIMESTEP, camera_offset=0)
+
+        self.assertEqual([type(group) for group in level.enemy_groups], [ENEMY_GROUPS['rat']])
+        group = level.enemy_groups[0]
+        self.assertEqual(len(group), ENEMY_BATCH_MIN)
+        self.assertNotEqual(group.x[group.views.index(extra[0])], 200)
+
+    def test_bench_reports_crossover(self):
+        """Test that the crossover bench times both paths for every size."""
+        results = run_crossover(types=('pigeon',), sizes=(2, 4), ticks=3, repeats=1)
+        timings = results['pigeon']['timings']
+        self.assertEqual([size for size, _, _ in timings], [2, 4])
+        self.assertTrue(all(scalar > 0 and batched > 0 for _, scalar, batched in timings))
+        self.assertIn(results['pigeon']['crossover'], (None, 2, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
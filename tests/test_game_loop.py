@@ -0,0 +1,61 @@
+"""
+Unit tests for the fixed-timestep game loop.
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.game import Game
+from config import FIXED_TIMESTEP, MAX_TICKS_PER_FRAME
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Test cases for Game.advance's tick accumulator."""
+
+    def setUp(self):
+        """Headless game with step() counted instead of run."""
+        self.game = Game(headless=True)
+        patcher = mock.patch.object(self.game, 'step')
+        self.step = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_short_frame_runs_no_tick(self):
+        """Test that less than a timestep of time just builds up."""
+        self.assertEqual(self.game.advance(FIXED_TIMESTEP / 2), 0)
+        self.step.assert_not_called()
+        self.assertAlmostEqual(self.game.render_alpha, 0.5)
+
+        self.assertEqual(self.game.advance(FIXED_TIMESTEP / 2), 1)
+        self.assertAlmostEqual(self.game.render_alpha, 0.0)
+
+    def test_catch_up_ticks(self):
+        """Test that a slow frame runs one tick per elapsed timestep, keeping the remainder."""
+        self.assertEqual(self.game.advance(FIXED_TIMESTEP * 3.25), 3)
+        self.assertEqual(self.step.call_count, 3)
+        self.assertAlmostEqual(self.game.render_alpha, 0.25)
+
+    def test_backlog_dropped_past_max_ticks(self):
+        """Test that a stall runs at most MAX_TICKS_PER_FRAME ticks and drops the rest."""
+        ticks = self.game.advance(FIXED_TIMESTEP * (MAX_TICKS_PER_FRAME + 4.5))
+        self.assertEqual(ticks, MAX_TICKS_PER_FRAME)
+        self.assertAlmostEqual(self.game.render_alpha, 0.5)
+        self.assertLess(self.game.accumulator, FIXED_TIMESTEP)
+
+        # the next normal frame isn't still paying for the stall
+        self.assertEqual(self.game.advance(FIXED_TIMESTEP * 0.75), 1)
+
+    def test_pending_transition_stops_ticks(self):
+        """Test that ticks stop once a state change is queued."""
+        def queue_transition():
+            self.game.pending_state = 'menu'
+        self.step.side_effect = queue_transition
+        self.assertEqual(self.game.advance(FIXED_TIMESTEP * 3), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
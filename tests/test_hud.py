@@ -0,0 +1,77 @@
+"""
+Unit tests for the composited gameplay HUD.
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.hud import HUD, draw_heart, HEARTS_X, HEARTS_Y, HEART_SPACING
+from src.player import Player
+from config import *
+
+
+class TestHUD(unittest.TestCase):
+    """Test cases for HUD redraws and compositing."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Create a HUD and a player."""
+        self.hud = HUD()
+        self.hud.reset('Boston')
+        self.player = Player(100, 400)
+
+    def test_unchanged_frame_redraws_nothing(self):
+        """Test that a second update with the same values leaves the layer alone."""
+        self.hud.update(self.player, LEVEL_WIDTH)
+        with mock.patch.object(self.hud, 'copy_in') as copy_in, \
+                mock.patch.object(pygame.draw, 'rect') as draw_rect:
+            self.hud.update(self.player, LEVEL_WIDTH)
+        copy_in.assert_not_called()
+        draw_rect.assert_not_called()
+
+    def test_only_changed_widget_redraws(self):
+        """Test that a score change redraws the score and nothing else."""
+        self.hud.update(self.player, LEVEL_WIDTH)
+        self.player.score = 250
+        with mock.patch.object(self.hud, 'copy_in', wraps=self.hud.copy_in) as copy_in:
+            self.hud.update(self.player, LEVEL_WIDTH)
+        self.assertEqual(copy_in.call_count, 1)
+        self.assertEqual(self.hud.score_text.value, 250)
+
+    def test_hearts_match_direct_drawing(self):
+        """Test that composited hearts look the same as drawing them straight on the screen."""
+        self.player.health = 2
+        self.hud.update(self.player, LEVEL_WIDTH)
+        composited = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.hud.draw(composited)
+
+        direct = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for i in range(PLAYER_MAX_HEALTH):
+            draw_heart(direct, RED if i < 2 else (100, 100, 100), HEARTS_X + i * HEART_SPACING, HEARTS_Y)
+
+        area = pygame.Rect(0, 0, HEARTS_X + PLAYER_MAX_HEALTH * HEART_SPACING, 40)
+        self.assertEqual(pygame.image.tobytes(composited.subsurface(area), 'RGB'),
+                         pygame.image.tobytes(direct.subsurface(area), 'RGB'))
+
+    def test_overlays_reuse_surface(self):
+        """Test that the pause and death overlays don't allocate a new surface each frame."""
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        dim = self.hud.dim
+        with mock.patch('pygame.Surface', side_effect=AssertionError):
+            self.hud.draw_pause_overlay(screen)
+            self.hud.draw_death_overlay(screen, 100)
+        self.assertIs(self.hud.dim, dim)
+
+
+if __name__ == '__main__':
+    unittest.main()
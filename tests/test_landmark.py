@@ -0,0 +1,106 @@
+"""
+Unit tests for the landmark celebration's dirty-rect drawing.
+"""
+
+import unittest
+import random
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class TestLandmarkDrawing(unittest.TestCase):
+    """Test cases for the dirty_rects / request_full_redraw contract."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        from src.game import Game
+        self.game = Game(headless=True)
+        self.state = self.game.get_state('landmark')
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def enter(self, city, timer):
+        self.game.current_city = city
+        self.state.enter_state()
+        self.state.request_full_redraw()
+        self.state.animation_timer = timer
+
+    def draw(self, screen=None, seed=0, ticks=0):
+        # confetti is random and the shine/flash follow the clock, so pin both
+        random.seed(seed)
+        with mock.patch('pygame.time.get_ticks', return_value=ticks):
+            self.state.draw(screen or self.screen)
+        return self.state.get_dirty_rects()
+
+    def test_full_redraw_reports_whole_screen(self):
+        """Test that the first draw and any draw after request_full_redraw() present everything."""
+        self.enter('boston', 1750)
+        self.assertIsNone(self.draw())
+        self.assertEqual(self.draw(), [])
+
+        self.state.request_full_redraw()
+        self.assertIsNone(self.state.get_dirty_rects())
+        self.assertIsNone(self.draw())
+        self.assertEqual(self.draw(), [])
+
+    def test_fade_dirties_only_its_text(self):
+        """Test that a fading text's rect is the only thing repainted while nothing else moves."""
+        self.enter('boston', 1750)
+        self.draw()
+
+        self.state.animation_timer += 16
+        landmark_rect = self.state.landmark_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.assertEqual(self.draw(), [landmark_rect])
+
+    def test_effects_repaint_last_and_current_positions(self):
+        """Test that moving effects dirty where they were and where they are now."""
+        self.enter('chicago', 3500)
+        self.draw(ticks=0)
+        old = list(self.state.effect_rects)
+
+        dirty = self.draw(ticks=100)
+        self.assertEqual(len(self.state.effect_rects), 1)
+        self.assertEqual(dirty, old + self.state.effect_rects)
+        self.assertLess(sum(rect.width * rect.height for rect in dirty), SCREEN_WIDTH * SCREEN_HEIGHT // 2)
+
+    def test_partial_frames_match_full_paint(self):
+        """Test that repainting only the dirty rects gives the same pixels as a full paint."""
+        for city in ('boston', 'chicago'):
+            with self.subTest(city=city):
+                self.enter(city, 3000)
+                self.draw(seed=1, ticks=0)
+                for frame in range(1, 4):
+                    self.state.animation_timer += 50
+                    self.assertIsNotNone(self.draw(seed=frame + 1, ticks=frame * 40))
+
+                full = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                self.state.request_full_redraw()
+                self.draw(full, seed=frame + 1, ticks=frame * 40)
+                self.assertEqual(pygame.image.tobytes(self.screen, 'RGB'), pygame.image.tobytes(full, 'RGB'))
+
+    def test_neon_flash_reuses_overlay(self):
+        """Test that NYC's flash presents the whole screen from one overlay built on entry."""
+        self.enter('nyc', 3000)
+        overlay = self.state.flash_overlay
+        self.assertIsNotNone(overlay)
+
+        self.assertIsNone(self.draw(ticks=100))
+        self.assertIsNone(self.draw(ticks=200))
+        self.assertIs(self.state.flash_overlay, overlay)
+
+        self.enter('nyc', 3000)
+        self.assertIs(self.state.flash_overlay, overlay)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for level layout files and their compiled cache.
+"""
+
+import unittest
+import json
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.levels.level_data import load_level_data, compile_level
+from config import CITIES, LEVELS_DIR, SCREEN_HEIGHT, LEVEL_WIDTH
+
+
+LAYOUT = {
+    'width': 2000,
+    'landmark': 1800,
+    'checkpoints': [500, 1000],
+    'platforms': [
+        {'type': 'ground', 'x': 0, 'y': 620, 'width': 2000, 'height': 100},
+        {'type': 'awning', 'x': 300, 'y': 500, 'width': 120, 'height': 12},
+    ],
+    'enemies': [
+        {'type': 'pigeon', 'x': 700, 'y': 300, 'flight_height': 80},
+        {'type': 'rat', 'x': 900, 'y': 605},
+    ],
+    'collectibles': [
+        {'type': 'teacup', 'x': 250, 'y': 570},
+    ],
+}
+
+# Constructor arguments the levels used before they moved to JSON (Chicago's
+# pigeon heights and papers were random, so they're checked against ranges)
+BOSTON_ENEMIES = (
+    [('cyclist', x, SCREEN_HEIGHT - 148, {'patrol_distance': 200}) for x in (500, 1100, 1900, 2600)]
+    + [('pigeon', x, y, {'flight_height': 80}) for x, y in ((700, 300), (1400, 250), (2200, 280), (3000, 260))]
+    + [('taxi', 100, SCREEN_HEIGHT - 148 + 8, {})]
+)
+NYC_ENEMIES = (
+    [('rat', 600 + i * 450, SCREEN_HEIGHT - 115, {}) for i in range(8)]
+    + [('vendor', x, SCREEN_HEIGHT - 115, {'patrol_distance': 150}) for x in (800, 1600, 2400)]
+    + [('taxi', 100, SCREEN_HEIGHT - 115 + 15, {})]
+)
+
+
+class TestLevelData(unittest.TestCase):
+    """Test cases for loading and compiling level layouts."""
+
+    def setUp(self):
+        """Write a small layout into a scratch levels directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.levels_dir = os.path.join(self.tmp.name, 'levels')
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+        os.makedirs(self.levels_dir)
+        self.write_layout(LAYOUT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_layout(self, layout):
+        with open(os.path.join(self.levels_dir, 'test.json'), 'w') as f:
+            json.dump(layout, f)
+
+    def load(self):
+        return load_level_data('test', self.levels_dir, self.cache_dir)
+
+    def test_compiled_matches_source(self):
+        """Test that a layout reads back the same from JSON and from the cache."""
+        first = self.load()
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, 'test.lvl')))
+        second = self.load()
+
+        for data in (first, second):
+            self.assertEqual(data.width, 2000)
+            self.assertEqual(data.landmark, 1800)
+            self.assertEqual(list(data.checkpoints), [500, 1000])
+            self.assertEqual(list(data.iter_platforms()),
+                             [('ground', 0, 620, 2000, 100), ('awning', 300, 500, 120, 12)])
+            self.assertEqual(list(data.iter_enemies()),
+                             [('pigeon', 700, 300, {'flight_height': 80}), ('rat', 900, 605, {})])
+            self.assertEqual(list(data.iter_collectibles()), [('teacup', 250, 570)])
+
+    def test_edited_source_recompiles(self):
+        """Test that changing the JSON file invalidates the compiled copy."""
+        self.load()
+        layout = dict(LAYOUT, width=3000, checkpoints=[100, 200, 300])
+        self.write_layout(layout)
+        data = self.load()
+        self.assertEqual(data.width, 3000)
+        self.assertEqual(list(data.checkpoints), [100, 200, 300])
+
+    def test_damaged_cache_is_ignored(self):
+        """Test that a truncated compiled file falls back to the JSON."""
+        self.load()
+        path = os.path.join(self.cache_dir, 'test.lvl')
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 8)
+        data = self.load()
+        self.assertEqual(len(list(data.iter_collectibles())), 1)
+
+    def test_city_levels_compile(self):
+        """Test that every shipped city layout compiles."""
+        for city in CITIES:
+            with open(os.path.join(LEVELS_DIR, f"{city}.json")) as f:
+                data = compile_level(json.load(f))
+            platforms = list(data.iter_platforms())
+            self.assertEqual(platforms[0][0], 'ground')
+            self.assertGreater(len(list(data.iter_enemies())), 0)
+            self.assertGreater(len(list(data.iter_collectibles())), 0)
+
+    def test_enemy_spawns_match_original_levels(self):
+        """Test that enemies spawn where the levels' construction code put them."""
+        self.assertEqual(list(load_level_data('boston').iter_enemies()), BOSTON_ENEMIES)
+        self.assertEqual(list(load_level_data('nyc').iter_enemies()), NYC_ENEMIES)
+
+        enemies = list(load_level_data('chicago').iter_enemies())
+        pigeons = [e for e in enemies if e[0] == 'pigeon']
+        papers = [e for e in enemies if e[0] == 'flying_paper']
+        self.assertEqual(len(enemies), 21)
+        self.assertEqual([x for _, x, _, _ in pigeons], [500 + i * 600 for i in range(6)])
+        for _, x, y, kwargs in pigeons:
+            self.assertTrue(150 <= y <= 250)
+            self.assertEqual(kwargs, {'flight_height': 100})
+        for _, x, y, _ in papers:
+            self.assertTrue(300 <= x <= LEVEL_WIDTH - 300)
+            self.assertTrue(150 <= y <= 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
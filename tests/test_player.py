@@ -97,5 +97,13 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(rect.height, self.player.height)
 
 
+    def test_player_draw(self):
+        """Test that the player draws itself (hearts are the HUD's job)."""
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.player.draw(screen)
+        self.assertNotEqual(pygame.transform.average_color(screen, self.player.rect)[:3], (0, 0, 0))
+        self.player.draw(screen, camera_offset=50, alpha=0.5)
+
+
 if __name__ == '__main__':
     unittest.main()
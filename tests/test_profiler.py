@@ -0,0 +1,57 @@
+"""
+Unit tests for the frame profiler.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.profiler import FrameProfiler, percentile
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for percentiles and the rolling window."""
+
+    def record(self, profiler, values, name='update'):
+        """Feed one frame per value with that many ms under a scope."""
+        for value in values:
+            profiler.current[name] = float(value)
+            profiler.end_frame()
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertEqual(percentile([], 0.95), 0.0)
+
+    def test_stats_cover_only_the_window(self):
+        """Test that frames older than the window drop out of the stats."""
+        profiler = FrameProfiler(enabled=True, window=10)
+        self.record(profiler, [1000] * 5 + list(range(1, 11)))
+        avg, p95, p99 = profiler.get_stats('update')
+        self.assertEqual(avg, 5.5)
+        self.assertEqual((p95, p99), (10, 10))
+        self.assertEqual(len(profiler.frames), 10)
+
+    def test_reset_applies_new_window(self):
+        """Test that changing window takes effect once reset() runs."""
+        profiler = FrameProfiler(enabled=True, window=4)
+        self.record(profiler, [1, 2, 3, 4])
+        profiler.window = 100
+        profiler.reset()
+        self.assertEqual(profiler.get_stats('update'), (0.0, 0.0, 0.0))
+
+        self.record(profiler, range(1, 101))
+        self.assertEqual(profiler.frames.maxlen, 100)
+        self.assertEqual(len(profiler.samples['update']), 100)
+        self.assertEqual(profiler.get_stats('update'), (50.5, 95, 99))
+
+
+if __name__ == '__main__':
+    unittest.main()
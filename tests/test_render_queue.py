@@ -0,0 +1,54 @@
+"""
+Unit tests for the batched render queue.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.render_queue import RenderQueue
+
+
+class TestRenderQueue(unittest.TestCase):
+    """Test cases for RenderQueue."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Create a small screen and a sprite."""
+        self.screen = pygame.Surface((200, 100))
+        self.sprite = pygame.Surface((20, 20))
+        self.sprite.fill((255, 0, 0))
+        self.queue = RenderQueue()
+        self.queue.begin(self.screen, camera_offset=1000)
+
+    def test_culls_offscreen(self):
+        """Test that sprites outside the camera view are dropped."""
+        self.assertTrue(self.queue.submit(self.sprite, 1050, 10))
+        self.assertTrue(self.queue.submit(self.sprite, 985, 10))  # partly visible
+        self.assertFalse(self.queue.submit(self.sprite, 980, 10))
+        self.assertFalse(self.queue.submit(self.sprite, 1200, 10))
+        self.assertFalse(self.queue.submit(self.sprite, 1050, 100))
+        self.assertEqual(len(self.queue.layers['entities']), 2)
+
+    def test_flush_draws_in_layer_order(self):
+        """Test that later layers end up on top and the queue empties."""
+        blue = pygame.Surface((20, 20))
+        blue.fill((0, 0, 255))
+        self.queue.submit(blue, 1050, 10, 'player')
+        self.queue.submit(self.sprite, 1050, 10, 'entities')
+        self.queue.flush(self.screen)
+
+        self.assertEqual(self.screen.get_at((55, 15))[:3], (0, 0, 255))
+        self.assertTrue(all(not items for items in self.queue.layers.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
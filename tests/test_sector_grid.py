@@ -0,0 +1,101 @@
+"""
+Unit tests for level sectors and sleeping far-away entities.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.sector_grid import SectorGrid
+from src.levels.boston import BostonLevel
+from config import FIXED_TIMESTEP
+
+
+class Thing:
+    """Bare entity with just a rect."""
+
+    def __init__(self, x):
+        self.rect = pygame.Rect(x, 0, 20, 20)
+
+
+def snapshot(enemy):
+    return (enemy.x, enemy.y, enemy.vel_x, enemy.vel_y, tuple(enemy.rect), enemy.prev_x, enemy.prev_y)
+
+
+class TestSectorGrid(unittest.TestCase):
+    """Test cases for bucketing and moving entities between sectors."""
+
+    def test_entities_between(self):
+        """Test that range queries return exactly the overlapping sectors' entities."""
+        things = [Thing(x) for x in (10, 100, 700, 1300, 5000)]
+        grid = SectorGrid(things, sector_width=640)
+        self.assertEqual(grid.entities_between(0, 639), things[:2])
+        self.assertEqual(grid.entities_between(600, 1300), things[:4])
+        self.assertEqual(grid.entities_between(2000, 3000), [])
+
+    def test_relocate(self):
+        """Test that an entity crossing a boundary moves to its new sector."""
+        thing = Thing(600)
+        grid = SectorGrid([thing], sector_width=640)
+        thing.rect.x = 650
+        grid.relocate(thing)
+        self.assertEqual(thing.sector, 1)
+        self.assertEqual(grid.entities_in(0, 0), [])
+        self.assertEqual(grid.entities_in(1, 1), [thing])
+
+
+class TestSectorSleep(unittest.TestCase):
+    """Test cases for enemies sleeping outside the active radius and resuming."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Boston level with the camera parked at the start."""
+        self.level = BostonLevel(seed=1)
+        self.level.update(FIXED_TIMESTEP, camera_offset=0)
+        left, right = self.level.get_active_range(0)
+        first, last = self.level.enemy_sectors.sector_range(left, right)
+        self.asleep = [e for e in self.level.enemies if not first <= e.sector <= last]
+        self.awake = [e for e in self.level.enemies if first <= e.sector <= last and e.enemy_type == 'cyclist']
+        self.assertTrue(self.asleep)
+        self.assertTrue(self.awake)
+
+    def run_ticks(self, ticks, camera_offset):
+        for _ in range(ticks):
+            self.level.update(FIXED_TIMESTEP, camera_offset)
+
+    def test_far_enemies_freeze(self):
+        """Test that enemies outside the active sectors don't change at all."""
+        before = [snapshot(enemy) for enemy in self.asleep]
+        awake_before = [snapshot(enemy) for enemy in self.awake]
+        self.run_ticks(120, camera_offset=0)
+
+        self.assertEqual([snapshot(enemy) for enemy in self.asleep], before)
+        self.assertNotEqual([snapshot(enemy) for enemy in self.awake], awake_before)
+
+    def test_resume_where_they_left_off(self):
+        """Test that a sleeping enemy picks up from its frozen state when the camera arrives."""
+        self.run_ticks(60, camera_offset=0)
+        enemy = max(self.asleep, key=lambda e: e.x)
+        frozen = snapshot(enemy)
+
+        self.run_ticks(1, camera_offset=int(enemy.x) - 400)
+        self.assertNotEqual(snapshot(enemy), frozen)
+        # interpolation starts from the frozen spot, not some stale one
+        self.assertEqual((enemy.prev_x, enemy.prev_y), tuple(frozen[4][:2]))
+        self.assertLessEqual(abs(enemy.rect.x - frozen[4][0]), 20)
+
+        # and the grid still files it under the right sector
+        self.assertEqual(enemy.sector, self.level.enemy_sectors.sector_of(enemy.rect.x))
+        self.assertIn(enemy, self.level.enemy_sectors.entities_in(enemy.sector, enemy.sector))
+
+
+if __name__ == '__main__':
+    unittest.main()
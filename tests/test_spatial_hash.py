@@ -0,0 +1,55 @@
+"""
+Unit tests for the platform spatial hash.
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Test cases for the SpatialHash broad phase."""
+
+    def setUp(self):
+        """Build an index over a scatter of platforms."""
+        rng = random.Random(1234)
+        self.rects = [pygame.Rect(0, 620, 4000, 100)]
+        for _ in range(60):
+            self.rects.append(pygame.Rect(rng.randint(0, 3900), rng.randint(200, 600),
+                                          rng.randint(40, 200), rng.randint(8, 20)))
+        self.index = SpatialHash(self.rects, cell_size=256)
+
+    def test_query_matches_brute_force(self):
+        """Test that every overlapping rect is returned as a candidate."""
+        rng = random.Random(99)
+        for _ in range(500):
+            probe = pygame.Rect(rng.randint(-50, 4000), rng.randint(0, 700), 32, 48)
+            candidates = self.index.query(probe)
+            expected = [r for r in self.rects if probe.colliderect(r)]
+            for rect in expected:
+                self.assertIn(rect, candidates)
+
+    def test_query_keeps_original_order(self):
+        """Test that candidates come back in platform list order."""
+        probe = pygame.Rect(0, 0, 4000, 720)
+        self.assertEqual(list(self.index.query(probe)), self.rects)
+
+    def test_query_far_away_is_empty(self):
+        """Test that a rect outside the level finds nothing."""
+        self.assertEqual(len(self.index.query(pygame.Rect(10000, 10000, 10, 10))), 0)
+
+    def test_iterates_like_a_list(self):
+        """Test that the index can stand in for the plain platform list."""
+        self.assertEqual(len(self.index), len(self.rects))
+        self.assertEqual(list(self.index), self.rects)
+
+
+if __name__ == '__main__':
+    unittest.main()
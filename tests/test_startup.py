@@ -0,0 +1,38 @@
+"""
+Unit tests for lazy state construction and deferred imports.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.startup_bench import run_startup
+
+
+class TestStartup(unittest.TestCase):
+    """Test cases for what the game loads before its first frame."""
+
+    def test_first_frame_skips_deferred_modules(self):
+        """Test that levels, enemies and the sprite generator aren't imported for the menu."""
+        results = run_startup(runs=1)
+        self.assertEqual(results['loaded'], [])
+        self.assertEqual(len(results['total']), 1)
+
+    def test_states_built_on_first_use(self):
+        """Test that only the menu exists until another state is entered."""
+        from src.game import Game
+
+        game = Game(headless=True)
+        self.assertEqual(list(game.states), ['menu'])
+
+        game.change_state('city_select')
+        self.assertIs(game.current_state, game.states['city_select'])
+        self.assertIs(game.get_state('city_select'), game.current_state)
+        self.assertNotIn('gameplay', game.states)
+
+
+if __name__ == '__main__':
+    unittest.main()
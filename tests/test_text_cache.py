@@ -0,0 +1,80 @@
+"""
+Unit tests for cached text rendering.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.text_cache import TextCache, TextWidget
+from config import WHITE, RED
+
+
+class TestTextCache(unittest.TestCase):
+    """Test cases for TextCache and TextWidget."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+        cls.font = pygame.font.Font(None, 30)
+
+    def test_repeat_render_hits(self):
+        """Test that the same string, font and color render once."""
+        cache = TextCache()
+        first = cache.render(self.font, 'Score: 10', WHITE)
+        second = cache.render(self.font, 'Score: 10', WHITE)
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # a different color is a different entry
+        self.assertIsNot(cache.render(self.font, 'Score: 10', RED), first)
+        self.assertEqual(cache.misses, 2)
+
+    def test_matches_font_render(self):
+        """Test that cached text looks exactly like Font.render output."""
+        cache = TextCache()
+        cached = cache.render(self.font, 'Boston', WHITE)
+        direct = self.font.render('Boston', True, WHITE)
+        self.assertEqual(pygame.image.tobytes(cached, 'RGBA'), pygame.image.tobytes(direct, 'RGBA'))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry goes first when full."""
+        cache = TextCache(max_entries=2)
+        a = cache.render(self.font, 'a')
+        cache.render(self.font, 'b')
+        cache.render(self.font, 'a')  # touch a, so b is now oldest
+        cache.render(self.font, 'c')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.render(self.font, 'a'), a)
+        misses = cache.misses
+        cache.render(self.font, 'b')
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_widget_renders_on_change(self):
+        """Test that a widget only re-renders when its value changes."""
+        widget = TextWidget(self.font, 'Score: {}')
+        self.assertTrue(widget.set(0))
+        surface = widget.surface
+        self.assertFalse(widget.set(0))
+        self.assertIs(widget.surface, surface)
+
+        self.assertTrue(widget.set(30))
+        self.assertIsNot(widget.surface, surface)
+
+    def test_widget_alpha_survives_rerender(self):
+        """Test that a widget keeps its fade when the text changes."""
+        widget = TextWidget(self.font)
+        widget.set('one')
+        widget.set_alpha(100)
+        widget.set('two')
+        self.assertEqual(widget.surface.get_alpha(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
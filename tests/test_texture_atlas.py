@@ -0,0 +1,83 @@
+"""
+Unit tests for the sprite texture atlas.
+"""
+
+import unittest
+import random
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.utils.texture_atlas import TextureAtlas
+
+
+class TestTextureAtlas(unittest.TestCase):
+    """Test cases for TextureAtlas packing and saving."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up pygame for all tests."""
+        pygame.init()
+
+    def setUp(self):
+        """Make a batch of random sprites with some translucent pixels."""
+        rng = random.Random(7)
+        self.sprites = {}
+        for i in range(60):
+            surface = pygame.Surface((rng.randint(8, 80), rng.randint(8, 60)), pygame.SRCALPHA)
+            surface.fill((rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), 255))
+            surface.set_at((0, 0), (200, 100, 50, 128))
+            surface.set_at((1, 0), (0, 0, 0, 0))
+            self.sprites[f"sprite_{i}"] = surface
+
+    def assert_same_pixels(self, a, b):
+        self.assertEqual(a.get_size(), b.get_size())
+        self.assertEqual(pygame.image.tobytes(a, 'RGBA'), pygame.image.tobytes(b, 'RGBA'))
+
+    def test_pack_keeps_pixels(self):
+        """Test that packed subsurfaces match the original sprites exactly."""
+        atlas = TextureAtlas((256, 256), padding=1)
+        packed = atlas.pack(self.sprites.items())
+        for key, surface in self.sprites.items():
+            self.assert_same_pixels(packed[key], surface)
+
+    def test_regions_do_not_overlap(self):
+        """Test that no two sprites share atlas pixels, spilling onto more pages as needed."""
+        atlas = TextureAtlas((256, 256), padding=1)
+        atlas.pack(self.sprites.items())
+        self.assertGreater(len(atlas.pages), 1)
+
+        regions = list(atlas.regions.values())
+        for i, (page_a, rect_a) in enumerate(regions):
+            self.assertTrue(atlas.pages[page_a].get_rect().contains(rect_a))
+            for page_b, rect_b in regions[i + 1:]:
+                if page_a == page_b:
+                    self.assertFalse(rect_a.colliderect(rect_b))
+
+    def test_finish_crops_last_page(self):
+        """Test that finishing trims unused space and keeps sprites intact."""
+        atlas = TextureAtlas((1024, 1024))
+        atlas.pack(list(self.sprites.items())[:5])
+        atlas.finish()
+        width, height = atlas.pages[0].get_size()
+        self.assertLess(width * height, 1024 * 1024)
+        for key, surface in list(self.sprites.items())[:5]:
+            self.assert_same_pixels(atlas.get(key), surface)
+
+    def test_save_and_load(self):
+        """Test that an atlas survives a trip through PNG pages and its index."""
+        atlas = TextureAtlas((256, 256))
+        atlas.pack(self.sprites.items())
+        with tempfile.TemporaryDirectory() as tmp:
+            atlas.save(tmp, 'test')
+            loaded = TextureAtlas.load(tmp, 'test')
+        for key, surface in self.sprites.items():
+            self.assert_same_pixels(loaded.get(key), surface)
+
+
+if __name__ == '__main__':
+    unittest.main()
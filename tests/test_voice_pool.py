@@ -0,0 +1,107 @@
+"""
+Unit tests for the prioritized sound effect voice pool.
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.utils.voice_pool import VoicePool
+
+SETTINGS = {
+    'coin': {'priority': 1, 'max_instances': 2, 'min_interval': 30},
+    'stomp': {'priority': 2, 'max_instances': 4, 'min_interval': 0},
+    'hurt': {'priority': 3, 'max_instances': 1, 'min_interval': 0},
+    'ambient_bird': {'priority': 0, 'max_instances': 4, 'min_interval': 0},
+}
+
+
+class TestVoicePool(unittest.TestCase):
+    """Test cases for voice limits, rate limiting and stealing."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the mixer and a long silent sound."""
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            raise unittest.SkipTest('no audio device')
+        frequency, size, channels = pygame.mixer.get_init()
+        cls.sound = pygame.mixer.Sound(buffer=b'\0' * (frequency * channels * abs(size) // 8 * 5))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.mixer.quit()
+
+    def setUp(self):
+        """Pool of four voices on a fake clock."""
+        self.now = 0.0
+        patcher = mock.patch.dict('src.utils.voice_pool.SFX_SETTINGS', SETTINGS, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = VoicePool(4, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.pool.stop_all()
+
+    def play(self, name, advance=100):
+        self.now += advance
+        return self.pool.play(name, self.sound)
+
+    def test_rate_limit(self):
+        """Test that a repeat inside min_interval is dropped."""
+        self.assertIsNotNone(self.play('coin'))
+        self.assertIsNone(self.play('coin', advance=10))
+        self.assertEqual(self.pool.stats['rate_limited'], 1)
+        self.assertIsNotNone(self.play('coin', advance=30))
+
+    def test_instance_cap_replaces_oldest(self):
+        """Test that going past max_instances restarts the oldest copy."""
+        first = self.play('coin')
+        self.play('coin')
+        third = self.play('coin')
+        self.assertIs(third, first)
+        self.assertEqual(len(self.pool.active('coin')), 2)
+
+    def test_never_more_than_pool_size(self):
+        """Test that a burst of sounds keeps at most the pool's voices busy."""
+        for _ in range(20):
+            self.play('stomp', advance=1)
+            self.play('ambient_bird', advance=1)
+        self.assertLessEqual(len(self.pool.active()), 4)
+
+    def test_steals_lowest_priority_oldest(self):
+        """Test that a full pool gives up its least important, oldest voice."""
+        low_old = self.play('ambient_bird')
+        self.play('ambient_bird')
+        self.play('stomp')
+        self.play('stomp')
+
+        channel = self.play('hurt')
+        self.assertIs(channel, low_old)
+        self.assertEqual(self.pool.stats['stolen'], 1)
+
+    def test_lower_priority_dropped_when_full(self):
+        """Test that a sound can't steal from voices that outrank it."""
+        for _ in range(4):
+            self.play('stomp')
+        self.assertIsNone(self.play('coin'))
+        self.assertEqual(self.pool.stats['dropped'], 1)
+
+    def test_reserved_channels(self):
+        """Test that Sound.play() doesn't land on the pool's channels."""
+        self.assertGreaterEqual(pygame.mixer.get_num_channels(), 5)
+        channel = self.sound.play()
+        self.assertNotIn(channel, [voice.channel for voice in self.pool.voices])
+        channel.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()